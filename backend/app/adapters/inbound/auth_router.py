@@ -10,6 +10,7 @@ from app.core.domain.user import UserCreate, UserResponse
 from app.core.use_cases.register_user import RegisterUser
 from app.core.use_cases.authenticate_user import AuthenticateUser
 from app.infrastructure.security.auth_service import AuthService
+from app.infrastructure.security.credential_cache import get_credential_cache
 from app.infrastructure.security.dependencies import CurrentUser
 from app.infrastructure.config.logging_config import get_logger
 
@@ -43,9 +44,9 @@ async def register(user_data: UserCreate):
     logger.info(f"Registration attempt for user: {user_data.username}")
 
     try:
-        from app.adapters.outbound.repositories.mongo_user_repository import MongoUserRepository
+        from app.adapters.outbound.repositories.user_repository_factory import get_user_repository
 
-        user_repository = MongoUserRepository()
+        user_repository = get_user_repository()
         register_use_case = RegisterUser(user_repository, auth_service)
 
         user = await register_use_case.execute(user_data)
@@ -91,10 +92,10 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     logger.info(f"Login attempt for user: {form_data.username}")
 
     try:
-        from app.adapters.outbound.repositories.mongo_user_repository import MongoUserRepository
+        from app.adapters.outbound.repositories.user_repository_factory import get_user_repository
 
-        user_repository = MongoUserRepository()
-        authenticate_use_case = AuthenticateUser(user_repository, auth_service)
+        user_repository = get_user_repository()
+        authenticate_use_case = AuthenticateUser(user_repository, auth_service, get_credential_cache())
 
         user, access_token = await authenticate_use_case.execute(
             form_data.username,
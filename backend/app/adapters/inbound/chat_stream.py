@@ -0,0 +1,56 @@
+# ABOUTME: Turns LangGraph chat event streams into coalesced reply text for streaming clients
+# ABOUTME: Shared by the WebSocket handler and the SSE endpoint so both batch tokens the same way
+
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, Union
+
+from app.adapters.outbound.llm_providers.caching_provider import LLM_CACHE_HIT_EVENT
+from app.infrastructure.streaming.token_batching import coalesce_tokens
+from app.langgraph.nodes.call_llm import SEMANTIC_CACHE_HIT_EVENT
+
+
+async def _split_reply_text(
+    events: AsyncIterable[Dict[str, Any]]
+) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
+    """Yield reply text as strings and every other event as-is."""
+    async for event in events:
+        event_type = event["event"]
+
+        # Model tokens
+        if event_type == "on_chat_model_stream":
+            content = event["data"]["chunk"].content
+            if content:
+                yield content
+
+        # Semantic cache hits skip the model, so the cached answer is the reply text
+        elif event_type == "on_custom_event" and event["name"] == SEMANTIC_CACHE_HIT_EVENT:
+            yield event["data"]
+
+        else:
+            # LLM cache hits skip the model too; the event itself is passed on
+            # so its tool calls can still be surfaced
+            if event_type == "on_custom_event" and event["name"] == LLM_CACHE_HIT_EVENT:
+                if event["data"].content:
+                    yield event["data"].content
+            yield event
+
+
+def reply_stream(
+    events: AsyncIterable[Dict[str, Any]],
+    flush_interval_ms: int
+) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
+    """
+    Coalesce the reply text of a graph event stream.
+
+    Text from model tokens and cache hits is joined into at most one chunk
+    per flush window (the first token is sent at once). Other events are
+    passed through in order, flushing any buffered text first, so tool
+    events never overtake the text before them.
+
+    Args:
+        events: Events from graph.astream_events(..., version="v2")
+        flush_interval_ms: Flush window in milliseconds; 0 sends every token
+
+    Returns:
+        Async generator of reply text (str) and pass-through events (dict)
+    """
+    return coalesce_tokens(_split_reply_text(events), flush_interval_ms)
@@ -1,12 +1,26 @@
-# ABOUTME: Message REST API endpoints for conversation message history
+# ABOUTME: Message REST API endpoints for conversation message history and streamed replies
 # ABOUTME: Retrieves messages from LangGraph checkpoints instead of message repository
 
-from typing import List
+from typing import AsyncGenerator, List
 from uuid import uuid4
-from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Query, Request
-from app.adapters.inbound.message_schemas import MessageResponse, MessageRole
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from langchain_core.messages import HumanMessage
+from langgraph.types import RunnableConfig
+from app.adapters.inbound.chat_stream import reply_stream
+from app.adapters.inbound.message_schemas import MessageResponse, MessageRole, SendMessageRequest
+from app.adapters.inbound.websocket_schemas import (
+    ServerTokenMessage,
+    ServerCompleteMessage,
+    ServerErrorMessage
+)
+from app.core.domain.clock import utcnow
+from app.core.domain.conversation import Conversation
+from app.core.domain.user import User
+from app.infrastructure.config.settings import settings
 from app.infrastructure.security.dependencies import CurrentUser
+from app.infrastructure.streaming.sse import sse_event
+from app.adapters.outbound.llm_providers.provider_factory import get_llm_provider
 from app.adapters.outbound.repositories.mongo_conversation_repository import MongoConversationRepository
 from app.langgraph.state_retrieval import get_conversation_messages
 from app.infrastructure.config.logging_config import get_logger
@@ -17,24 +31,21 @@ router = APIRouter(prefix="/api/conversations", tags=["messages"])
 
 conversation_repository = MongoConversationRepository()
 
+# LangChain message type -> API role; unknown types fall back to USER
+_MESSAGE_TYPE_TO_ROLE = {
+    "human": MessageRole.USER,
+    "ai": MessageRole.ASSISTANT,
+    "system": MessageRole.SYSTEM,
+}
 
-@router.get("/{conversation_id}/messages", response_model=List[MessageResponse])
-async def get_messages_endpoint(
-    conversation_id: str,
-    request: Request,
-    current_user: CurrentUser,
-    skip: int = Query(default=0, ge=0, description="Number of messages to skip"),
-    limit: int = Query(default=100, ge=1, le=500, description="Maximum number of messages to return")
-):
-    """
-    Get all messages for a specific conversation from LangGraph checkpoint.
 
-    Returns messages ordered by creation time (oldest first).
-    Only the conversation owner can access the messages.
-    Messages are retrieved from LangGraph checkpoint state.
+async def _get_owned_conversation(conversation_id: str, current_user: User) -> Conversation:
     """
-    logger.info(f"Getting messages for conversation {conversation_id} (skip={skip}, limit={limit})")
+    Fetch a conversation and verify the current user owns it.
 
+    Raises:
+        HTTPException: 404 if the conversation does not exist, 403 if owned by another user
+    """
     # Verify conversation ownership (authorization at App DB layer)
     conversation = await conversation_repository.get_by_id(conversation_id)
 
@@ -52,15 +63,36 @@ async def get_messages_endpoint(
             detail="Access denied"
         )
 
+    return conversation
+
+
+@router.get("/{conversation_id}/messages", response_model=List[MessageResponse])
+async def get_messages_endpoint(
+    conversation_id: str,
+    request: Request,
+    current_user: CurrentUser,
+    skip: int = Query(default=0, ge=0, description="Number of messages to skip"),
+    limit: int = Query(default=100, ge=1, le=500, description="Maximum number of messages to return")
+):
+    """
+    Get all messages for a specific conversation from LangGraph checkpoint.
+
+    Returns messages ordered by creation time (oldest first).
+    Only the conversation owner can access the messages.
+    Messages are retrieved from LangGraph checkpoint state.
+    """
+    logger.info(f"Getting messages for conversation {conversation_id} (skip={skip}, limit={limit})")
+
+    await _get_owned_conversation(conversation_id, current_user)
+
     # Get compiled graph from app state
     graph = request.app.state.chat_graph
 
     # Retrieve messages from LangGraph checkpoint
     base_messages = await get_conversation_messages(graph, conversation_id)
 
-    # Convert BaseMessage objects to MessageResponse format
     # Filter out internal execution details (tool calls/responses)
-    messages = []
+    visible_messages = []
     for msg in base_messages:
         # Skip tool messages (internal LangGraph execution details)
         if msg.type == "tool":
@@ -74,30 +106,93 @@ async def get_messages_endpoint(
             if has_tool_calls and not has_content:
                 continue
 
-        # Map LangChain message types to our MessageRole
-        if msg.type == "human":
-            role = MessageRole.USER
-        elif msg.type == "ai":
-            role = MessageRole.ASSISTANT
-        elif msg.type == "system":
-            role = MessageRole.SYSTEM
-        else:
-            role = MessageRole.USER  # Default fallback
-
-        messages.append(
-            MessageResponse(
-                id=str(uuid4()),  # Generate ID since BaseMessage doesn't have one
-                conversation_id=conversation_id,
-                role=role,
-                content=msg.content,
-                created_at=datetime.utcnow(),  # BaseMessage doesn't store timestamp
-                metadata=msg.additional_kwargs if hasattr(msg, 'additional_kwargs') else {}
-            )
-        )
+        visible_messages.append(msg)
 
-    # Apply pagination
-    paginated_messages = messages[skip:skip + limit]
+    # Apply pagination before building response objects for the page only
+    page = visible_messages[skip:skip + limit]
 
-    logger.info(f"Retrieved {len(paginated_messages)} messages (out of {len(messages)} total) for conversation {conversation_id}")
+    # Convert BaseMessage objects to MessageResponse format
+    # BaseMessage doesn't store a timestamp; stamp the whole batch once
+    retrieved_at = utcnow()
+    paginated_messages = [
+        MessageResponse(
+            id=str(uuid4()),  # Generate ID since BaseMessage doesn't have one
+            conversation_id=conversation_id,
+            # Map LangChain message types to our MessageRole
+            role=_MESSAGE_TYPE_TO_ROLE.get(msg.type, MessageRole.USER),
+            content=msg.content,
+            created_at=retrieved_at,
+            metadata=msg.additional_kwargs if hasattr(msg, 'additional_kwargs') else {}
+        ).model_dump()
+        for msg in page
+    ]
+
+    logger.info(f"Retrieved {len(paginated_messages)} messages (out of {len(visible_messages)} total) for conversation {conversation_id}")
+
+    # Already validated above; serialize directly instead of re-validating against response_model
+    return ORJSONResponse(paginated_messages)
+
+
+@router.post("/{conversation_id}/messages/stream")
+async def stream_message_endpoint(
+    conversation_id: str,
+    message: SendMessageRequest,
+    request: Request,
+    current_user: CurrentUser
+):
+    """
+    Send a message and stream the assistant reply as Server-Sent Events.
 
-    return paginated_messages
+    HTTP counterpart of the /ws/chat WebSocket: tokens are sent as soon as
+    the LLM produces them instead of after the full response. Each event
+    carries the same JSON as the WebSocket protocol (token, complete,
+    error). Messages are persisted by the LangGraph checkpointer.
+    """
+    conversation = await _get_owned_conversation(conversation_id, current_user)
+
+    graph = request.app.state.streaming_chat_graph
+    config = RunnableConfig(
+        configurable={
+            "thread_id": conversation.id,
+            "llm_provider": get_llm_provider(),
+            "user_id": current_user.id,
+            "semantic_cache": getattr(request.app.state, "semantic_cache", None)
+        }
+    )
+    input_data = {
+        "messages": [HumanMessage(content=message.content)],
+        "conversation_id": conversation.id,
+        "user_id": current_user.id
+    }
+
+    async def event_stream() -> AsyncGenerator[bytes, None]:
+        # Read from the graph's final state once the turn ends
+        message_id = "unknown"
+        try:
+            events = graph.astream_events(
+                input_data, config, version="v2", durability=settings.langgraph_durability
+            )
+            # One SSE frame per flush window rather than per token
+            async for event in reply_stream(events, settings.stream_flush_interval_ms):
+                if not isinstance(event, dict):
+                    yield sse_event(ServerTokenMessage(content=event).model_dump())
+                elif event["event"] == "on_chain_end" and not event.get("parent_ids"):
+                    # The root run's output is the checkpointed state; its last
+                    # message is the reply, with the id add_messages assigned
+                    output = event["data"].get("output")
+                    if isinstance(output, dict) and output.get("messages"):
+                        message_id = output["messages"][-1].id or message_id
+
+            yield sse_event(ServerCompleteMessage(
+                message_id=message_id,
+                conversation_id=conversation.id
+            ).model_dump())
+        except Exception as e:
+            logger.exception(f"Streaming reply failed for conversation {conversation.id}: {e}")
+            # Details stay in the log; they can include provider or database internals
+            yield sse_event(ServerErrorMessage(
+                message="Failed to generate response",
+                code="LLM_ERROR"
+            ).model_dump())
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
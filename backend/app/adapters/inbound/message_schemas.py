@@ -4,7 +4,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageRole(str, Enum):
@@ -25,8 +25,8 @@ class MessageResponse(BaseModel):
     created_at: datetime
     metadata: Optional[dict] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439013",
                 "conversation_id": "507f1f77bcf86cd799439012",
@@ -35,4 +35,11 @@ class MessageResponse(BaseModel):
                 "created_at": "2025-01-15T10:30:00",
                 "metadata": {"token_count": 8}
             }
-        }
+        },
+    )
+
+
+class SendMessageRequest(BaseModel):
+    """Request body for sending a message over the streaming endpoint."""
+
+    content: str = Field(..., min_length=1, description="User message content")
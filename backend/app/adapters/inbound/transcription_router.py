@@ -2,10 +2,13 @@
 # ABOUTME: Handles audio upload, validation, and transcription requests
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncGenerator, Optional
 from app.adapters.inbound.transcription_schemas import TranscriptionResponse
 from app.adapters.outbound.transcription.openai_whisper_service import OpenAIWhisperService
+from app.core.domain.user import User
 from app.infrastructure.security.dependencies import CurrentUser
+from app.infrastructure.streaming.sse import sse_event
 from app.infrastructure.validation.audio_validator import validate_audio_file
 from app.infrastructure.config.logging_config import get_logger
 
@@ -14,49 +17,46 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/api/transcribe", tags=["transcription"])
 
 
-@router.post("", response_model=TranscriptionResponse)
-async def transcribe_audio(
-    current_user: CurrentUser,
-    audio_file: UploadFile = File(...),
-    language: Optional[str] = Form(None),
-    conversation_id: Optional[str] = Form(None)
-):
+async def _verify_conversation_access(conversation_id: Optional[str], current_user: User) -> None:
     """
-    Transcribe audio file to text using OpenAI Whisper.
+    Verify the current user owns the conversation, if one was given.
 
-    Security:
-    - Requires JWT authentication
-    - Validates conversation ownership if conversation_id provided
-    - File size limited to 25MB
-
-    Supported formats: webm, wav, mp3, m4a, ogg
+    Raises:
+        HTTPException: 404 if the conversation does not exist, 403 if owned by another user
     """
-    logger.info(f"Transcription request from user {current_user.id}")
+    if not conversation_id:
+        return
+
+    from app.adapters.outbound.repositories.mongo_conversation_repository import MongoConversationRepository
+
+    repo = MongoConversationRepository()
+    conversation = await repo.get_by_id(conversation_id)
 
-    # Validate conversation ownership if provided
-    if conversation_id:
-        from app.adapters.outbound.repositories.mongo_conversation_repository import MongoConversationRepository
+    if not conversation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
 
-        repo = MongoConversationRepository()
-        conversation = await repo.get_by_id(conversation_id)
+    if conversation.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
 
-        if not conversation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Conversation not found"
-            )
 
-        if conversation.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied"
-            )
+async def _read_validated_audio(audio_file: UploadFile) -> bytes:
+    """
+    Validate the uploaded audio and return its content.
 
-    # Validate audio file
+    Raises:
+        HTTPException: 400 if the file is not acceptable audio
+    """
     try:
         logger.info(f"Validating audio file: {audio_file.filename}, content_type: {audio_file.content_type}")
         audio_content = await validate_audio_file(audio_file)
         logger.info(f"Audio file validated successfully, size: {len(audio_content)} bytes")
+        return audio_content
     except HTTPException as e:
         logger.error(f"Audio validation failed with HTTP exception: {e.detail}")
         raise
@@ -65,7 +65,30 @@ async def transcribe_audio(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid audio file: {str(e)}"
-        )
+        ) from e
+
+
+@router.post("", response_model=TranscriptionResponse)
+async def transcribe_audio(
+    current_user: CurrentUser,
+    audio_file: UploadFile = File(...),
+    language: Optional[str] = Form(None),
+    conversation_id: Optional[str] = Form(None)
+):
+    """
+    Transcribe audio file to text using OpenAI Whisper.
+
+    Security:
+    - Requires JWT authentication
+    - Validates conversation ownership if conversation_id provided
+    - File size limited to 25MB
+
+    Supported formats: webm, wav, mp3, m4a, ogg
+    """
+    logger.info(f"Transcription request from user {current_user.id}")
+
+    await _verify_conversation_access(conversation_id, current_user)
+    audio_content = await _read_validated_audio(audio_file)
 
     # Transcribe
     try:
@@ -83,10 +106,55 @@ async def transcribe_audio(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
-        )
+        ) from e
     except Exception as e:
-        logger.error(f"Transcription failed: {e}")
+        logger.exception(f"Transcription failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Transcription service unavailable"
-        )
+        ) from e
+
+
+@router.post("/stream")
+async def transcribe_audio_stream(
+    current_user: CurrentUser,
+    audio_file: UploadFile = File(...),
+    language: Optional[str] = Form(None),
+    conversation_id: Optional[str] = Form(None)
+):
+    """
+    Transcribe audio file to text, streaming partial transcripts as Server-Sent Events.
+
+    Emits {"type": "delta", "text": ...} events while the model transcribes,
+    then one {"type": "done", ...} event with the full transcript, or
+    {"type": "error", "message": ...} if transcription fails. Models that
+    cannot stream (whisper-1) emit only the final event.
+
+    Same security and format rules as POST /api/transcribe.
+    """
+    logger.info(f"Streaming transcription request from user {current_user.id}")
+
+    await _verify_conversation_access(conversation_id, current_user)
+    audio_content = await _read_validated_audio(audio_file)
+
+    try:
+        service = OpenAIWhisperService()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+
+    async def event_stream() -> AsyncGenerator[bytes, None]:
+        try:
+            async for event in service.transcribe_stream(
+                audio_content=audio_content,
+                filename=audio_file.filename,
+                language=language
+            ):
+                yield sse_event(event)
+        except Exception as e:
+            logger.exception(f"Streaming transcription failed: {e}")
+            yield sse_event({"type": "error", "message": "Transcription service unavailable"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -1,7 +1,7 @@
 # ABOUTME: Pydantic schemas for transcription API request/response
 # ABOUTME: Defines validation rules and OpenAPI documentation
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TranscriptionResponse(BaseModel):
@@ -11,11 +11,12 @@ class TranscriptionResponse(BaseModel):
     language: str = Field(..., description="Detected language (ISO 639-1)")
     duration: float = Field(..., description="Audio duration in seconds")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "Hello, how can I help you today?",
                 "language": "en",
                 "duration": 3.5
             }
-        }
+        },
+    )
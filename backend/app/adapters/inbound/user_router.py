@@ -4,14 +4,15 @@
 from fastapi import APIRouter, HTTPException, status
 from app.core.domain.user import UserUpdate, UserResponse
 from app.infrastructure.security.dependencies import CurrentUser
-from app.adapters.outbound.repositories.mongo_user_repository import MongoUserRepository
+from app.adapters.outbound.repositories.user_repository_factory import get_user_repository
+from app.infrastructure.security.credential_cache import get_credential_cache
 from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/user", tags=["user"])
 
-user_repository = MongoUserRepository()
+user_repository = get_user_repository()
 
 
 @router.get("/me", response_model=UserResponse)
@@ -65,6 +66,11 @@ async def update_current_user(
     try:
         updated_user = await user_repository.update(current_user.id, user_data)
 
+        # Make the next login check the password against the stored user again
+        credential_cache = get_credential_cache()
+        if credential_cache is not None:
+            await credential_cache.invalidate(current_user.id)
+
         logger.info(f"Updated user {current_user.id}")
 
         return UserResponse(
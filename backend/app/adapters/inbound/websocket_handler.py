@@ -20,6 +20,9 @@ from app.adapters.inbound.websocket_schemas import (
 from app.core.domain.user import User
 from app.core.ports.llm_provider import ILLMProvider
 from app.core.ports.conversation_repository import IConversationRepository
+from app.adapters.inbound.chat_stream import reply_stream
+from app.adapters.outbound.llm_providers.caching_provider import LLM_CACHE_HIT_EVENT
+from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -124,7 +127,8 @@ async def handle_websocket_chat(
                     configurable={
                         "thread_id": conversation.id,
                         "llm_provider": llm_provider,
-                        "user_id": user.id
+                        "user_id": user.id,
+                        "semantic_cache": getattr(websocket.app.state, "semantic_cache", None)
                     }
                 )
 
@@ -147,15 +151,28 @@ async def handle_websocket_chat(
                     # Track current tool call context (needed because tool events don't contain tool names)
                     current_tool_call = None
 
-                    async for event in graph.astream_events(input_data, config, version="v2"):
+                    # Checkpoints are written once when the turn finishes (LANGGRAPH_DURABILITY=exit)
+                    # instead of after every graph step
+                    events = graph.astream_events(
+                        input_data, config, version="v2", durability=settings.langgraph_durability
+                    )
+
+                    # Reply text (model tokens and cache hits) arrives coalesced into at most
+                    # one chunk per STREAM_FLUSH_INTERVAL_MS; other events pass through in order
+                    async for event in reply_stream(events, settings.stream_flush_interval_ms):
+                        if not isinstance(event, dict):
+                            token_msg = ServerTokenMessage(content=event)
+                            await manager.send_message(websocket, token_msg.model_dump())
+                            continue
+
                         event_type = event["event"]
 
-                        # Stream LLM tokens
-                        if event_type == "on_chat_model_stream":
-                            chunk = event["data"]["chunk"]
-                            if hasattr(chunk, 'content') and chunk.content:
-                                token_msg = ServerTokenMessage(content=chunk.content)
-                                await manager.send_message(websocket, token_msg.model_dump())
+                        # LLM cache hits skip the model, so keep the cached reply's tool call
+                        # for the tool events that follow (its text was already sent)
+                        if event_type == "on_custom_event" and event["name"] == LLM_CACHE_HIT_EVENT:
+                            cached = event["data"]
+                            if getattr(cached, "tool_calls", None):
+                                current_tool_call = cached.tool_calls[0]
 
                         # Cache tool call information before tool execution
                         elif event_type == "on_chat_model_end":
@@ -0,0 +1,49 @@
+# ABOUTME: Sentence-Transformers implementation of the embedder port
+# ABOUTME: Loads the embedding model once and encodes texts in batches off the event loop
+
+import asyncio
+from typing import List, Optional
+
+from app.core.ports.embedder import IEmbedder
+from app.infrastructure.config.settings import settings
+from app.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SentenceTransformerEmbedder(IEmbedder):
+    """Embedder backed by a locally loaded SentenceTransformer model."""
+
+    def __init__(self, model_name: Optional[str] = None):
+        """
+        Initialize the embedder.
+
+        Args:
+            model_name: Sentence-Transformers model name (defaults to CHROMA_EMBEDDING_MODEL)
+        """
+        self.model_name = model_name or settings.chroma_embedding_model
+        self._model = None
+
+    def _get_model(self):
+        """Load the model on first use and keep it for the life of the process."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+            logger.info(f"Loaded embedding model: {self.model_name}")
+        return self._model
+
+    def _encode(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """Encode texts synchronously as one batched tensor operation."""
+        vectors = self._get_model().encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return vectors.tolist()
+
+    async def embed_batch(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """Embed texts in a worker thread so encoding does not block the event loop."""
+        if not texts:
+            return []
+        return await asyncio.to_thread(self._encode, texts, batch_size)
@@ -1,12 +1,15 @@
 # ABOUTME: Anthropic (Claude) LLM provider implementation using LangChain
 # ABOUTME: Implements ILLMProvider port interface for Anthropic models
 
-from typing import List, AsyncGenerator, Callable, Any
+from typing import List, AsyncGenerator, Callable, Any, Optional
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import BaseMessage
 from langchain_core.language_models import BaseChatModel
 
-from app.core.ports.llm_provider import ILLMProvider
+from app.adapters.outbound.llm_providers.streaming import stream_content
+from app.adapters.outbound.llm_providers.tool_binding import ToolBindingCache
+from app.core.domain.token_usage import TokenUsage
+from app.core.ports.llm_provider import ILLMProvider, LLMError
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
 
@@ -38,9 +41,11 @@ class AnthropicProvider(ILLMProvider):
         self.model = ChatAnthropic(
             model=settings.anthropic_model,
             api_key=settings.anthropic_api_key,
-            temperature=0.7,
+            temperature=settings.llm_temperature,
             streaming=True
         )
+        # Bound models are reused across graph steps that bind the same tools
+        self._tool_bindings = ToolBindingCache()
         logger.info(f"Initialized Anthropic provider with model: {settings.anthropic_model}")
 
     async def generate(self, messages: List[BaseMessage]) -> BaseMessage:
@@ -54,35 +59,40 @@ class AnthropicProvider(ILLMProvider):
             Generated response as AIMessage (may include tool_calls)
 
         Raises:
-            Exception: If LLM generation fails
+            LLMError: If LLM generation fails
         """
         try:
             response = await self.model.ainvoke(messages)
             return response
         except Exception as e:
             logger.error(f"Anthropic generation failed: {e}")
-            raise Exception(f"Failed to generate response from Anthropic: {str(e)}")
-
-    async def stream(self, messages: List[BaseMessage]) -> AsyncGenerator[str, None]:
+            raise LLMError("Failed to generate response from Anthropic") from e
+
+    async def stream(
+        self,
+        messages: List[BaseMessage],
+        *,
+        on_usage: Optional[Callable[[TokenUsage], None]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream a response from Anthropic token-by-token.
 
         Args:
             messages: List of BaseMessage objects representing the conversation history
+            on_usage: Called with the token usage reported by the API once the stream ends
 
         Yields:
             Response tokens as they are generated
 
         Raises:
-            Exception: If LLM streaming fails
+            LLMError: If LLM streaming fails
         """
         try:
-            async for chunk in self.model.astream(messages):
-                if chunk.content:
-                    yield chunk.content
+            async for token in stream_content(self.model.astream(messages), on_usage):
+                yield token
         except Exception as e:
             logger.error(f"Anthropic streaming failed: {e}")
-            raise Exception(f"Failed to stream response from Anthropic: {str(e)}")
+            raise LLMError("Failed to stream response from Anthropic") from e
 
     async def get_model_name(self) -> str:
         """
@@ -104,10 +114,11 @@ class AnthropicProvider(ILLMProvider):
         Returns:
             A new AnthropicProvider instance with tools bound
         """
-        bound_model = self.model.bind_tools(tools, **kwargs)
+        bound_model = self._tool_bindings.bind(self.model, tools, kwargs)
         # Create a new instance with the bound model
         new_provider = AnthropicProvider.__new__(AnthropicProvider)
         new_provider.model = bound_model
+        new_provider._tool_bindings = ToolBindingCache()
         return new_provider
 
     def get_model(self) -> BaseChatModel:
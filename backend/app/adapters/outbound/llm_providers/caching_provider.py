@@ -0,0 +1,205 @@
+# ABOUTME: Caching decorator for LLM providers that short-circuits repeated prompts
+# ABOUTME: Keys responses on model, messages and bound tools; only caches deterministic models
+
+import contextlib
+import hashlib
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import adispatch_custom_event
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+
+from app.adapters.outbound.llm_providers.wire import messages_to_wire, to_wire
+from app.core.domain.token_usage import TokenUsage
+from app.core.ports.cache_backend import ICacheBackend
+from app.core.ports.llm_provider import ILLMProvider
+from app.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Custom stream event carrying a response served from the LLM cache; no model
+# events fire on a hit, so streaming handlers forward this message instead
+LLM_CACHE_HIT_EVENT = "llm_cache_hit"
+
+
+def _tool_name(tool: Any) -> str:
+    """Return a stable name for a bound tool (LangChain tool or plain callable)."""
+    return getattr(tool, "name", None) or getattr(tool, "__name__", None) or repr(tool)
+
+
+async def _dispatch_cache_hit(message: BaseMessage) -> None:
+    """Emit LLM_CACHE_HIT_EVENT to the enclosing graph run, if there is one."""
+    # RuntimeError: called outside a runnable (no parent run to attach the event to)
+    with contextlib.suppress(RuntimeError):
+        await adispatch_custom_event(LLM_CACHE_HIT_EVENT, message)
+
+
+class CachingLLMProvider(ILLMProvider):
+    """
+    LLM provider decorator that serves repeated prompts from a cache.
+
+    Wraps any ILLMProvider. The cache key is a blake2b hash of the model name,
+    the serialized message history, the bound tool names and bind options,
+    so a hit costs no network round-trip and no tokens. Responses are only
+    cached when the wrapped model is deterministic (temperature explicitly
+    0); for any other or unset temperature every call goes to the provider.
+    Cache hits from generate are announced with LLM_CACHE_HIT_EVENT so
+    streaming clients still receive the reply.
+    """
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        backend: ICacheBackend,
+        tool_names: Sequence[str] = (),
+        bind_options: Optional[Dict[str, Any]] = None,
+        cacheable: Optional[bool] = None,
+        stats: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize the caching decorator.
+
+        Args:
+            provider: Provider whose responses are cached
+            backend: Cache backend shared by every copy of this provider
+            tool_names: Names of tools bound to the provider (part of the key)
+            bind_options: Keyword arguments used when binding tools (part of the key)
+            cacheable: Override for whether responses may be cached; derived from
+                       the model temperature when omitted
+            stats: Shared hit/miss counters (created when omitted)
+        """
+        self.provider = provider
+        self.backend = backend
+        self.tool_names = tuple(sorted(tool_names))
+        self.bind_options = bind_options or {}
+        if cacheable is None:
+            temperature = getattr(provider.get_model(), "temperature", None)
+            # None means the provider default, which is not deterministic
+            cacheable = temperature == 0
+            if not cacheable:
+                logger.warning(
+                    f"LLM cache enabled but temperature is {temperature}; responses will not be cached"
+                )
+        self.cacheable = cacheable
+        self.stats = stats if stats is not None else {"hits": 0, "misses": 0}
+        self._key_prefix: Optional[bytes] = None
+
+    async def _cache_key(self, mode: str, messages: List[BaseMessage]) -> str:
+        """
+        Build the cache key for a request.
+
+        The model, tools and options never change for this instance, so
+        they are serialized once; per request only the history is
+        serialized, and the bytes are hashed without re-encoding.
+        """
+        if self._key_prefix is None:
+            self._key_prefix = to_wire({
+                "model": await self.provider.get_model_name(),
+                "tools": self.tool_names,
+                "options": self.bind_options,
+            })
+        digest = hashlib.blake2b(self._key_prefix, digest_size=32)
+        digest.update(mode.encode())
+        digest.update(messages_to_wire(messages))
+        return digest.hexdigest()
+
+    async def generate(self, messages: List[BaseMessage]) -> BaseMessage:
+        """
+        Generate a response, returning a cached copy for repeated prompts.
+
+        Args:
+            messages: List of BaseMessage objects representing the conversation history
+
+        Returns:
+            Generated (or cached) response message
+
+        Raises:
+            LLMError: If LLM generation fails
+        """
+        if not self.cacheable:
+            return await self.provider.generate(messages)
+
+        key = await self._cache_key("generate", messages)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            # Copy so graph state updates never touch the cached instance
+            response = cached.model_copy(deep=True)
+            await _dispatch_cache_hit(response)
+            return response
+
+        self.stats["misses"] += 1
+        response = await self.provider.generate(messages)
+        await self.backend.set(key, response.model_copy(deep=True))
+        return response
+
+    async def stream(
+        self,
+        messages: List[BaseMessage],
+        *,
+        on_usage: Optional[Callable[[TokenUsage], None]] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a response, replaying a cached response as a single chunk.
+
+        Args:
+            messages: List of BaseMessage objects representing the conversation history
+            on_usage: Called with the token usage reported by the API; not called for
+                      cached replays, which use no tokens
+
+        Yields:
+            Response tokens as they are generated, or the cached text at once
+
+        Raises:
+            LLMError: If LLM streaming fails
+        """
+        if not self.cacheable:
+            async for token in self.provider.stream(messages, on_usage=on_usage):
+                yield token
+            return
+
+        key = await self._cache_key("stream", messages)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            yield cached.content
+            return
+
+        self.stats["misses"] += 1
+        tokens = []
+        async for token in self.provider.stream(messages, on_usage=on_usage):
+            tokens.append(token)
+            yield token
+        # Only reached when the stream completed, so partial output is never cached
+        await self.backend.set(key, AIMessage(content="".join(tokens)))
+
+    async def get_model_name(self) -> str:
+        """Get the name of the wrapped provider's model."""
+        return await self.provider.get_model_name()
+
+    def bind_tools(self, tools: List[Callable], **kwargs: Any) -> "ILLMProvider":
+        """
+        Bind tools on the wrapped provider and keep caching the result.
+
+        The bound copy shares this provider's backend and counters, and folds
+        the tool names and bind options into its cache keys.
+
+        Args:
+            tools: List of callable tools to bind
+            **kwargs: Additional keyword arguments for binding
+
+        Returns:
+            A CachingLLMProvider around the tool-bound provider
+        """
+        return CachingLLMProvider(
+            self.provider.bind_tools(tools, **kwargs),
+            self.backend,
+            tool_names=[_tool_name(tool) for tool in tools],
+            bind_options=kwargs,
+            cacheable=self.cacheable,
+            stats=self.stats
+        )
+
+    def get_model(self) -> BaseChatModel:
+        """Get the wrapped provider's underlying LangChain model."""
+        return self.provider.get_model()
@@ -1,12 +1,15 @@
 # ABOUTME: Google Gemini LLM provider implementation using LangChain
 # ABOUTME: Implements ILLMProvider port interface for Google Gemini models with native BaseMessage support
 
-from typing import List, AsyncGenerator, Callable, Any
+from typing import List, AsyncGenerator, Callable, Any, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import BaseMessage
 from langchain_core.language_models import BaseChatModel
 
-from app.core.ports.llm_provider import ILLMProvider
+from app.adapters.outbound.llm_providers.streaming import stream_content
+from app.adapters.outbound.llm_providers.tool_binding import ToolBindingCache
+from app.core.domain.token_usage import TokenUsage
+from app.core.ports.llm_provider import ILLMProvider, LLMError
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
 
@@ -39,9 +42,11 @@ class GeminiProvider(ILLMProvider):
         self.model = ChatGoogleGenerativeAI(
             model=settings.google_model,
             google_api_key=settings.google_api_key,
-            temperature=0.7,
+            temperature=settings.llm_temperature,
             streaming=True
         )
+        # Bound models are reused across graph steps that bind the same tools
+        self._tool_bindings = ToolBindingCache()
         logger.info(f"Initialized Gemini provider with model: {settings.google_model}")
 
     async def generate(self, messages: List[BaseMessage]) -> BaseMessage:
@@ -55,35 +60,40 @@ class GeminiProvider(ILLMProvider):
             Generated response as AIMessage (may include tool_calls)
 
         Raises:
-            Exception: If LLM generation fails
+            LLMError: If LLM generation fails
         """
         try:
             response = await self.model.ainvoke(messages)
             return response
         except Exception as e:
             logger.error(f"Gemini generation failed: {e}")
-            raise Exception(f"Failed to generate response from Gemini: {str(e)}")
-
-    async def stream(self, messages: List[BaseMessage]) -> AsyncGenerator[str, None]:
+            raise LLMError("Failed to generate response from Gemini") from e
+
+    async def stream(
+        self,
+        messages: List[BaseMessage],
+        *,
+        on_usage: Optional[Callable[[TokenUsage], None]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream a response from Gemini token-by-token.
 
         Args:
             messages: List of BaseMessage objects representing the conversation history
+            on_usage: Called with the token usage reported by the API once the stream ends
 
         Yields:
             Response tokens as they are generated
 
         Raises:
-            Exception: If LLM streaming fails
+            LLMError: If LLM streaming fails
         """
         try:
-            async for chunk in self.model.astream(messages):
-                if chunk.content:
-                    yield chunk.content
+            async for token in stream_content(self.model.astream(messages), on_usage):
+                yield token
         except Exception as e:
             logger.error(f"Gemini streaming failed: {e}")
-            raise Exception(f"Failed to stream response from Gemini: {str(e)}")
+            raise LLMError("Failed to stream response from Gemini") from e
 
     async def get_model_name(self) -> str:
         """
@@ -105,10 +115,11 @@ class GeminiProvider(ILLMProvider):
         Returns:
             A new GeminiProvider instance with tools bound
         """
-        bound_model = self.model.bind_tools(tools, **kwargs)
+        bound_model = self._tool_bindings.bind(self.model, tools, kwargs)
         # Create a new instance with the bound model
         new_provider = GeminiProvider.__new__(GeminiProvider)
         new_provider.model = bound_model
+        new_provider._tool_bindings = ToolBindingCache()
         return new_provider
 
     def get_model(self) -> BaseChatModel:
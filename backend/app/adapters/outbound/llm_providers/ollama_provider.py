@@ -1,12 +1,15 @@
 # ABOUTME: Ollama LLM provider implementation using LangChain
 # ABOUTME: Implements ILLMProvider port interface for local Ollama models with native BaseMessage support
 
-from typing import List, AsyncGenerator, Callable, Any
+from typing import List, AsyncGenerator, Callable, Any, Optional
 from langchain_community.chat_models import ChatOllama
 from langchain_core.messages import BaseMessage
 from langchain_core.language_models import BaseChatModel
 
-from app.core.ports.llm_provider import ILLMProvider
+from app.adapters.outbound.llm_providers.streaming import stream_content
+from app.adapters.outbound.llm_providers.tool_binding import ToolBindingCache
+from app.core.domain.token_usage import TokenUsage
+from app.core.ports.llm_provider import ILLMProvider, LLMError
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
 
@@ -39,8 +42,10 @@ class OllamaProvider(ILLMProvider):
         self.model = ChatOllama(
             model=settings.ollama_model,
             base_url=settings.ollama_base_url,
-            temperature=0.7
+            temperature=settings.llm_temperature
         )
+        # Bound models are reused across graph steps that bind the same tools
+        self._tool_bindings = ToolBindingCache()
         logger.info(f"Initialized Ollama provider with model: {settings.ollama_model} at {settings.ollama_base_url}")
 
     async def generate(self, messages: List[BaseMessage]) -> BaseMessage:
@@ -54,35 +59,40 @@ class OllamaProvider(ILLMProvider):
             Generated response as AIMessage (may include tool_calls)
 
         Raises:
-            Exception: If LLM generation fails
+            LLMError: If LLM generation fails
         """
         try:
             response = await self.model.ainvoke(messages)
             return response
         except Exception as e:
             logger.error(f"Ollama generation failed: {e}")
-            raise Exception(f"Failed to generate response from Ollama: {str(e)}")
-
-    async def stream(self, messages: List[BaseMessage]) -> AsyncGenerator[str, None]:
+            raise LLMError("Failed to generate response from Ollama") from e
+
+    async def stream(
+        self,
+        messages: List[BaseMessage],
+        *,
+        on_usage: Optional[Callable[[TokenUsage], None]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream a response from Ollama token-by-token.
 
         Args:
             messages: List of BaseMessage objects representing the conversation history
+            on_usage: Called with the token usage reported by the API once the stream ends
 
         Yields:
             Response tokens as they are generated
 
         Raises:
-            Exception: If LLM streaming fails
+            LLMError: If LLM streaming fails
         """
         try:
-            async for chunk in self.model.astream(messages):
-                if chunk.content:
-                    yield chunk.content
+            async for token in stream_content(self.model.astream(messages), on_usage):
+                yield token
         except Exception as e:
             logger.error(f"Ollama streaming failed: {e}")
-            raise Exception(f"Failed to stream response from Ollama: {str(e)}")
+            raise LLMError("Failed to stream response from Ollama") from e
 
     async def get_model_name(self) -> str:
         """
@@ -104,10 +114,11 @@ class OllamaProvider(ILLMProvider):
         Returns:
             A new OllamaProvider instance with tools bound
         """
-        bound_model = self.model.bind_tools(tools, **kwargs)
+        bound_model = self._tool_bindings.bind(self.model, tools, kwargs)
         # Create a new instance with the bound model
         new_provider = OllamaProvider.__new__(OllamaProvider)
         new_provider.model = bound_model
+        new_provider._tool_bindings = ToolBindingCache()
         return new_provider
 
     def get_model(self) -> BaseChatModel:
@@ -1,6 +1,11 @@
 # ABOUTME: LLM provider factory for creating provider instances based on configuration
 # ABOUTME: Selects appropriate provider (OpenAI, Anthropic, Gemini, Ollama) based on settings
 
+import importlib
+from functools import lru_cache
+from typing import Callable, Dict
+
+from app.core.ports.cache_backend import ICacheBackend
 from app.core.ports.llm_provider import ILLMProvider
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
@@ -8,6 +13,32 @@ from app.infrastructure.config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _lazy(module_path: str, class_name: str) -> Callable[[], ILLMProvider]:
+    """
+    Build a provider constructor that imports its class on first use.
+
+    Keeps provider SDKs out of the import path until they are selected,
+    and caches the resolved class so later calls skip the import machinery.
+    """
+    provider_class = None
+
+    def create() -> ILLMProvider:
+        nonlocal provider_class
+        if provider_class is None:
+            provider_class = getattr(importlib.import_module(module_path), class_name)
+        return provider_class()
+
+    return create
+
+
+_PROVIDERS: Dict[str, Callable[[], ILLMProvider]] = {
+    "openai": _lazy("app.adapters.outbound.llm_providers.openai_provider", "OpenAIProvider"),
+    "anthropic": _lazy("app.adapters.outbound.llm_providers.anthropic_provider", "AnthropicProvider"),
+    "gemini": _lazy("app.adapters.outbound.llm_providers.gemini_provider", "GeminiProvider"),
+    "ollama": _lazy("app.adapters.outbound.llm_providers.ollama_provider", "OllamaProvider"),
+}
+
+
 class LLMProviderFactory:
     """
     Factory for creating LLM provider instances.
@@ -31,27 +62,25 @@ class LLMProviderFactory:
 
         logger.info(f"Creating LLM provider: {provider_name}")
 
-        if provider_name == "openai":
-            from app.adapters.outbound.llm_providers.openai_provider import OpenAIProvider
-            return OpenAIProvider()
+        create = _PROVIDERS.get(provider_name)
+        if create is None:
+            raise ValueError(
+                f"Unsupported LLM provider: {provider_name}. "
+                f"Supported providers: {', '.join(_PROVIDERS)}"
+            )
 
-        elif provider_name == "anthropic":
-            from app.adapters.outbound.llm_providers.anthropic_provider import AnthropicProvider
-            return AnthropicProvider()
+        return create()
 
-        elif provider_name == "gemini":
-            from app.adapters.outbound.llm_providers.gemini_provider import GeminiProvider
-            return GeminiProvider()
 
-        elif provider_name == "ollama":
-            from app.adapters.outbound.llm_providers.ollama_provider import OllamaProvider
-            return OllamaProvider()
+@lru_cache(maxsize=1)
+def _get_response_cache() -> ICacheBackend:
+    """Return the process-wide LLM response cache, creating it on first use."""
+    from app.infrastructure.cache.in_memory_cache import InMemoryCacheBackend
 
-        else:
-            raise ValueError(
-                f"Unsupported LLM provider: {provider_name}. "
-                f"Supported providers: openai, anthropic, gemini, ollama"
-            )
+    return InMemoryCacheBackend(
+        max_size=settings.llm_cache_max_size,
+        ttl_seconds=settings.llm_cache_ttl_seconds
+    )
 
 
 def get_llm_provider() -> ILLMProvider:
@@ -59,9 +88,15 @@ def get_llm_provider() -> ILLMProvider:
     Get the configured LLM provider instance.
 
     This is a convenience function that uses the factory to create
-    a provider instance.
+    a provider instance. When LLM_CACHE_ENABLED is set, the provider is
+    wrapped so repeated deterministic prompts are served from a cache
+    shared by every provider instance in the process.
 
     Returns:
         ILLMProvider instance
     """
-    return LLMProviderFactory.create_provider()
+    provider = LLMProviderFactory.create_provider()
+    if settings.llm_cache_enabled:
+        from app.adapters.outbound.llm_providers.caching_provider import CachingLLMProvider
+        provider = CachingLLMProvider(provider, _get_response_cache())
+    return provider
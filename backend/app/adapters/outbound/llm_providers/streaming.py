@@ -0,0 +1,36 @@
+# ABOUTME: Shared streaming helper for LLM provider adapters
+# ABOUTME: Extracts text from LangChain chunks and reports token usage at stream end
+
+from typing import AsyncGenerator, AsyncIterable, Callable, Optional
+
+from langchain_core.messages import BaseMessageChunk
+
+from app.core.domain.token_usage import TokenUsage
+
+
+async def stream_content(
+    chunks: AsyncIterable[BaseMessageChunk],
+    on_usage: Optional[Callable[[TokenUsage], None]] = None
+) -> AsyncGenerator[str, None]:
+    """
+    Yield the text of each chunk and report the stream's token usage.
+
+    Providers send usage on one (or a few) chunks; they are summed with
+    LangChain's chunk addition and reported once the stream completes.
+
+    Args:
+        chunks: Chunks from a LangChain chat model's astream
+        on_usage: Called with the total usage when the provider reports any
+
+    Yields:
+        Non-empty chunk content
+    """
+    usage_chunk = None
+    async for chunk in chunks:
+        if chunk.content:
+            yield chunk.content
+        if on_usage is not None and chunk.usage_metadata:
+            usage_chunk = chunk if usage_chunk is None else usage_chunk + chunk
+
+    if usage_chunk is not None:
+        on_usage(TokenUsage.from_message(usage_chunk))
@@ -0,0 +1,46 @@
+# ABOUTME: Memoizes LangChain tool binding for LLM provider adapters
+# ABOUTME: Reuses the bound model when the same tools and options are bound again
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+from langchain_core.language_models import BaseChatModel
+
+
+class ToolBindingCache:
+    """
+    Small LRU of tool-bound models for one provider.
+
+    The chat graph binds the same tools on every LLM step, and LangChain
+    rebuilds every tool's JSON schema each time. Entries are keyed on the
+    identity of the tools plus the bind options; each entry holds the
+    tools themselves so their ids cannot be reused while cached.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def bind(self, model: BaseChatModel, tools: List[Callable], kwargs: Dict[str, Any]) -> Any:
+        """
+        Return model.bind_tools(tools, **kwargs), reusing a previous result when possible.
+
+        Options that are not hashable (e.g. a dict tool_choice) are bound
+        without caching.
+        """
+        try:
+            key = (tuple(id(tool) for tool in tools), frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return model.bind_tools(tools, **kwargs)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        bound_model = model.bind_tools(tools, **kwargs)
+        self._entries[key] = (tuple(tools), bound_model)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return bound_model
@@ -0,0 +1,30 @@
+# ABOUTME: Canonical byte serialization of a conversation for hashing and caching
+# ABOUTME: Serializes messages once with orjson so cache layers can hash the bytes directly
+
+from typing import Any, List
+
+import orjson
+from langchain_core.messages import BaseMessage, messages_to_dict
+
+_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def to_wire(value: Any) -> bytes:
+    """Serialize a JSON-like value deterministically (sorted keys, unknown types as str)."""
+    return orjson.dumps(value, default=str, option=_OPTIONS)
+
+
+def messages_to_wire(messages: List[BaseMessage]) -> bytes:
+    """
+    Serialize a message history to canonical JSON bytes.
+
+    Equal histories always produce equal bytes, so the result can be
+    hashed directly as a cache key.
+
+    Args:
+        messages: Conversation history
+
+    Returns:
+        UTF-8 JSON bytes with sorted keys
+    """
+    return to_wire(messages_to_dict(messages))
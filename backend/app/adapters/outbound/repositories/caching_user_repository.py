@@ -0,0 +1,120 @@
+# ABOUTME: Caching decorator for user repositories serving hot lookups from memory
+# ABOUTME: Caches users by id, email and username and invalidates all three on writes
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.domain.user import User, UserCreate, UserSummary, UserUpdate
+from app.core.ports.cache_backend import ICacheBackend
+from app.core.ports.user_repository import IUserRepository
+
+
+class CachingUserRepository(IUserRepository):
+    """
+    User repository decorator that serves repeated lookups from a cache.
+
+    Wraps any IUserRepository. Users found by id, email or username are
+    cached under all three keys, so the lookup done on every authenticated
+    request and the login lookups are usually a cache hit. Misses are not
+    cached, which keeps uniqueness checks exact. Updates and deletes drop
+    every key of the affected user.
+    """
+
+    def __init__(self, repository: IUserRepository, backend: ICacheBackend):
+        """
+        Initialize the caching decorator.
+
+        Args:
+            repository: Repository whose reads are cached
+            backend: Cache backend holding the users
+        """
+        self.repository = repository
+        self.backend = backend
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _keys(user: User) -> Tuple[str, str, str]:
+        """Return every cache key a user is stored under."""
+        return f"id:{user.id}", f"email:{user.email}", f"username:{user.username}"
+
+    async def _remember(self, user: User) -> None:
+        """Cache a user under all of its keys."""
+        for key in self._keys(user):
+            await self.backend.set(key, user)
+
+    async def _forget(self, user: Optional[User]) -> None:
+        """Drop every cached key of a user."""
+        if user is None:
+            return
+        for key in self._keys(user):
+            await self.backend.delete(key)
+
+    async def _cached(self, key: str, load: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        """Return a cached user, loading it at most once per key on concurrent misses."""
+        user = await self.backend.get(key)
+        if user is not None:
+            return user
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                user = await self.backend.get(key)
+                if user is None:
+                    user = await load()
+                    if user is not None:
+                        await self._remember(user)
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+        return user
+
+    async def create(self, user_data: UserCreate, hashed_password: str) -> User:
+        """Create a new user."""
+        return await self.repository.create(user_data, hashed_password)
+
+    async def create_many(self, users: List[Tuple[UserCreate, str]]) -> List[User]:
+        """Create several users in a single batch."""
+        return await self.repository.create_many(users)
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Retrieve a user by ID, served from the cache when possible."""
+        return await self._cached(f"id:{user_id}", lambda: self.repository.get_by_id(user_id))
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Retrieve a user by email address, served from the cache when possible."""
+        return await self._cached(f"email:{email}", lambda: self.repository.get_by_email(email))
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Retrieve a user by username, served from the cache when possible."""
+        return await self._cached(f"username:{username}", lambda: self.repository.get_by_username(username))
+
+    async def get_by_email_or_username(self, identifier: str) -> Optional[User]:
+        """Retrieve a user by email address or username, served from the cache when possible."""
+        user = await self.backend.get(f"username:{identifier}")
+        if user is not None:
+            return user
+        return await self._cached(
+            f"email:{identifier}", lambda: self.repository.get_by_email_or_username(identifier)
+        )
+
+    async def update(self, user_id: str, user_data: UserUpdate) -> Optional[User]:
+        """Update user information and drop the user's old and new cache keys."""
+        # Read the stored user, not the cache: the id entry may have been
+        # evicted while the email and username entries are still cached
+        previous = await self.repository.get_by_id(user_id)
+        user = await self.repository.update(user_id, user_data)
+        await self._forget(previous)
+        await self._forget(user)
+        return user
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete a user and drop all of its cache keys."""
+        user = await self.get_by_id(user_id)
+        deleted = await self.repository.delete(user_id)
+        await self._forget(user)
+        return deleted
+
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserSummary]:
+        """List users with pagination (not cached)."""
+        return await self.repository.list_users(skip, limit)
@@ -2,11 +2,21 @@
 # ABOUTME: Handles conversation data persistence using Beanie ODM
 
 from typing import Optional, List
-from datetime import datetime
+from beanie import PydanticObjectId, UpdateResponse
+from pymongo import ReturnDocument
 
 from app.core.domain.conversation import Conversation, ConversationCreate, ConversationUpdate
 from app.core.ports.conversation_repository import IConversationRepository
-from app.adapters.outbound.repositories.mongo_models import ConversationDocument
+from app.adapters.outbound.repositories.mongo_models import ConversationDocument, _now
+
+# Fields needed to build a Conversation; keeps list payloads small
+_LIST_PROJECTION = {
+    "user_id": 1,
+    "title": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "message_count": 1,
+}
 
 
 class MongoConversationRepository(IConversationRepository):
@@ -18,8 +28,8 @@ class MongoConversationRepository(IConversationRepository):
     """
 
     def _to_domain(self, doc: ConversationDocument) -> Conversation:
-        """Convert MongoDB document to domain model."""
-        return Conversation(
+        """Convert a validated MongoDB document to domain model without re-validation."""
+        return Conversation.model_construct(
             id=str(doc.id),
             user_id=doc.user_id,
             title=doc.title,
@@ -28,6 +38,17 @@ class MongoConversationRepository(IConversationRepository):
             message_count=getattr(doc, 'message_count', None)
         )
 
+    def _raw_to_domain(self, raw: dict) -> Conversation:
+        """Convert a raw MongoDB document to domain model without re-validation."""
+        return Conversation.model_construct(
+            id=str(raw["_id"]),
+            user_id=raw["user_id"],
+            title=raw.get("title", "New Conversation"),
+            created_at=raw["created_at"],
+            updated_at=raw["updated_at"],
+            message_count=raw.get("message_count")
+        )
+
     async def create(self, user_id: str, conversation_data: ConversationCreate) -> Conversation:
         """
         Create a new conversation.
@@ -64,11 +85,14 @@ class MongoConversationRepository(IConversationRepository):
         Returns:
             List of conversation entities ordered by updated_at descending
         """
-        docs = await ConversationDocument.find(
-            ConversationDocument.user_id == user_id
-        ).sort(-ConversationDocument.updated_at).skip(skip).limit(limit).to_list()
+        # Read-only listing: query the driver directly and skip Beanie document
+        # hydration, since these rows are never saved back
+        cursor = ConversationDocument.get_pymongo_collection().find(
+            {"user_id": user_id},
+            projection=_LIST_PROJECTION
+        ).sort("updated_at", -1).skip(skip).limit(limit)
 
-        return [self._to_domain(doc) for doc in docs]
+        return [self._raw_to_domain(raw) async for raw in cursor]
 
     async def update(self, conversation_id: str, conversation_data: ConversationUpdate) -> Optional[Conversation]:
         """
@@ -81,18 +105,21 @@ class MongoConversationRepository(IConversationRepository):
         Returns:
             Updated conversation entity if found, None otherwise
         """
-        doc = await ConversationDocument.get(conversation_id)
-        if not doc:
-            return None
-
         update_dict = conversation_data.model_dump(exclude_unset=True)
-        if update_dict:
-            update_dict["updated_at"] = datetime.utcnow()
-            for key, value in update_dict.items():
-                setattr(doc, key, value)
-            await doc.save()
+        if not update_dict:
+            return await self.get_by_id(conversation_id)
 
-        return self._to_domain(doc)
+        update_dict["updated_at"] = _now()
+
+        # Apply the patch and read back the result in a single round-trip
+        doc = await ConversationDocument.find_one(
+            {"_id": PydanticObjectId(conversation_id)}
+        ).update(
+            {"$set": update_dict},
+            response_type=UpdateResponse.NEW_DOCUMENT
+        )
+
+        return self._to_domain(doc) if doc else None
 
     async def delete(self, conversation_id: str) -> bool:
         """
@@ -104,12 +131,11 @@ class MongoConversationRepository(IConversationRepository):
         Returns:
             True if conversation was deleted, False if not found
         """
-        doc = await ConversationDocument.get(conversation_id)
-        if not doc:
-            return False
-
-        await doc.delete()
-        return True
+        # Delete by id directly; the result says whether anything matched
+        result = await ConversationDocument.find_one(
+            {"_id": PydanticObjectId(conversation_id)}
+        ).delete()
+        return bool(result and result.deleted_count)
 
     async def increment_message_count(self, conversation_id: str, count: int = 1) -> Optional[Conversation]:
         """
@@ -125,15 +151,20 @@ class MongoConversationRepository(IConversationRepository):
         Returns:
             Updated conversation entity if found, None otherwise
         """
-        doc = await ConversationDocument.get(conversation_id)
-        if not doc:
-            return None
-
-        # Only update if message_count field exists (for backward compatibility)
-        if hasattr(doc, 'message_count') and doc.message_count is not None:
-            doc.message_count += count
-
-        doc.updated_at = datetime.utcnow()
-        await doc.save()
+        # One atomic update that returns the new document (the Mongo analogue of
+        # UPDATE ... RETURNING) instead of a read followed by a full save.
+        # Only conversations that still track message_count get it incremented.
+        raw = await ConversationDocument.get_pymongo_collection().find_one_and_update(
+            {"_id": PydanticObjectId(conversation_id)},
+            [{"$set": {
+                "updated_at": _now(),
+                "message_count": {"$cond": [
+                    {"$isNumber": "$message_count"},
+                    {"$add": ["$message_count", count]},
+                    "$message_count"
+                ]}
+            }}],
+            return_document=ReturnDocument.AFTER
+        )
 
-        return self._to_domain(doc)
+        return self._raw_to_domain(raw) if raw else None
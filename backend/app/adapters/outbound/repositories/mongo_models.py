@@ -1,10 +1,16 @@
 # ABOUTME: Beanie ODM document models for MongoDB collections
 # ABOUTME: Maps domain models to MongoDB documents with indexes and validation
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from beanie import Document, Indexed
-from pydantic import EmailStr, Field
+from beanie import Document, PydanticObjectId
+from pymongo import IndexModel
+from pydantic import BaseModel, EmailStr, Field
+
+
+def _now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
 
 
 class UserDocument(Document):
@@ -14,22 +20,40 @@ class UserDocument(Document):
     Maps the User domain model to MongoDB collection with indexes.
     """
 
-    email: Indexed(EmailStr, unique=True)
-    username: Indexed(str, unique=True)
+    email: EmailStr
+    username: str
     hashed_password: str
     full_name: Optional[str] = None
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
 
     class Settings:
         name = "users"
+        # Unique indexes turn auth lookups into B-tree seeks and reject duplicates on insert
         indexes = [
-            "email",
-            "username",
+            IndexModel("email", unique=True),
+            IndexModel("username", unique=True),
         ]
 
 
+class UserListProjection(BaseModel):
+    """
+    Projection of UserDocument used for user listings.
+
+    Leaves out hashed_password so credentials never travel over the wire
+    for list views.
+    """
+
+    id: PydanticObjectId = Field(alias="_id")
+    email: EmailStr
+    username: str
+    full_name: Optional[str] = None
+    is_active: bool = True
+    created_at: datetime
+    updated_at: datetime
+
+
 class ConversationDocument(Document):
     """
     Conversation MongoDB document model.
@@ -37,14 +61,15 @@ class ConversationDocument(Document):
     Maps the Conversation domain model to MongoDB collection with indexes.
     """
 
-    user_id: Indexed(str)
+    user_id: str
     title: str = "New Conversation"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
 
     class Settings:
         name = "conversations"
+        # Serves find(user_id=...).sort(-updated_at) listings from the index in order;
+        # its user_id prefix also covers plain ownership lookups
         indexes = [
-            "user_id",
-            [("user_id", 1), ("updated_at", -1)],
+            IndexModel([("user_id", 1), ("updated_at", -1)]),
         ]
@@ -1,12 +1,21 @@
 # ABOUTME: MongoDB implementation of IUserRepository port interface
 # ABOUTME: Handles user data persistence using Beanie ODM
 
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
 
-from app.core.domain.user import User, UserCreate, UserUpdate
+from beanie import PydanticObjectId, UpdateResponse
+from beanie.operators import Or
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.core.domain.user import User, UserCreate, UserSummary, UserUpdate
 from app.core.ports.user_repository import IUserRepository
-from app.adapters.outbound.repositories.mongo_models import UserDocument
+from app.adapters.outbound.repositories.mongo_models import UserDocument, UserListProjection, _now
+from app.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# MongoDB error code for unique index violations
+_DUPLICATE_KEY_CODE = 11000
 
 
 class MongoUserRepository(IUserRepository):
@@ -18,8 +27,8 @@ class MongoUserRepository(IUserRepository):
     """
 
     def _to_domain(self, doc: UserDocument) -> User:
-        """Convert MongoDB document to domain model."""
-        return User(
+        """Convert MongoDB document to domain model without re-validation."""
+        return User.model_construct(
             id=str(doc.id),
             email=doc.email,
             username=doc.username,
@@ -30,6 +39,25 @@ class MongoUserRepository(IUserRepository):
             updated_at=doc.updated_at
         )
 
+    def _to_summary(self, doc: UserListProjection) -> UserSummary:
+        """Convert a listing projection to a user summary without re-validation."""
+        return UserSummary.model_construct(
+            id=str(doc.id),
+            email=doc.email,
+            username=doc.username,
+            full_name=doc.full_name,
+            is_active=doc.is_active,
+            created_at=doc.created_at,
+            updated_at=doc.updated_at
+        )
+
+    def _duplicate_error(self, error: DuplicateKeyError, user_data: UserCreate) -> ValueError:
+        """Translate a unique index violation into the domain duplicate-user error."""
+        key_pattern = (error.details or {}).get("keyPattern", {})
+        if "username" in key_pattern:
+            return ValueError(f"User with username {user_data.username} already exists")
+        return ValueError(f"User with email {user_data.email} already exists")
+
     async def create(self, user_data: UserCreate, hashed_password: str) -> User:
         """
         Create a new user.
@@ -44,14 +72,6 @@ class MongoUserRepository(IUserRepository):
         Raises:
             ValueError: If user with email or username already exists
         """
-        existing_email = await UserDocument.find_one(UserDocument.email == user_data.email)
-        if existing_email:
-            raise ValueError(f"User with email {user_data.email} already exists")
-
-        existing_username = await UserDocument.find_one(UserDocument.username == user_data.username)
-        if existing_username:
-            raise ValueError(f"User with username {user_data.username} already exists")
-
         doc = UserDocument(
             email=user_data.email,
             username=user_data.username,
@@ -59,9 +79,60 @@ class MongoUserRepository(IUserRepository):
             full_name=user_data.full_name
         )
 
-        await doc.insert()
+        # The unique indexes on email/username enforce uniqueness in one round-trip
+        try:
+            await doc.insert()
+        except DuplicateKeyError as e:
+            raise self._duplicate_error(e, user_data) from e
+
         return self._to_domain(doc)
 
+    async def create_many(self, users: List[Tuple[UserCreate, str]]) -> List[User]:
+        """
+        Create several users with a single unordered insert_many.
+
+        Args:
+            users: Pairs of user creation data and pre-hashed password
+
+        Returns:
+            Created user entities, in input order, excluding skipped duplicates
+
+        Raises:
+            BulkWriteError: If any insert fails for a reason other than a duplicate key
+        """
+        if not users:
+            return []
+
+        docs = [
+            UserDocument(
+                email=user_data.email,
+                username=user_data.username,
+                hashed_password=hashed_password,
+                full_name=user_data.full_name
+            )
+            for user_data, hashed_password in users
+        ]
+        rows = [doc.model_dump(exclude={"id", "revision_id"}) for doc in docs]
+
+        # Unordered so one duplicate does not stop the remaining inserts
+        failed: set[int] = set()
+        try:
+            await UserDocument.get_pymongo_collection().insert_many(rows, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if any(err.get("code") != _DUPLICATE_KEY_CODE for err in write_errors):
+                raise
+            failed = {err["index"] for err in write_errors}
+            logger.warning(f"Skipped {len(failed)} duplicate users during bulk create")
+
+        created = []
+        for index, (doc, row) in enumerate(zip(docs, rows, strict=True)):
+            if index in failed:
+                continue
+            doc.id = row["_id"]
+            created.append(self._to_domain(doc))
+        return created
+
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Retrieve a user by ID."""
         doc = await UserDocument.get(user_id)
@@ -77,6 +148,15 @@ class MongoUserRepository(IUserRepository):
         doc = await UserDocument.find_one(UserDocument.username == username)
         return self._to_domain(doc) if doc else None
 
+    async def get_by_email_or_username(self, identifier: str) -> Optional[User]:
+        """Retrieve a user by email address or username with a single query."""
+        docs = await UserDocument.find(
+            Or(UserDocument.email == identifier, UserDocument.username == identifier)
+        ).limit(2).to_list()
+        # An email match wins, as it did when the two were looked up separately
+        doc = next((d for d in docs if d.email == identifier), docs[0] if docs else None)
+        return self._to_domain(doc) if doc else None
+
     async def update(self, user_id: str, user_data: UserUpdate) -> Optional[User]:
         """
         Update user information.
@@ -88,18 +168,21 @@ class MongoUserRepository(IUserRepository):
         Returns:
             Updated user entity if found, None otherwise
         """
-        doc = await UserDocument.get(user_id)
-        if not doc:
-            return None
-
         update_dict = user_data.model_dump(exclude_unset=True)
-        if update_dict:
-            update_dict["updated_at"] = datetime.utcnow()
-            for key, value in update_dict.items():
-                setattr(doc, key, value)
-            await doc.save()
+        if not update_dict:
+            return await self.get_by_id(user_id)
 
-        return self._to_domain(doc)
+        update_dict["updated_at"] = _now()
+
+        # Ship only the changed fields and read back the result in a single round-trip
+        doc = await UserDocument.find_one(
+            {"_id": PydanticObjectId(user_id)}
+        ).update(
+            {"$set": update_dict},
+            response_type=UpdateResponse.NEW_DOCUMENT
+        )
+
+        return self._to_domain(doc) if doc else None
 
     async def delete(self, user_id: str) -> bool:
         """
@@ -111,14 +194,11 @@ class MongoUserRepository(IUserRepository):
         Returns:
             True if user was deleted, False if not found
         """
-        doc = await UserDocument.get(user_id)
-        if not doc:
-            return False
-
-        await doc.delete()
-        return True
+        # Delete by id directly; the result says whether anything matched
+        result = await UserDocument.find_one({"_id": PydanticObjectId(user_id)}).delete()
+        return bool(result and result.deleted_count)
 
-    async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserSummary]:
         """
         List users with pagination.
 
@@ -127,7 +207,7 @@ class MongoUserRepository(IUserRepository):
             limit: Maximum number of records to return
 
         Returns:
-            List of user entities
+            List of user summaries
         """
-        docs = await UserDocument.find_all().skip(skip).limit(limit).to_list()
-        return [self._to_domain(doc) for doc in docs]
+        query = UserDocument.find_all().project(UserListProjection).skip(skip).limit(limit)
+        return [self._to_summary(doc) async for doc in query]
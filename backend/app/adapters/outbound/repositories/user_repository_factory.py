@@ -0,0 +1,32 @@
+# ABOUTME: User repository factory wiring the MongoDB adapter behind the lookup cache
+# ABOUTME: Provides one process-wide repository so its cache is shared across requests
+
+from functools import lru_cache
+
+from app.core.ports.user_repository import IUserRepository
+from app.infrastructure.config.settings import settings
+
+
+@lru_cache(maxsize=1)
+def get_user_repository() -> IUserRepository:
+    """
+    Get the process-wide user repository.
+
+    Wraps the MongoDB repository in a CachingUserRepository unless
+    USER_CACHE_TTL_SECONDS is 0.
+    """
+    from app.adapters.outbound.repositories.mongo_user_repository import MongoUserRepository
+
+    repository = MongoUserRepository()
+    if settings.user_cache_ttl_seconds <= 0:
+        return repository
+
+    from app.adapters.outbound.repositories.caching_user_repository import CachingUserRepository
+    from app.infrastructure.cache.in_memory_cache import InMemoryCacheBackend
+
+    # Each user occupies up to three entries (id, email, username)
+    backend = InMemoryCacheBackend(
+        max_size=settings.user_cache_max_size * 3,
+        ttl_seconds=settings.user_cache_ttl_seconds
+    )
+    return CachingUserRepository(repository, backend)
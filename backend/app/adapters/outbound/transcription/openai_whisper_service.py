@@ -1,16 +1,28 @@
 # ABOUTME: OpenAI Whisper transcription service adapter
 # ABOUTME: Implements ITranscriptionService using OpenAI Whisper API
 
+import io
 import os
-from typing import Optional
+from typing import AsyncGenerator, Optional, Tuple
 from openai import AsyncOpenAI
-from app.core.ports.transcription_service import ITranscriptionService
+from app.core.ports.transcription_service import ITranscriptionService, TranscriptionError
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
-from app.infrastructure.storage.temp_file_handler import secure_temp_file
 
 logger = get_logger(__name__)
 
+# Models that only return a transcript once the whole file is processed
+_NON_STREAMING_MODELS = {"whisper-1"}
+
+
+def _audio_file(audio_content: bytes, filename: str) -> Tuple[str, io.BytesIO, str]:
+    """Upload straight from memory; the extension lets the API detect the format."""
+    return (
+        "audio" + os.path.splitext(filename)[1],
+        io.BytesIO(audio_content),
+        "application/octet-stream"
+    )
+
 
 class OpenAIWhisperService(ITranscriptionService):
     """OpenAI Whisper transcription implementation."""
@@ -30,28 +42,64 @@ class OpenAIWhisperService(ITranscriptionService):
         language: Optional[str] = None,
     ) -> dict:
         """Transcribe audio using OpenAI Whisper API."""
+        try:
+            response = await self.client.audio.transcriptions.create(
+                model=self.model,
+                file=_audio_file(audio_content, filename),
+                language=language,
+                response_format="verbose_json"
+            )
+
+            logger.info(f"Transcription successful: {len(response.text)} chars")
+
+            return {
+                "text": response.text,
+                "language": response.language or language or "en",
+                "duration": response.duration
+            }
+
+        except Exception as e:
+            logger.error(f"Whisper transcription failed: {e}")
+            raise TranscriptionError("Transcription failed") from e
+
+    async def transcribe_stream(
+        self,
+        audio_content: bytes,
+        filename: str,
+        language: Optional[str] = None,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Stream partial transcripts from models that support it (gpt-4o-*-transcribe).
+
+        Whisper-1 cannot stream, so it yields a single final event.
+        """
+        if self.model in _NON_STREAMING_MODELS:
+            result = await self.transcribe(audio_content, filename, language)
+            yield {"type": "done", **result}
+            return
+
+        try:
+            stream = await self.client.audio.transcriptions.create(
+                model=self.model,
+                file=_audio_file(audio_content, filename),
+                language=language,
+                response_format="json",
+                stream=True
+            )
+
+            async for event in stream:
+                if event.type == "transcript.text.delta":
+                    yield {"type": "delta", "text": event.delta}
+                elif event.type == "transcript.text.done":
+                    logger.info(f"Streaming transcription successful: {len(event.text)} chars")
+                    # Streamed transcripts do not report the audio duration
+                    yield {
+                        "type": "done",
+                        "text": event.text,
+                        "language": language or "en",
+                        "duration": None
+                    }
 
-        # Use secure temp file handler
-        with secure_temp_file(suffix=os.path.splitext(filename)[1]) as tmp_path:
-            tmp_path.write_bytes(audio_content)
-
-            try:
-                with open(tmp_path, "rb") as audio_file:
-                    response = await self.client.audio.transcriptions.create(
-                        model=self.model,
-                        file=audio_file,
-                        language=language,
-                        response_format="verbose_json"
-                    )
-
-                logger.info(f"Transcription successful: {len(response.text)} chars")
-
-                return {
-                    "text": response.text,
-                    "language": response.language or language or "en",
-                    "duration": response.duration
-                }
-
-            except Exception as e:
-                logger.error(f"Whisper transcription failed: {e}")
-                raise Exception(f"Transcription failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Streaming transcription failed: {e}")
+            raise TranscriptionError("Transcription failed") from e
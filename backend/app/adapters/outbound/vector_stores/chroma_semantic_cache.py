@@ -0,0 +1,122 @@
+# ABOUTME: ChromaDB implementation of the semantic cache port
+# ABOUTME: Embeds prompts into a cosine collection and returns answers for near-duplicates
+
+import asyncio
+import time
+import uuid
+from typing import Optional
+
+from app.core.ports.embedder import IEmbedder
+from app.core.ports.semantic_cache import ISemanticCache
+from app.infrastructure.config.settings import settings
+from app.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ChromaSemanticCache(ISemanticCache):
+    """ChromaDB implementation of the semantic cache."""
+
+    def __init__(self, chroma_client, embedder: Optional[IEmbedder] = None):
+        """
+        Initialize with ChromaDB client.
+
+        Args:
+            chroma_client: ChromaDB client instance
+            embedder: Optional client-side embedder; when omitted ChromaDB
+                      embeds prompts with its own model
+        """
+        self.client = chroma_client
+        self.embedder = embedder
+        self.collection = self.client.get_or_create_collection(
+            name=settings.semantic_cache_collection_name,
+            metadata={"hnsw:space": "cosine"}
+        )
+        logger.info(f"Semantic cache collection '{settings.semantic_cache_collection_name}' ready")
+
+    async def _embed(self, query: str) -> Optional[list]:
+        """Embed a prompt client-side, or return None to let ChromaDB embed it."""
+        if self.embedder is None:
+            return None
+        return await self.embedder.embed_batch([query])
+
+    async def lookup(self, query: str, scope: str, threshold: float) -> Optional[str]:
+        """
+        Find a cached answer for a semantically similar query.
+
+        Only entries in the same scope and younger than the TTL are searched.
+        A lookup failure is logged and treated as a miss.
+        """
+        try:
+            oldest = int(time.time()) - settings.semantic_cache_ttl_seconds
+            embeddings = await self._embed(query)
+            query_kwargs = (
+                {"query_texts": [query]} if embeddings is None
+                else {"query_embeddings": embeddings}
+            )
+            results = await asyncio.to_thread(
+                self.collection.query,
+                n_results=1,
+                where={"$and": [{"scope": scope}, {"created_at": {"$gte": oldest}}]},
+                **query_kwargs
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+        if not results["ids"] or not results["ids"][0]:
+            return None
+
+        # Cosine distance is 1 - cosine similarity
+        similarity = 1.0 - results["distances"][0][0]
+        if similarity < threshold:
+            return None
+
+        logger.info(f"Semantic cache hit in scope {scope} (similarity {similarity:.3f})")
+        return results["metadatas"][0][0]["response"]
+
+    def _add_entry(self, add_kwargs: dict, scope: str, response: str) -> bool:
+        """
+        Drop expired entries, then add one unless the cache is full.
+
+        Runs in a worker thread so the purge and the add share one hop.
+
+        Returns:
+            True if the entry was added
+        """
+        now = int(time.time())
+        self.collection.delete(
+            where={"created_at": {"$lt": now - settings.semantic_cache_ttl_seconds}}
+        )
+        if self.collection.count() >= settings.semantic_cache_max_entries:
+            return False
+
+        self.collection.add(
+            ids=[str(uuid.uuid4())],
+            metadatas=[{
+                "scope": scope,
+                "response": response,
+                "created_at": now
+            }],
+            **add_kwargs
+        )
+        return True
+
+    async def store(self, query: str, response: str, scope: str) -> None:
+        """
+        Cache an answer for a query.
+
+        Expired entries are deleted first. While the cache holds
+        semantic_cache_max_entries fresh entries, new answers are not stored.
+        A store failure is logged and otherwise ignored.
+        """
+        try:
+            add_kwargs = {"documents": [query]}
+            embeddings = await self._embed(query)
+            if embeddings is not None:
+                add_kwargs["embeddings"] = embeddings
+            added = await asyncio.to_thread(self._add_entry, add_kwargs, scope, response)
+            if not added:
+                logger.info("Semantic cache is full; answer not stored")
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
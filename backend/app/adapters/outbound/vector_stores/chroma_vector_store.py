@@ -1,23 +1,61 @@
 # ABOUTME: ChromaDB implementation of vector store port interface
 # ABOUTME: Manages document storage, embedding generation, and semantic search
 
-from typing import List
+import asyncio
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.ports.embedder import IEmbedder
 from app.core.ports.vector_store import IVectorStore
 from app.core.domain.document import Document, RetrievalResult, DocumentMetadata
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
-from datetime import datetime
+from datetime import datetime, timezone
 
 logger = get_logger(__name__)
 
 
+def _to_epoch(value: datetime) -> int:
+    """Convert a datetime (naive values are treated as UTC) to Unix epoch seconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _from_epoch(value) -> datetime:
+    """Convert stored created_at metadata back to a naive UTC datetime."""
+    if isinstance(value, str):
+        # Documents stored before created_at became an epoch integer
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
 class ChromaDBVectorStore(IVectorStore):
     """ChromaDB implementation of vector store."""
 
-    def __init__(self, chroma_client):
-        """Initialize with ChromaDB client."""
+    def __init__(self, chroma_client, embedder: Optional[IEmbedder] = None):
+        """
+        Initialize with ChromaDB client.
+
+        Args:
+            chroma_client: ChromaDB client instance
+            embedder: Optional client-side embedder; when omitted ChromaDB
+                      embeds documents and queries with its own model
+        """
         self.client = chroma_client
+        self.embedder = embedder
         self.collection = self._get_or_create_collection()
+        self.batch_size = self._upload_batch_size()
+
+    def _upload_batch_size(self) -> int:
+        """Configured upload batch size, capped at the largest batch the Chroma server accepts."""
+        batch_size = settings.chroma_batch_size
+        server_limit = getattr(self.client, "max_batch_size", None)
+        if isinstance(server_limit, int) and 0 < server_limit < batch_size:
+            logger.info(f"Capping Chroma upload batches at the server limit of {server_limit}")
+            batch_size = server_limit
+        return batch_size
 
     def _get_or_create_collection(self):
         """Get or create the knowledge base collection."""
@@ -32,30 +70,63 @@ class ChromaDBVectorStore(IVectorStore):
             logger.error(f"Failed to get/create collection: {e}")
             raise
 
-    async def store_documents(self, documents: List[Document]) -> List[str]:
+    async def store_documents(
+        self,
+        documents: List[Document],
+        embeddings: Optional[List[List[float]]] = None
+    ) -> List[str]:
         """
-        Store documents in ChromaDB with automatic embedding.
+        Store documents in ChromaDB.
 
-        ChromaDB will auto-generate embeddings using configured model.
+        Embeddings come from the caller, then the configured embedder (one
+        batched encode for the whole upload), and finally ChromaDB's own model.
+        Uploads are chunked to the server's maximum batch size.
         """
         try:
-            ids = [doc.id for doc in documents]
-            contents = [doc.content for doc in documents]
-            metadatas = [
-                {
-                    "source": doc.metadata.source,
-                    "created_at": doc.metadata.created_at.isoformat(),
-                    "content_length": doc.metadata.content_length,
-                    "document_type": doc.metadata.document_type
+            n = len(documents)
+            ids = [None] * n
+            contents = [None] * n
+            metadatas = [None] * n
+            for i, doc in enumerate(documents):
+                metadata = doc.metadata
+                ids[i] = doc.id
+                contents[i] = doc.content
+                metadatas[i] = {
+                    "source": metadata.source,
+                    # Numeric so Chroma can filter on it with $gte/$lte
+                    "created_at": _to_epoch(metadata.created_at),
+                    "content_length": metadata.content_length,
+                    "document_type": metadata.document_type
                 }
-                for doc in documents
-            ]
 
-            self.collection.add(
-                ids=ids,
-                documents=contents,
-                metadatas=metadatas
-            )
+            if embeddings is not None and len(embeddings) != n:
+                raise ValueError(f"Got {len(embeddings)} embeddings for {n} documents")
+
+            if embeddings is None and self.embedder is not None:
+                embeddings = await self.embedder.embed_batch(
+                    contents, batch_size=settings.embedding_batch_size
+                )
+
+            # Upload in bounded batches so one huge add cannot monopolise the
+            # embedding model or memory; a few batches run concurrently
+            batch_size = self.batch_size
+            semaphore = asyncio.Semaphore(settings.chroma_max_concurrent_batches)
+
+            async def add_batch(start: int) -> None:
+                end = start + batch_size
+                add_kwargs = {
+                    "ids": ids[start:end],
+                    "documents": contents[start:end],
+                    "metadatas": metadatas[start:end]
+                }
+                if embeddings is not None:
+                    add_kwargs["embeddings"] = embeddings[start:end]
+
+                async with semaphore:
+                    # Chroma's client is synchronous; run it off the event loop
+                    await asyncio.to_thread(self.collection.add, **add_kwargs)
+
+            await asyncio.gather(*(add_batch(start) for start in range(0, n, batch_size)))
 
             logger.info(f"Stored {len(documents)} documents in ChromaDB")
             return ids
@@ -64,72 +135,149 @@ class ChromaDBVectorStore(IVectorStore):
             logger.error(f"Failed to store documents: {e}")
             raise
 
+    def _to_retrieval_results(self, results: dict, query_index: int) -> List[RetrievalResult]:
+        """Convert one query's slice of a Chroma query response to retrieval results."""
+        retrieval_results = []
+
+        if not results["documents"] or not results["documents"][query_index]:
+            return retrieval_results
+
+        ids = results["ids"][query_index]
+        contents = results["documents"][query_index]
+        metadatas = results["metadatas"][query_index]
+
+        # Convert cosine distances (0-2) to similarity scores (0-1, higher is better)
+        # in one vectorised op instead of per result
+        distances = np.asarray(results["distances"][query_index], dtype=np.float64)
+        scores = (1.0 - distances * 0.5).tolist()
+
+        for doc_id, content, metadata_dict, similarity_score in zip(ids, contents, metadatas, scores, strict=True):
+            metadata = DocumentMetadata(
+                source=metadata_dict.get("source", "unknown"),
+                created_at=_from_epoch(metadata_dict.get("created_at")),
+                content_length=metadata_dict.get("content_length", 0),
+                document_type=metadata_dict.get("document_type", "unknown")
+            )
+
+            document = Document(
+                id=doc_id,
+                content=content,
+                metadata=metadata
+            )
+
+            retrieval_results.append(
+                RetrievalResult(
+                    document=document,
+                    similarity_score=similarity_score
+                )
+            )
+
+        return retrieval_results
+
+    async def _query(self, queries: List[str], top_k: int) -> dict:
+        """Run a Chroma query, embedding the queries client-side when an embedder is set."""
+        if self.embedder is None:
+            return await asyncio.to_thread(
+                self.collection.query,
+                query_texts=queries,
+                n_results=top_k
+            )
+
+        query_embeddings = await self.embedder.embed_batch(
+            queries, batch_size=settings.embedding_batch_size
+        )
+        return await asyncio.to_thread(
+            self.collection.query,
+            query_embeddings=query_embeddings,
+            n_results=top_k
+        )
+
     async def retrieve(self, query: str, top_k: int = 5) -> List[RetrievalResult]:
         """
         Retrieve documents similar to query using semantic search.
         """
         try:
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=top_k
-            )
+            results = await self._query([query], top_k)
 
-            retrieval_results = []
+            retrieval_results = self._to_retrieval_results(results, 0)
 
-            if not results["documents"] or not results["documents"][0]:
-                return retrieval_results
+            logger.info(f"Retrieved {len(retrieval_results)} documents for query")
+            return retrieval_results
 
-            for i in range(len(results["ids"][0])):
-                doc_id = results["ids"][0][i]
-                content = results["documents"][0][i]
-                metadata_dict = results["metadatas"][0][i]
-                distance = results["distances"][0][i]
+        except Exception as e:
+            logger.error(f"Failed to retrieve documents: {e}")
+            raise
 
-                # Convert distance to similarity score (0-1, higher is better)
-                similarity_score = 1.0 - (distance / 2.0)
+    async def retrieve_batch(self, queries: List[str], top_k: int = 5) -> List[List[RetrievalResult]]:
+        """
+        Retrieve documents for several queries with one Chroma query.
 
-                metadata = DocumentMetadata(
-                    source=metadata_dict.get("source", "unknown"),
-                    created_at=datetime.fromisoformat(metadata_dict.get("created_at")),
-                    content_length=metadata_dict.get("content_length", 0),
-                    document_type=metadata_dict.get("document_type", "unknown")
-                )
+        Chroma embeds all query texts together and searches them in a
+        single call, instead of one embedding + HNSW traversal per query.
+        """
+        if not queries:
+            return []
 
-                document = Document(
-                    id=doc_id,
-                    content=content,
-                    metadata=metadata
-                )
+        try:
+            results = await self._query(queries, top_k)
 
-                retrieval_results.append(
-                    RetrievalResult(
-                        document=document,
-                        similarity_score=similarity_score
-                    )
-                )
+            batch_results = [
+                self._to_retrieval_results(results, query_index)
+                for query_index in range(len(queries))
+            ]
 
-            logger.info(f"Retrieved {len(retrieval_results)} documents for query")
-            return retrieval_results
+            logger.info(f"Retrieved documents for {len(queries)} queries in one batch")
+            return batch_results
 
         except Exception as e:
             logger.error(f"Failed to retrieve documents: {e}")
             raise
 
+    async def retrieve_many(self, queries: List[str], top_k: int = 5) -> List[RetrievalResult]:
+        """
+        Retrieve distinct documents across several queries with one Chroma query.
+
+        Each query contributes up to top_k hits; a document hit by several
+        queries keeps its highest similarity score.
+        """
+        best = {}
+        for results in await self.retrieve_batch(queries, top_k):
+            for result in results:
+                doc_id = result.document.id
+                if doc_id not in best or result.similarity_score > best[doc_id].similarity_score:
+                    best[doc_id] = result
+
+        return sorted(best.values(), key=lambda r: r.similarity_score, reverse=True)[:top_k]
+
     async def delete(self, document_id: str) -> bool:
         """Delete a document from ChromaDB."""
         try:
-            self.collection.delete(ids=[document_id])
+            await asyncio.to_thread(self.collection.delete, ids=[document_id])
             logger.info(f"Deleted document {document_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to delete document: {e}")
             return False
 
-    async def clear(self) -> bool:
-        """Clear all documents from collection."""
+    async def clear(self, where: Optional[dict] = None) -> bool:
+        """
+        Clear documents from collection.
+
+        With a where filter only the matching points are deleted, leaving the
+        HNSW index in place; without one the whole collection is dropped and
+        recreated.
+        """
         try:
-            self.client.delete_collection(name=settings.chroma_collection_name)
-            self.collection = self._get_or_create_collection()
+            if where is not None:
+                await asyncio.to_thread(self.collection.delete, where=where)
+                logger.info(f"Cleared documents matching {where} from collection")
+                return True
+
+            await asyncio.to_thread(
+                self.client.delete_collection,
+                name=settings.chroma_collection_name
+            )
+            self.collection = await asyncio.to_thread(self._get_or_create_collection)
             logger.info("Cleared all documents from collection")
             return True
         except Exception as e:
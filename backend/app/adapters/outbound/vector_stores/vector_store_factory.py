@@ -1,6 +1,11 @@
 # ABOUTME: Vector store factory for creating store instances based on configuration
 # ABOUTME: Currently supports ChromaDB, extensible for other vector databases
 
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from app.core.ports.embedder import IEmbedder
+from app.core.ports.semantic_cache import ISemanticCache
 from app.core.ports.vector_store import IVectorStore
 from app.infrastructure.config.settings import settings
 
@@ -9,12 +14,56 @@ class VectorStoreFactory:
     """Factory for creating vector store instances."""
 
     @staticmethod
-    def create_vector_store(chroma_client) -> IVectorStore:
-        """Create appropriate vector store based on configuration."""
+    def create_embedder() -> Optional[IEmbedder]:
+        """Create the client-side embedder, or None to let ChromaDB embed."""
+        if settings.embedding_mode == "local":
+            from app.adapters.outbound.embedders.sentence_transformer_embedder import SentenceTransformerEmbedder
+            return SentenceTransformerEmbedder()
+        return None
+
+    @staticmethod
+    def _create_chroma_store(chroma_client, embedder: Optional[IEmbedder]) -> IVectorStore:
+        """Create the ChromaDB-backed vector store."""
         from app.adapters.outbound.vector_stores.chroma_vector_store import ChromaDBVectorStore
-        return ChromaDBVectorStore(chroma_client)
+        return ChromaDBVectorStore(chroma_client, embedder=embedder)
+
+    @staticmethod
+    def create_vector_store(chroma_client) -> IVectorStore:
+        """
+        Create appropriate vector store based on configuration.
 
+        The backend is chosen by VECTOR_STORE_BACKEND so that a store with
+        compressed (quantized) vector storage can be plugged in behind the
+        same port without touching callers. Settings only accept backends
+        listed in _BACKENDS.
+        """
+        create = _BACKENDS[settings.vector_store_backend]
+        return create(chroma_client, VectorStoreFactory.create_embedder())
 
+
+_BACKENDS: Dict[str, Callable[[object, Optional[IEmbedder]], IVectorStore]] = {
+    "chroma": VectorStoreFactory._create_chroma_store,
+}
+
+
+@lru_cache(maxsize=1)
 def get_vector_store(chroma_client) -> IVectorStore:
-    """Get the configured vector store instance."""
+    """
+    Get the configured vector store instance.
+
+    Cached per client so repeated calls reuse one store (and its opened
+    collection) instead of round-tripping to ChromaDB each time.
+    """
     return VectorStoreFactory.create_vector_store(chroma_client)
+
+
+def get_semantic_cache(chroma_client) -> Optional[ISemanticCache]:
+    """
+    Get the semantic cache, or None when SEMANTIC_CACHE_ENABLED is off.
+
+    Uses the same client-side embedder setting as the vector store.
+    """
+    if not settings.semantic_cache_enabled:
+        return None
+    from app.adapters.outbound.vector_stores.chroma_semantic_cache import ChromaSemanticCache
+    return ChromaSemanticCache(chroma_client, embedder=VectorStoreFactory.create_embedder())
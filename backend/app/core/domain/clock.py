@@ -0,0 +1,9 @@
+# ABOUTME: Clock helper providing timezone-aware UTC timestamps for domain models
+# ABOUTME: Replaces the deprecated naive datetime.utcnow() across the domain layer
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
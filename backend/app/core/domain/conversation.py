@@ -3,7 +3,9 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.domain.clock import utcnow
 
 
 class Conversation(BaseModel):
@@ -17,12 +19,17 @@ class Conversation(BaseModel):
     id: Optional[str] = Field(default=None, description="Conversation unique identifier")
     user_id: str = Field(..., description="ID of the user who owns this conversation")
     title: str = Field(default="New Conversation", max_length=200, description="Conversation title")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Conversation creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Conversation creation timestamp")
+    updated_at: datetime = Field(default_factory=utcnow, description="Last update timestamp")
     message_count: Optional[int] = Field(default=None, ge=0, description="Total number of messages (deprecated - count from LangGraph state instead)")
 
-    class Config:
-        json_schema_extra = {
+    # Immutable value object: repositories build instances with model_construct,
+    # so they are never re-validated or mutated after leaving the adapter.
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        revalidate_instances="never",
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439012",
                 "user_id": "507f1f77bcf86cd799439011",
@@ -31,7 +38,8 @@ class Conversation(BaseModel):
                 "updated_at": "2025-01-15T10:45:00",
                 "message_count": 4
             }
-        }
+        },
+    )
 
 
 class ConversationCreate(BaseModel):
@@ -56,8 +64,8 @@ class ConversationResponse(BaseModel):
     updated_at: datetime
     message_count: Optional[int] = None  # Optional for backward compatibility
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439012",
                 "user_id": "507f1f77bcf86cd799439011",
@@ -66,4 +74,5 @@ class ConversationResponse(BaseModel):
                 "updated_at": "2025-01-15T10:45:00",
                 "message_count": 4
             }
-        }
+        },
+    )
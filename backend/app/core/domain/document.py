@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentMetadata:
     """Metadata about a stored document."""
     source: str
@@ -15,7 +15,7 @@ class DocumentMetadata:
     document_type: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Document:
     """Document entity for knowledge base."""
     id: str
@@ -23,7 +23,7 @@ class Document:
     metadata: DocumentMetadata
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetrievalResult:
     """Result of a document retrieval."""
     document: Document
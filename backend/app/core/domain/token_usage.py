@@ -0,0 +1,36 @@
+# ABOUTME: Token usage domain model reported by LLM providers
+# ABOUTME: Read from provider responses so callers never re-tokenize messages
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class TokenUsage:
+    """Token counts for one LLM call, as reported by the provider."""
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    cached_tokens: int = 0
+
+    @classmethod
+    def from_message(cls, message: Any) -> Optional["TokenUsage"]:
+        """
+        Read token usage from a LangChain message's usage_metadata.
+
+        Args:
+            message: AIMessage or AIMessageChunk returned by a provider
+
+        Returns:
+            TokenUsage if the provider reported usage, None otherwise
+        """
+        metadata = getattr(message, "usage_metadata", None)
+        if not metadata:
+            return None
+        details = metadata.get("input_token_details") or {}
+        return cls(
+            prompt_tokens=metadata.get("input_tokens", 0),
+            completion_tokens=metadata.get("output_tokens", 0),
+            total_tokens=metadata.get("total_tokens", 0),
+            cached_tokens=details.get("cache_read", 0) or 0
+        )
@@ -3,7 +3,9 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.core.domain.clock import utcnow
 
 
 class User(BaseModel):
@@ -20,11 +22,11 @@ class User(BaseModel):
     hashed_password: str = Field(..., description="Bcrypt hashed password")
     full_name: Optional[str] = Field(default=None, max_length=100, description="User's full name")
     is_active: bool = Field(default=True, description="Whether the user account is active")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Account creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Account creation timestamp")
+    updated_at: datetime = Field(default_factory=utcnow, description="Last update timestamp")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439011",
                 "email": "user@example.com",
@@ -34,7 +36,25 @@ class User(BaseModel):
                 "created_at": "2025-01-15T10:30:00",
                 "updated_at": "2025-01-15T10:30:00"
             }
-        }
+        },
+    )
+
+
+class UserSummary(BaseModel):
+    """
+    User listing entry.
+
+    The user fields without credentials, returned by user listings that
+    never load password hashes.
+    """
+
+    id: str
+    email: EmailStr
+    username: str
+    full_name: Optional[str] = None
+    is_active: bool = True
+    created_at: datetime
+    updated_at: datetime
 
 
 class UserCreate(BaseModel):
@@ -65,8 +85,8 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439011",
                 "email": "user@example.com",
@@ -75,4 +95,5 @@ class UserResponse(BaseModel):
                 "is_active": True,
                 "created_at": "2025-01-15T10:30:00"
             }
-        }
+        },
+    )
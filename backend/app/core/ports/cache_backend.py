@@ -0,0 +1,53 @@
+# ABOUTME: Cache backend port interface defining the contract for key-value caches
+# ABOUTME: Lets caching decorators swap in-process and shared (e.g. Redis) storage
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class ICacheBackend(ABC):
+    """
+    Cache backend port interface.
+
+    Stores arbitrary values under string keys with backend-defined expiry.
+    Methods are async so network-backed implementations fit the same contract.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if present and not expired, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Remove a cached value if present.
+
+        Args:
+            key: Cache key
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        pass
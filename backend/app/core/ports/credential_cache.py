@@ -0,0 +1,53 @@
+# ABOUTME: Verified-credential cache port interface for skipping repeat password hashing
+# ABOUTME: Abstract interface following hexagonal architecture principles
+
+from abc import ABC, abstractmethod
+
+from app.core.domain.user import User
+
+
+class IVerifiedCredentialCache(ABC):
+    """
+    Verified-credential cache port interface.
+
+    Remembers that a password was recently verified for a user so repeated
+    logins can skip the deliberately slow password hash check. Only
+    successful verifications are remembered; implementations must never
+    store the plain password and must tie entries to the user's current
+    password hash so a password change invalidates them.
+    """
+
+    @abstractmethod
+    async def is_verified(self, user: User, password: str) -> bool:
+        """
+        Check whether this password was recently verified for the user.
+
+        Args:
+            user: User attempting to log in
+            password: Plain text password supplied
+
+        Returns:
+            True if a fresh successful verification is cached, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def remember(self, user: User, password: str) -> None:
+        """
+        Record a successful password verification.
+
+        Args:
+            user: User whose password was verified
+            password: Plain text password that verified
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_id: str) -> None:
+        """
+        Forget any cached verification for a user.
+
+        Args:
+            user_id: User unique identifier
+        """
+        pass
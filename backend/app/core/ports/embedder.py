@@ -0,0 +1,34 @@
+# ABOUTME: Embedder port interface defining the contract for text embedding generation
+# ABOUTME: Lets vector stores receive precomputed vectors instead of embedding per call
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class IEmbedder(ABC):
+    """
+    Embedder port interface.
+
+    Turns text into dense vectors. Implementations batch the work so that
+    many texts are encoded in a single model call.
+    """
+
+    @abstractmethod
+    async def embed_batch(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """
+        Embed a batch of texts.
+
+        Callers pass every text at once; implementations split the list into
+        chunks of batch_size (or the provider's request limit) themselves.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts encoded per model forward pass
+
+        Returns:
+            One embedding vector per input text, in input order
+
+        Raises:
+            Exception: If embedding fails
+        """
+        pass
@@ -2,10 +2,16 @@
 # ABOUTME: Uses LangChain BaseMessage types for LangGraph-first architecture
 
 from abc import ABC, abstractmethod
-from typing import List, AsyncGenerator, Callable, Any
+from typing import List, AsyncGenerator, Callable, Any, Optional
 from langchain_core.messages import BaseMessage
 from langchain_core.language_models import BaseChatModel
 
+from app.core.domain.token_usage import TokenUsage
+
+
+class LLMError(Exception):
+    """Raised when an LLM provider fails; the provider error is kept as __cause__."""
+
 
 class ILLMProvider(ABC):
     """
@@ -27,26 +33,34 @@ class ILLMProvider(ABC):
                      representing the conversation history
 
         Returns:
-            Generated response as BaseMessage (AIMessage with content and tool_calls if applicable)
+            Generated response as BaseMessage (AIMessage with content and tool_calls if applicable).
+            Token usage reported by the API is carried in usage_metadata; read it with
+            TokenUsage.from_message instead of re-tokenizing the conversation.
 
         Raises:
-            Exception: If LLM generation fails
+            LLMError: If LLM generation fails
         """
         pass
 
     @abstractmethod
-    async def stream(self, messages: List[BaseMessage]) -> AsyncGenerator[str, None]:
+    async def stream(
+        self,
+        messages: List[BaseMessage],
+        *,
+        on_usage: Optional[Callable[[TokenUsage], None]] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream a response from the LLM token-by-token.
 
         Args:
             messages: List of BaseMessage objects representing the conversation history
+            on_usage: Called with the token usage reported by the API once the stream ends
 
         Yields:
             Response tokens as they are generated
 
         Raises:
-            Exception: If LLM streaming fails
+            LLMError: If LLM streaming fails
         """
         pass
 
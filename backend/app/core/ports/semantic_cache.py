@@ -0,0 +1,43 @@
+# ABOUTME: Semantic cache port interface for reusing answers to near-duplicate prompts
+# ABOUTME: Abstract interface following hexagonal architecture principles
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ISemanticCache(ABC):
+    """
+    Semantic cache port interface.
+
+    Stores LLM answers keyed by the embedding of the prompt that produced
+    them, so a prompt that means the same thing as an earlier one can be
+    answered without calling the LLM. Entries are scoped (e.g. per
+    conversation) and expire after a configured TTL.
+    """
+
+    @abstractmethod
+    async def lookup(self, query: str, scope: str, threshold: float) -> Optional[str]:
+        """
+        Find a cached answer for a semantically similar query.
+
+        Args:
+            query: Prompt text to look up
+            scope: Scope the entry must belong to (e.g. a conversation ID)
+            threshold: Minimum cosine similarity (0-1) for a hit
+
+        Returns:
+            Cached answer if a fresh entry is similar enough, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def store(self, query: str, response: str, scope: str) -> None:
+        """
+        Cache an answer for a query.
+
+        Args:
+            query: Prompt text that produced the answer
+            response: Answer text to cache
+            scope: Scope the entry belongs to (e.g. a conversation ID)
+        """
+        pass
@@ -2,7 +2,11 @@
 # ABOUTME: Defines abstract contract allowing multiple provider implementations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncGenerator, Optional
+
+
+class TranscriptionError(Exception):
+    """Raised when a transcription service fails; the service error is kept as __cause__."""
 
 
 class ITranscriptionService(ABC):
@@ -28,6 +32,33 @@ class ITranscriptionService(ABC):
 
         Raises:
             ValueError: If audio is invalid or too long
-            Exception: If transcription service fails
+            TranscriptionError: If transcription service fails
+        """
+        pass
+
+    @abstractmethod
+    async def transcribe_stream(
+        self,
+        audio_content: bytes,
+        filename: str,
+        language: Optional[str] = None,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Transcribe audio to text, yielding partial transcripts as they arrive.
+
+        Providers that cannot stream yield only the final event.
+
+        Args:
+            audio_content: Raw audio file bytes
+            filename: Original filename for format detection
+            language: Optional ISO 639-1 language code
+
+        Yields:
+            {"type": "delta", "text": str} for each partial transcript, then
+            {"type": "done", "text": str, "language": str, "duration": Optional[float]}
+
+        Raises:
+            ValueError: If audio is invalid or too long
+            TranscriptionError: If transcription service fails
         """
         pass
@@ -2,9 +2,9 @@
 # ABOUTME: Abstract interface following hexagonal architecture principles
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from app.core.domain.user import User, UserCreate, UserUpdate
+from app.core.domain.user import User, UserCreate, UserSummary, UserUpdate
 
 
 class IUserRepository(ABC):
@@ -33,6 +33,22 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, users: List[Tuple[UserCreate, str]]) -> List[User]:
+        """
+        Create several users in a single batch.
+
+        Users whose email or username already exists are skipped rather
+        than aborting the whole batch.
+
+        Args:
+            users: Pairs of user creation data and pre-hashed password
+
+        Returns:
+            Created user entities, in input order, excluding skipped duplicates
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """
@@ -72,6 +88,22 @@ class IUserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_email_or_username(self, identifier: str) -> Optional[User]:
+        """
+        Retrieve a user whose email or username equals identifier, in one lookup.
+
+        If one user's email and another's username both match, the email
+        match is returned.
+
+        Args:
+            identifier: Email address or username
+
+        Returns:
+            User entity if found, None otherwise
+        """
+        pass
+
     @abstractmethod
     async def update(self, user_id: str, user_data: UserUpdate) -> Optional[User]:
         """
@@ -100,7 +132,7 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[UserSummary]:
         """
         List users with pagination.
 
@@ -109,6 +141,6 @@ class IUserRepository(ABC):
             limit: Maximum number of records to return
 
         Returns:
-            List of user entities
+            List of user summaries (no credentials)
         """
         pass
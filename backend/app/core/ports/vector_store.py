@@ -16,17 +16,29 @@ class IVectorStore(ABC):
     """
 
     @abstractmethod
-    async def store_documents(self, documents: List[Document]) -> List[str]:
+    async def store_documents(
+        self,
+        documents: List[Document],
+        embeddings: Optional[List[List[float]]] = None
+    ) -> List[str]:
         """
-        Store documents in the vector store.
+        Store documents in the vector store as one batch.
+
+        Implementations MUST embed all document contents with a single
+        batched embedder call and write them with as few bulk upserts as the
+        backend allows (chunked only to its maximum batch size). They must not
+        loop over the documents embedding or inserting them one at a time.
 
         Args:
             documents: List of Document objects to store
+            embeddings: Optional precomputed embeddings, one per document;
+                        when omitted the store generates them
 
         Returns:
             List of stored document IDs
 
         Raises:
+            ValueError: If embeddings are given but do not match the documents one to one
             Exception: If document storage fails
         """
         pass
@@ -48,12 +60,59 @@ class IVectorStore(ABC):
         """
         pass
 
+    @abstractmethod
+    async def retrieve_batch(self, queries: List[str], top_k: int = 5) -> List[List[RetrievalResult]]:
+        """
+        Retrieve documents for several queries in a single search.
+
+        Args:
+            queries: Search query strings
+            top_k: Number of top results to return per query
+
+        Returns:
+            One list of RetrievalResult per query, in the same order as queries
+
+        Raises:
+            Exception: If retrieval fails
+        """
+        pass
+
+    @abstractmethod
+    async def retrieve_many(self, queries: List[str], top_k: int = 5) -> List[RetrievalResult]:
+        """
+        Retrieve the best documents across several queries, e.g. sub-queries
+        expanded from one user turn.
+
+        All queries are embedded and searched together; hits are merged
+        so each document appears once, with its best score.
+
+        Args:
+            queries: Search query strings
+            top_k: Number of results to return in total
+
+        Returns:
+            Up to top_k distinct RetrievalResult, highest similarity first
+
+        Raises:
+            Exception: If retrieval fails
+        """
+        pass
+
     @abstractmethod
     async def delete(self, document_id: str) -> bool:
         """Delete a document from the store."""
         pass
 
     @abstractmethod
-    async def clear(self) -> bool:
-        """Clear all documents from the store."""
+    async def clear(self, where: Optional[dict] = None) -> bool:
+        """
+        Clear documents from the store.
+
+        Args:
+            where: Optional metadata filter; when given only matching documents
+                   are removed and the index is kept, otherwise everything is dropped
+
+        Returns:
+            True if the clear succeeded, False otherwise
+        """
         pass
@@ -1,11 +1,13 @@
 # ABOUTME: AuthenticateUser use case implementing user authentication business logic
 # ABOUTME: Handles user login with credential validation and token generation
 
-from typing import Tuple
+import asyncio
+from typing import Optional, Tuple
 
 from app.core.domain.user import User
 from app.core.ports.user_repository import IUserRepository
 from app.core.ports.auth_service import IAuthService
+from app.core.ports.credential_cache import IVerifiedCredentialCache
 
 
 class AuthenticateUser:
@@ -17,10 +19,14 @@ class AuthenticateUser:
     It depends only on port interfaces, not concrete implementations.
     """
 
+    # Built on every login request; slots skip the per-instance __dict__
+    __slots__ = ("user_repository", "auth_service", "credential_cache")
+
     def __init__(
         self,
         user_repository: IUserRepository,
-        auth_service: IAuthService
+        auth_service: IAuthService,
+        credential_cache: Optional[IVerifiedCredentialCache] = None
     ):
         """
         Initialize the AuthenticateUser use case.
@@ -28,9 +34,11 @@ class AuthenticateUser:
         Args:
             user_repository: User repository port for data operations
             auth_service: Auth service port for password verification and token generation
+            credential_cache: Optional cache of recent successful password verifications
         """
         self.user_repository = user_repository
         self.auth_service = auth_service
+        self.credential_cache = credential_cache
 
     async def execute(self, username_or_email: str, password: str) -> Tuple[User, str]:
         """
@@ -46,14 +54,12 @@ class AuthenticateUser:
         Raises:
             ValueError: If credentials are invalid or user is inactive
         """
-        user = await self.user_repository.get_by_email(username_or_email)
-        if not user:
-            user = await self.user_repository.get_by_username(username_or_email)
+        user = await self.user_repository.get_by_email_or_username(username_or_email)
 
         if not user:
             raise ValueError("Invalid credentials")
 
-        if not self.auth_service.verify_password(password, user.hashed_password):
+        if not await self._verify_password(user, password):
             raise ValueError("Invalid credentials")
 
         if not user.is_active:
@@ -62,3 +68,21 @@ class AuthenticateUser:
         access_token = self.auth_service.create_access_token(user.id)
 
         return user, access_token
+
+    async def _verify_password(self, user: User, password: str) -> bool:
+        """
+        Verify a password, skipping the password hash check for recent successes.
+
+        Failed attempts are never cached, so every wrong guess pays the full
+        hashing cost.
+        """
+        if self.credential_cache is not None and await self.credential_cache.is_verified(user, password):
+            return True
+
+        # bcrypt is deliberately slow; keep it off the event loop
+        if not await asyncio.to_thread(self.auth_service.verify_password, password, user.hashed_password):
+            return False
+
+        if self.credential_cache is not None:
+            await self.credential_cache.remember(user, password)
+        return True
@@ -13,6 +13,8 @@ class CreateConversation:
     It depends only on port interfaces, not concrete implementations.
     """
 
+    __slots__ = ("conversation_repository",)
+
     def __init__(self, conversation_repository: IConversationRepository):
         """
         Initialize the CreateConversation use case.
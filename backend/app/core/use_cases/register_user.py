@@ -1,6 +1,8 @@
 # ABOUTME: RegisterUser use case implementing user registration business logic
 # ABOUTME: Handles user registration with validation and password hashing
 
+import asyncio
+
 from app.core.domain.user import User, UserCreate
 from app.core.ports.user_repository import IUserRepository
 from app.core.ports.auth_service import IAuthService
@@ -15,6 +17,8 @@ class RegisterUser:
     It depends only on port interfaces, not concrete implementations.
     """
 
+    __slots__ = ("user_repository", "auth_service")
+
     def __init__(
         self,
         user_repository: IUserRepository,
@@ -43,16 +47,11 @@ class RegisterUser:
         Raises:
             ValueError: If user with email or username already exists
         """
-        existing_user_email = await self.user_repository.get_by_email(user_data.email)
-        if existing_user_email:
-            raise ValueError(f"User with email {user_data.email} already exists")
-
-        existing_user_username = await self.user_repository.get_by_username(user_data.username)
-        if existing_user_username:
-            raise ValueError(f"User with username {user_data.username} already exists")
-
-        hashed_password = self.auth_service.hash_password(user_data.password)
+        # bcrypt is deliberately slow; keep it off the event loop
+        hashed_password = await asyncio.to_thread(self.auth_service.hash_password, user_data.password)
 
+        # create raises ValueError for a taken email or username, so no
+        # separate (and racy) lookups run before the insert
         user = await self.user_repository.create(user_data, hashed_password)
 
         return user
@@ -0,0 +1,51 @@
+# ABOUTME: In-process LRU cache with per-entry TTL implementing the cache backend port
+# ABOUTME: Bounded OrderedDict store suited to single-process deployments and tests
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.core.ports.cache_backend import ICacheBackend
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    """LRU cache with a fixed time-to-live, held in process memory."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before least recently used ones are evicted
+            ttl_seconds: Lifetime of each entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a value and evict least recently used entries beyond capacity."""
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove all values."""
+        self._entries.clear()
@@ -1,26 +1,71 @@
 # ABOUTME: Logging configuration for the application using Python's logging module
 # ABOUTME: Sets up structured logging with configurable log levels based on settings
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+import orjson
 
 from app.infrastructure.config.settings import settings
 
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+def _build_formatter() -> logging.Formatter:
+    """Formatter for the configured LOG_FORMAT ("text" or "json")."""
+    if settings.log_format == "json":
+        return JsonFormatter()
+    return logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
 
 def setup_logging() -> None:
-    """Configure application logging based on settings."""
+    """
+    Configure application logging based on settings.
+
+    Request handlers only enqueue records; a background listener thread
+    formats them and writes to stdout, so a slow or blocked stdout never
+    stalls the event loop.
+    """
+    global _listener
 
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    if _listener is None:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(_build_formatter())
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        # The queue handler only merges args (and any traceback) into the message;
+        # the listener's formatter does the rest
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=log_level, handlers=[queue_handler])
 
     logger = logging.getLogger("genesis")
     logger.setLevel(log_level)
@@ -29,6 +74,15 @@ def setup_logging() -> None:
     logging.getLogger("fastapi").setLevel(log_level)
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name."""
     return logging.getLogger(f"genesis.{name}")
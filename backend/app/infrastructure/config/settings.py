@@ -1,12 +1,21 @@
 # ABOUTME: Application settings and configuration management using Pydantic Settings
 # ABOUTME: Loads environment variables and provides type-safe access to configuration values
 
-import json
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
+import orjson
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+__all__ = ["Settings", "get_settings"]
+
+# Same name get_logger() would give; logging_config imports this module, so it
+# cannot be imported here
+logger = logging.getLogger(f"genesis.{__name__}")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -15,7 +24,9 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        # Read-only after load; use Settings.with_overrides for modified copies
+        frozen=True
     )
 
     # Application Settings
@@ -36,14 +47,44 @@ class Settings(BaseSettings):
     mongodb_app_db_name: str = "genesis_app"
     mongodb_langgraph_url: str = "mongodb://mongodb:27017"
     mongodb_langgraph_db_name: str = "genesis_langgraph"
+    # When chat turns write checkpoints: "exit" writes once per turn, "async"/"sync" after every graph step
+    langgraph_durability: Literal["exit", "async", "sync"] = "exit"
+
+    # MongoDB Connection Pool Settings
+    mongodb_max_pool_size: int = 200
+    mongodb_min_pool_size: int = 10
+    mongodb_max_idle_time_ms: int = 300_000
+    mongodb_wait_queue_timeout_ms: int = 5000
+    mongodb_max_connecting: int = 4  # connections opened concurrently per pool
 
     # Security Settings
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12  # cost factor for new password hashes
+
+    # Verified-credential cache: repeat logins skip bcrypt (0 disables the cache)
+    credential_cache_ttl_seconds: int = 60
+    credential_cache_max_size: int = 50_000
+
+    # Verified JWT cache: repeat requests skip signature checks (0 disables the cache)
+    token_cache_ttl_seconds: int = 60
+    token_cache_max_size: int = 10_000
+
+    # User Cache Settings (0 disables the cache)
+    user_cache_ttl_seconds: int = 15
+    user_cache_max_size: int = 1024
 
     # LLM Provider Settings
-    llm_provider: str = "openai"  # openai, anthropic, gemini, ollama
+    llm_provider: Literal["openai", "anthropic", "gemini", "ollama"] = "openai"
+    llm_temperature: float = 0.7
+    stream_flush_interval_ms: int = 50  # token coalescing window for streamed replies; 0 sends every token
+    llm_history_window: int = 20  # most recent messages sent per turn; 0 sends the full history
+
+    # LLM Response Cache Settings (only used when llm_temperature is 0)
+    llm_cache_enabled: bool = False
+    llm_cache_ttl_seconds: int = 3600
+    llm_cache_max_size: int = 10_000
 
     # OpenAI Settings
     openai_api_key: Optional[str] = None
@@ -62,31 +103,59 @@ class Settings(BaseSettings):
     ollama_model: str = "llama2"
 
     # CORS Settings
-    cors_origins: list[str] = [
+    cors_origins: tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:5173",
         "http://frontend:3000",
         "http://frontend:5173"
-    ]
+    )
 
     # Logging Settings
     log_level: str = "INFO"
+    log_format: str = "text"  # "text" or "json" (one JSON object per line)
 
     @field_validator('cors_origins', mode='before')
     @classmethod
     def parse_cors_origins(cls, v):
-        """Parse CORS_ORIGINS from comma-separated string or list."""
+        """Parse CORS_ORIGINS from a JSON array, comma-separated string or list."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(',')]
+            v = v.strip()
+            if v.startswith('['):
+                return tuple(orjson.loads(v))
+            return tuple(origin.strip() for origin in v.split(',') if origin.strip())
         return v
 
+    @field_validator('llm_provider', mode='before')
+    @classmethod
+    def normalize_llm_provider(cls, v):
+        """Accept LLM_PROVIDER in any case."""
+        if isinstance(v, str):
+            return v.lower()
+        return v
+
+    # Vector Store Settings
+    vector_store_backend: Literal["chroma"] = "chroma"
+
     # ChromaDB Settings
-    chroma_mode: str = "embedded"  # "embedded" or "http"
+    chroma_mode: Literal["embedded", "http"] = "embedded"
     chroma_persist_directory: str = "./chroma_db"
     chroma_host: str = "localhost"
     chroma_port: int = 8000
     chroma_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     chroma_collection_name: str = "genesis_documents"
+    chroma_batch_size: int = 256
+    chroma_max_concurrent_batches: int = 4
+
+    # Embedding Settings
+    embedding_mode: Literal["chroma", "local"] = "chroma"  # server-side or client-side batched
+    embedding_batch_size: int = 64
+
+    # Semantic Cache Settings (answers near-duplicate prompts without calling the LLM)
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.95  # minimum cosine similarity for a hit
+    semantic_cache_ttl_seconds: int = 3600
+    semantic_cache_max_entries: int = 10000
+    semantic_cache_collection_name: str = "genesis_semantic_cache"
 
     # Retrieval Settings
     retrieval_top_k: int = 5
@@ -103,6 +172,16 @@ class Settings(BaseSettings):
     transcription_max_file_size_mb: int = 25
     transcription_max_duration_seconds: int = 300
 
+    @classmethod
+    def with_overrides(cls, base: "Settings", **overrides) -> "Settings":
+        """
+        Copy base with some fields replaced, without re-running validation.
+
+        Meant for trusted internal rebuilds (tests, fixtures); override values
+        are stored as given, so never pass untrusted input.
+        """
+        return cls.model_construct(**{**base.model_dump(), **overrides})
+
     @property
     def get_mcp_servers(self) -> list[dict]:
         """
@@ -129,51 +208,78 @@ class Settings(BaseSettings):
             "env": {"KEY": "value"}
           }
         ]
+
+        The parsed result is cached per config path, modification time and
+        size, so later accesses only stat the file until it is edited.
         """
         if not self.mcp_enabled:
             return []
 
-        config_path = Path(self.mcp_config_path)
-        if not config_path.exists():
-            return []
-
         try:
-            from app.infrastructure.config.logging_config import get_logger
-            logger = get_logger(__name__)
-
-            config = json.loads(config_path.read_text())
-
-            # Parse standard MCP format
-            if "mcpServers" not in config:
-                logger.error("Invalid MCP config: missing 'mcpServers' key")
-                return []
-
-            servers = []
-            for server_name, server_config in config["mcpServers"].items():
-                # Validate required fields
-                if "command" not in server_config:
-                    logger.error(f"MCP server '{server_name}' missing required 'command' field")
-                    continue
-
-                # Normalize to internal format
-                normalized = {
-                    "name": server_name,
-                    "transport": "stdio",  # Default transport
-                    "command": server_config["command"],
-                    "args": server_config.get("args", []),
-                    "env": server_config.get("env", {})
-                }
-                servers.append(normalized)
-
-            logger.info(f"Loaded {len(servers)} MCP server(s) from config")
-            return servers
-
-        except Exception as e:
-            from app.infrastructure.config.logging_config import get_logger
-            logger = get_logger(__name__)
-            logger.error(f"Failed to load MCP config: {e}")
+            stat = os.stat(self.mcp_config_path)
+        except OSError:
             return []
+        return list(_load_mcp_servers(self.mcp_config_path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _load_mcp_servers(mcp_config_path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Read and normalize the MCP config file (see Settings.get_mcp_servers).
+
+    mtime_ns and size are only part of the cache key.
+    """
+    try:
+        data = Path(mcp_config_path).read_bytes()
+    except FileNotFoundError:
+        # Removed since it was stat'ed
+        return ()
+
+    try:
+        config = orjson.loads(data)
+
+        # Parse standard MCP format
+        if "mcpServers" not in config:
+            logger.error("Invalid MCP config: missing 'mcpServers' key")
+            return ()
+
+        servers = []
+        for server_name, server_config in config["mcpServers"].items():
+            # Validate required fields
+            if "command" not in server_config:
+                logger.error(f"MCP server '{server_name}' missing required 'command' field")
+                continue
+
+            # Normalize to internal format
+            normalized = {
+                "name": server_name,
+                "transport": "stdio",  # Default transport
+                "command": server_config["command"],
+                "args": server_config.get("args", []),
+                "env": server_config.get("env", {})
+            }
+            servers.append(normalized)
+
+        logger.info(f"Loaded {len(servers)} MCP server(s) from config")
+        return tuple(servers)
+
+    except Exception as e:
+        logger.error(f"Failed to load MCP config: {e}")
+        return ()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the global Settings instance once and reuse it afterwards.
+
+    Set SKIP_DOTENV in the process environment (e.g. in containers that
+    already receive every variable) to skip reading the .env file.
+    """
+    if os.getenv("SKIP_DOTENV"):
+        return Settings(_env_file=None)
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
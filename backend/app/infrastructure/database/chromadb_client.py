@@ -12,25 +12,34 @@ class ChromaDBClient:
     """ChromaDB vector database client manager."""
 
     client = None
+    _config = None  # (mode, path or host, port) the current client was built with
 
     @classmethod
     async def initialize(cls):
-        """Initialize ChromaDB client based on configuration."""
+        """Initialize ChromaDB client based on configuration; no-op if already initialized with it."""
+        if settings.chroma_mode == "embedded":
+            config = (settings.chroma_mode, settings.chroma_persist_directory, None)
+        else:
+            config = (settings.chroma_mode, settings.chroma_host, settings.chroma_port)
+        if cls.client is not None and cls._config == config:
+            logger.debug("ChromaDB already initialized")
+            return
+
         try:
             if settings.chroma_mode == "embedded":
                 logger.info(f"Initializing embedded ChromaDB at {settings.chroma_persist_directory}")
                 cls.client = chromadb.PersistentClient(
                     path=settings.chroma_persist_directory
                 )
-            elif settings.chroma_mode == "http":
+            else:
+                # chroma_mode is validated by Settings, so this is "http"
                 logger.info(f"Connecting to ChromaDB at {settings.chroma_host}:{settings.chroma_port}")
                 cls.client = chromadb.HttpClient(
                     host=settings.chroma_host,
                     port=settings.chroma_port
                 )
-            else:
-                raise ValueError(f"Invalid chroma_mode: {settings.chroma_mode}")
 
+            cls._config = config
             logger.info("ChromaDB initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize ChromaDB: {e}")
@@ -42,3 +51,4 @@ class ChromaDBClient:
         if cls.client:
             logger.info("Closing ChromaDB client")
             cls.client = None
+            cls._config = None
@@ -1,7 +1,7 @@
 # ABOUTME: LangGraph checkpointer setup and factory for MongoDB-based checkpoint storage
 # ABOUTME: Provides checkpointer instance for LangGraph graph compilation
 
-from typing import Tuple
+from typing import Optional, Tuple
 from langgraph.checkpoint.mongodb.aio import AsyncMongoDBSaver
 
 from app.infrastructure.config.settings import settings
@@ -9,6 +9,10 @@ from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Entered checkpointer context and instance, shared for the app lifetime
+_checkpointer_context = None
+_checkpointer: Optional[AsyncMongoDBSaver] = None
+
 
 async def get_checkpointer() -> Tuple[AsyncMongoDBSaver, AsyncMongoDBSaver]:
     """
@@ -16,12 +20,18 @@ async def get_checkpointer() -> Tuple[AsyncMongoDBSaver, AsyncMongoDBSaver]:
 
     Uses from_conn_string() as per LangGraph documentation and manually enters
     the async context manager to keep the checkpointer alive for the application lifetime.
+    The context is entered once; later calls return the same pair until
+    shutdown_checkpointer() is called.
 
     Returns:
         Tuple of (context_manager, checkpointer_instance):
         - context_manager: The async context manager for proper cleanup on shutdown
         - checkpointer_instance: The actual AsyncMongoDBSaver to use for checkpointing
     """
+    global _checkpointer_context, _checkpointer
+    if _checkpointer is not None:
+        return _checkpointer_context, _checkpointer
+
     logger.info("Creating LangGraph AsyncMongoDBSaver checkpointer")
 
     # Use from_conn_string as shown in LangGraph documentation
@@ -32,4 +42,16 @@ async def get_checkpointer() -> Tuple[AsyncMongoDBSaver, AsyncMongoDBSaver]:
     # Enter the context and return both the context and the actual checkpointer
     checkpointer_instance = await checkpointer_context.__aenter__()
 
+    _checkpointer_context, _checkpointer = checkpointer_context, checkpointer_instance
     return checkpointer_context, checkpointer_instance
+
+
+async def shutdown_checkpointer() -> None:
+    """Exit the checkpointer context entered by get_checkpointer(), if any."""
+    global _checkpointer_context, _checkpointer
+    if _checkpointer_context is None:
+        return
+
+    context = _checkpointer_context
+    _checkpointer_context, _checkpointer = None, None
+    await context.__aexit__(None, None, None)
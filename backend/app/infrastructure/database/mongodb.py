@@ -2,7 +2,9 @@
 # ABOUTME: Handles database connection lifecycle and document model registration for both App and LangGraph databases
 
 from typing import List, Type
-from motor.motor_asyncio import AsyncIOMotorClient
+# PyMongo's native asyncio client; Motor ran every operation on a thread pool
+from pymongo import AsyncMongoClient
+from pymongo import monitoring
 from beanie import Document, init_beanie
 
 from app.infrastructure.config.settings import settings
@@ -11,10 +13,83 @@ from app.infrastructure.config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Tracks connection pool usage and logs pool health events.
+
+    Keeps running counts of open and checked-out connections so pool
+    pressure shows up in the logs when a checkout fails or a pool is cleared.
+    """
+
+    def __init__(self):
+        self.open_connections = 0
+        self.checked_out = 0
+
+    def pool_created(self, event) -> None:
+        logger.info(f"MongoDB connection pool created for {event.address}")
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        logger.warning(
+            f"MongoDB connection pool cleared for {event.address} "
+            f"(open={self.open_connections}, checked_out={self.checked_out})"
+        )
+
+    def pool_closed(self, event) -> None:
+        logger.info(f"MongoDB connection pool closed for {event.address}")
+
+    def connection_created(self, event) -> None:
+        self.open_connections += 1
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        self.open_connections -= 1
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def connection_check_out_failed(self, event) -> None:
+        logger.warning(
+            f"MongoDB connection checkout failed for {event.address}: {event.reason} "
+            f"(open={self.open_connections}, checked_out={self.checked_out})"
+        )
+
+    def connection_checked_out(self, event) -> None:
+        self.checked_out += 1
+
+    def connection_checked_in(self, event) -> None:
+        self.checked_out -= 1
+
+
+pool_stats = PoolStatsListener()
+
+
+def _pool_options() -> dict:
+    """Connection pool options shared by both MongoDB clients."""
+    return {
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+        "waitQueueTimeoutMS": settings.mongodb_wait_queue_timeout_ms,
+        # Caps concurrent connection establishment so a burst cannot storm the server
+        "maxConnecting": settings.mongodb_max_connecting,
+        "event_listeners": [pool_stats],
+    }
+
+
+async def _warm_up(client: AsyncMongoClient) -> None:
+    """Ping the server so discovery and the first pooled connections happen at startup."""
+    await client.admin.command("ping")
+
+
 class AppDatabase:
     """Application database connection manager for users and conversations metadata."""
 
-    client: AsyncIOMotorClient = None
+    client: AsyncMongoClient = None
     database = None
 
     @classmethod
@@ -27,7 +102,8 @@ class AppDatabase:
         """
         try:
             logger.info(f"Connecting to App Database at {settings.mongodb_app_url}")
-            cls.client = AsyncIOMotorClient(settings.mongodb_app_url)
+            cls.client = AsyncMongoClient(settings.mongodb_app_url, **_pool_options())
+            await _warm_up(cls.client)
             cls.database = cls.client[settings.mongodb_app_db_name]
 
             await init_beanie(
@@ -45,13 +121,13 @@ class AppDatabase:
         """Close the App Database connection."""
         if cls.client:
             logger.info("Closing App Database connection")
-            cls.client.close()
+            await cls.client.close()
 
 
 class LangGraphDatabase:
     """LangGraph database connection manager for checkpoints and message history."""
 
-    client: AsyncIOMotorClient = None
+    client: AsyncMongoClient = None
     database = None
 
     @classmethod
@@ -59,7 +135,8 @@ class LangGraphDatabase:
         """Connect to LangGraph database for checkpointing."""
         try:
             logger.info(f"Connecting to LangGraph Database at {settings.mongodb_langgraph_url}")
-            cls.client = AsyncIOMotorClient(settings.mongodb_langgraph_url)
+            cls.client = AsyncMongoClient(settings.mongodb_langgraph_url, **_pool_options())
+            await _warm_up(cls.client)
             cls.database = cls.client[settings.mongodb_langgraph_db_name]
 
             logger.info(f"Successfully connected to LangGraph Database: {settings.mongodb_langgraph_db_name}")
@@ -72,7 +149,7 @@ class LangGraphDatabase:
         """Close the LangGraph Database connection."""
         if cls.client:
             logger.info("Closing LangGraph Database connection")
-            cls.client.close()
+            await cls.client.close()
 
 
 # Backward compatibility alias
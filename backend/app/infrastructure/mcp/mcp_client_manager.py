@@ -2,15 +2,76 @@
 # ABOUTME: Follows ChromaDBClient singleton pattern for lifecycle management
 
 import asyncio
-from typing import Dict, List, Optional, Callable, Any
+from contextlib import AsyncExitStack
+from typing import Dict, List, Optional, Callable, Any, Tuple, Type
+import orjson
+from langchain_core.tools import StructuredTool
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from mcp.client.sse import sse_client
+from pydantic import BaseModel, create_model
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# URL prefixes MCP tool 'url' arguments are expected to carry
+_URL_SCHEMES = ('http://', 'https://')
+
+# Tool argument models by (tool name, fields), reused across reconnects
+_args_models: Dict[tuple, Type[BaseModel]] = {}
+
+
+def _args_model(tool_name: str, fields: Dict[str, tuple]) -> Type[BaseModel]:
+    """Return the argument model for a tool, building it only for unseen schemas."""
+    key = (tool_name, tuple(sorted(fields.items(), key=lambda item: item[0])))
+    model = _args_models.get(key)
+    if model is None:
+        model = _args_models[key] = create_model(f"{tool_name}Args", **fields)
+    return model
+
+
+def _make_mcp_tool_func(tool_name: str, mcp_session: ClientSession) -> Callable:
+    """Create the coroutine that calls an MCP tool; a factory so each tool keeps its own name and session."""
+    async def mcp_tool_func(**kwargs):
+        try:
+            # Preprocess arguments
+            processed_kwargs = {}
+            for k, v in kwargs.items():
+                if k == 'url' and isinstance(v, str) and not v.startswith(_URL_SCHEMES):
+                    processed_kwargs[k] = f'https://{v}'
+                else:
+                    processed_kwargs[k] = v
+
+            logger.info(f"MCP tool '{tool_name}' called with args: {processed_kwargs}")
+            result = await mcp_session.call_tool(tool_name, processed_kwargs)
+
+            # Extract text content from result
+            if result.content and len(result.content) > 0:
+                content = result.content[0]
+                if hasattr(content, 'text'):
+                    result_text = content.text
+                    logger.info(f"MCP tool '{tool_name}' returned {len(result_text)} characters")
+                    return result_text
+                else:
+                    result_str = _content_to_str(content)
+                    logger.info(f"MCP tool '{tool_name}' returned content (as string): {len(result_str)} characters")
+                    return result_str
+            else:
+                logger.warning(f"MCP tool '{tool_name}' returned empty content")
+                return ""
+        except Exception as e:
+            logger.error(f"MCP tool '{tool_name}' execution failed: {e}")
+            return f"Error: {str(e)}"
+    return mcp_tool_func
+
+
+def _content_to_str(content: Any) -> str:
+    """Render non-text MCP content as JSON when it is a pydantic model, else via str()."""
+    if isinstance(content, BaseModel):
+        return orjson.dumps(content.model_dump(mode="json")).decode()
+    return str(content)
+
 
 class MCPClientManager:
     """Manages MCP client connections and tool discovery."""
@@ -18,8 +79,10 @@ class MCPClientManager:
     _instance = None
     _clients: Dict[str, ClientSession] = {}
     _tools: List[Callable] = []
-    _client_contexts: List[Any] = []
-    _session_contexts: List[Any] = []
+    # Read-only view of _tools handed out by get_tools, rebuilt when _tools changes
+    _tools_snapshot: Tuple[Callable, ...] = ()
+    # One exit stack per server, holding its transport and session contexts
+    _exit_stacks: List[AsyncExitStack] = []
 
     def __new__(cls):
         if cls._instance is None:
@@ -40,20 +103,29 @@ class MCPClientManager:
 
         logger.info(f"Initializing {len(mcp_servers)} MCP server(s)")
 
-        for server_config in mcp_servers:
-            try:
+        # Connect to all servers concurrently so startup waits for the slowest
+        # server rather than the sum of all of them
+        results = await asyncio.gather(
+            *(
                 # Add timeout to prevent hanging
-                await asyncio.wait_for(
+                asyncio.wait_for(
                     cls._connect_server(server_config),
                     timeout=10.0  # 10 second timeout
                 )
-            except asyncio.TimeoutError:
+                for server_config in mcp_servers
+            ),
+            return_exceptions=True
+        )
+
+        for server_config, result in zip(mcp_servers, results):
+            if isinstance(result, asyncio.TimeoutError):
                 logger.error(f"Timeout connecting to MCP server '{server_config.get('name')}' after 10 seconds")
                 # Continue with other servers (graceful degradation)
-            except Exception as e:
-                logger.error(f"Failed to connect to MCP server '{server_config.get('name')}': {e}")
+            elif isinstance(result, Exception):
+                logger.error(f"Failed to connect to MCP server '{server_config.get('name')}': {result}")
                 # Continue with other servers (graceful degradation)
 
+        cls._tools_snapshot = tuple(cls._tools)
         logger.info(f"MCP initialization complete. {len(cls._tools)} tools available")
 
     @classmethod
@@ -64,49 +136,36 @@ class MCPClientManager:
 
         logger.info(f"Connecting to MCP server '{server_name}' via {transport}")
 
-        # Create server parameters based on transport type
+        transport_context = cls._open_transport(server_config, transport)
+        if transport_context is None:
+            logger.error(f"Unsupported transport: {transport}")
+            return
+
+        # Keep transport and session alive until shutdown; registered before
+        # entering so partially opened servers are closed too
+        stack = AsyncExitStack()
+        cls._exit_stacks.append(stack)
+        read, write = await stack.enter_async_context(transport_context)
+        session = await stack.enter_async_context(ClientSession(read, write))
+
+        await session.initialize()
+
+        cls._clients[server_name] = session
+        await cls._discover_tools(session, server_name)
+
+    @staticmethod
+    def _open_transport(server_config: dict, transport: str) -> Optional[Any]:
+        """Build the (not yet entered) transport context for a server, or None if unsupported."""
         if transport == "stdio":
-            # Stdio transport
             params = StdioServerParameters(
                 command=server_config["command"],
                 args=server_config.get("args", []),
                 env=server_config.get("env", None)
             )
-
-            # Keep session alive by storing context managers
-            stdio_context = stdio_client(params)
-            read, write = await stdio_context.__aenter__()
-            cls._client_contexts.append(stdio_context)
-
-            # Also keep ClientSession as context manager
-            session_obj = ClientSession(read, write)
-            session = await session_obj.__aenter__()
-            cls._session_contexts.append((session_obj, session))
-
-            await session.initialize()
-
-            cls._clients[server_name] = session
-            await cls._discover_tools(session, server_name)
-
-        elif transport == "sse":
-            # SSE transport
-            url = server_config["url"]
-            sse_context = sse_client(url)
-            read, write = await sse_context.__aenter__()
-            cls._client_contexts.append(sse_context)
-
-            # Also keep ClientSession as context manager
-            session_obj = ClientSession(read, write)
-            session = await session_obj.__aenter__()
-            cls._session_contexts.append((session_obj, session))
-
-            await session.initialize()
-
-            cls._clients[server_name] = session
-            await cls._discover_tools(session, server_name)
-
-        else:
-            logger.error(f"Unsupported transport: {transport}")
+            return stdio_client(params)
+        if transport == "sse":
+            return sse_client(server_config["url"])
+        return None
 
     @classmethod
     async def _discover_tools(cls, session: ClientSession, server_name: str) -> None:
@@ -114,16 +173,11 @@ class MCPClientManager:
         try:
             # Get tool definitions from MCP server
             tools_response = await session.list_tools()
-            
+
             for tool_def in tools_response.tools:
-                # Create a LangChain StructuredTool
-                from langchain_core.tools import StructuredTool
-                from pydantic import create_model
-                import json
-                
                 # Create Pydantic model for tool arguments from inputSchema
+                fields = {}
                 if tool_def.inputSchema and tool_def.inputSchema.get('properties'):
-                    fields = {}
                     for prop_name, prop_def in tool_def.inputSchema['properties'].items():
                         # Simple type mapping - could be improved
                         if prop_def.get('type') == 'string':
@@ -136,49 +190,12 @@ class MCPClientManager:
                             fields[prop_name] = (bool, ...)
                         else:
                             fields[prop_name] = (str, ...)  # Default to string
-                    
-                    ArgsModel = create_model(f"{tool_def.name}Args", **fields)
-                else:
-                    ArgsModel = create_model(f"{tool_def.name}Args")  # Empty model
-                
-                # Create async function that calls the MCP tool
-                # Use factory function to properly capture tool_name in closure
-                def make_mcp_tool_func(tool_name: str, mcp_session: ClientSession):
-                    async def mcp_tool_func(**kwargs):
-                        try:
-                            # Preprocess arguments
-                            processed_kwargs = {}
-                            for k, v in kwargs.items():
-                                if k == 'url' and isinstance(v, str) and not v.startswith(('http://', 'https://')):
-                                    processed_kwargs[k] = f'https://{v}'
-                                else:
-                                    processed_kwargs[k] = v
-
-                            logger.info(f"MCP tool '{tool_name}' called with args: {processed_kwargs}")
-                            result = await mcp_session.call_tool(tool_name, processed_kwargs)
-
-                            # Extract text content from result
-                            if result.content and len(result.content) > 0:
-                                content = result.content[0]
-                                if hasattr(content, 'text'):
-                                    result_text = content.text
-                                    logger.info(f"MCP tool '{tool_name}' returned {len(result_text)} characters")
-                                    return result_text
-                                else:
-                                    result_str = str(content)
-                                    logger.info(f"MCP tool '{tool_name}' returned content (as string): {len(result_str)} characters")
-                                    return result_str
-                            else:
-                                logger.warning(f"MCP tool '{tool_name}' returned empty content")
-                                return ""
-                        except Exception as e:
-                            logger.error(f"MCP tool '{tool_name}' execution failed: {e}")
-                            return f"Error: {str(e)}"
-                    return mcp_tool_func
+
+                ArgsModel = _args_model(tool_def.name, fields)
 
                 # Create StructuredTool with async coroutine
                 tool = StructuredTool.from_function(
-                    coroutine=make_mcp_tool_func(tool_def.name, session),
+                    coroutine=_make_mcp_tool_func(tool_def.name, session),
                     name=tool_def.name,
                     description=tool_def.description or f"MCP tool: {tool_def.name}",
                     args_schema=ArgsModel
@@ -192,9 +209,9 @@ class MCPClientManager:
             # Continue gracefully (no tools from this server)
 
     @classmethod
-    def get_tools(cls) -> List[Callable]:
-        """Return all discovered MCP tools as Python callables."""
-        return cls._tools.copy()
+    def get_tools(cls) -> Tuple[Callable, ...]:
+        """Return all discovered MCP tools as an immutable tuple, without copying."""
+        return cls._tools_snapshot
 
     @classmethod
     async def shutdown(cls) -> None:
@@ -204,22 +221,17 @@ class MCPClientManager:
         # Clear references first to prevent new operations
         cls._clients.clear()
         cls._tools.clear()
+        cls._tools_snapshot = ()
+
+        # Each stack closes its session before its transport; servers are
+        # independent, so close them concurrently
+        stacks, cls._exit_stacks = cls._exit_stacks, []
+        results = await asyncio.gather(
+            *(stack.aclose() for stack in stacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing MCP server connection: {result}")
 
-        # Close session contexts first (inner context)
-        for session_obj, session in cls._session_contexts:
-            try:
-                await session_obj.__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"Error closing MCP session context: {e}")
-
-        # Close client contexts (outer context)
-        for context in cls._client_contexts:
-            try:
-                await context.__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"Error closing MCP client context: {e}")
-
-        # Clear context lists after attempting cleanup
-        cls._client_contexts.clear()
-        cls._session_contexts.clear()
         logger.info("MCP client manager shutdown complete")
@@ -1,10 +1,13 @@
 # ABOUTME: Authentication service implementation handling password hashing and JWT tokens
-# ABOUTME: Implements IAuthService port interface using bcrypt and python-jose
+# ABOUTME: Implements IAuthService port interface using bcrypt and PyJWT
 
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+import jwt
+from jwt import InvalidTokenError
+import bcrypt
 
 from app.core.ports.auth_service import IAuthService
 from app.core.ports.user_repository import IUserRepository
@@ -14,7 +17,19 @@ from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Verified tokens shared by every AuthService instance: token digest -> (user ID, monotonic expiry).
+# One of three auth caches, each skipping a different cost:
+# - this cache: JWT signature check and decode, on every authenticated request
+# - CachingUserRepository (USER_CACHE_*): the user lookup that follows it in get_current_user
+# - HmacVerifiedCredentialCache (CREDENTIAL_CACHE_*): bcrypt, on repeat logins only
+# Tokens are stateless and there is no logout or revocation, so an entry is
+# never more valid than the token itself: it expires with the token's exp.
+_verified_tokens: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+
+
+def _token_key(token: str) -> bytes:
+    """Digest used as cache key so raw tokens are not kept in memory."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 class AuthService(IAuthService):
@@ -35,7 +50,8 @@ class AuthService(IAuthService):
         Returns:
             Bcrypt hashed password
         """
-        return pwd_context.hash(password)
+        salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+        return bcrypt.hashpw(password.encode(), salt).decode()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -48,7 +64,7 @@ class AuthService(IAuthService):
         Returns:
             True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
     def create_access_token(self, user_id: str) -> str:
         """
@@ -60,7 +76,8 @@ class AuthService(IAuthService):
         Returns:
             JWT access token
         """
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        # NumericDate (epoch seconds), as the JWT spec defines exp
+        expire = int(time.time()) + settings.access_token_expire_minutes * 60
         to_encode = {
             "sub": user_id,
             "exp": expire,
@@ -78,17 +95,39 @@ class AuthService(IAuthService):
 
         Returns:
             User ID if token is valid, None otherwise
+
+        Valid tokens are cached for up to TOKEN_CACHE_TTL_SECONDS (never past
+        their expiry), so repeat requests skip signature verification.
+        Failures are never cached.
         """
+        ttl = settings.token_cache_ttl_seconds
+        key = _token_key(token) if ttl > 0 else None
+        if key is not None:
+            entry = _verified_tokens.get(key)
+            if entry is not None:
+                user_id, expires_at = entry
+                if expires_at > time.monotonic():
+                    _verified_tokens.move_to_end(key)
+                    return user_id
+                del _verified_tokens[key]
+
         try:
             payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
             user_id: str = payload.get("sub")
             if user_id is None:
                 return None
-            return user_id
-        except JWTError as e:
+        except InvalidTokenError as e:
             logger.warning(f"JWT verification failed: {e}")
             return None
 
+        if key is not None:
+            lifetime = min(ttl, payload.get("exp", float("inf")) - time.time())
+            if lifetime > 0:
+                _verified_tokens[key] = (user_id, time.monotonic() + lifetime)
+                while len(_verified_tokens) > settings.token_cache_max_size:
+                    _verified_tokens.popitem(last=False)
+        return user_id
+
     async def get_current_user(self, token: str, user_repository: IUserRepository) -> Optional[User]:
         """
         Get the current user from a JWT token.
@@ -0,0 +1,73 @@
+# ABOUTME: HMAC-keyed verified-credential cache implementing the credential cache port
+# ABOUTME: Lets repeat logins skip bcrypt without ever holding plain passwords
+
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Optional
+
+from app.core.domain.user import User
+from app.core.ports.cache_backend import ICacheBackend
+from app.core.ports.credential_cache import IVerifiedCredentialCache
+from app.infrastructure.config.settings import settings
+
+
+class HmacVerifiedCredentialCache(IVerifiedCredentialCache):
+    """
+    Verified-credential cache storing one HMAC digest per user.
+
+    The digest covers the user's stored password hash and the supplied
+    password, keyed with a server secret, so a password change invalidates
+    the entry on its own and a leaked cache reveals nothing usable.
+    Digests are compared in constant time.
+    """
+
+    def __init__(self, secret: str, backend: ICacheBackend):
+        """
+        Initialize the cache.
+
+        Args:
+            secret: Server secret used as the HMAC key
+            backend: Cache backend holding one digest per user ID
+        """
+        self._key = hashlib.sha256(f"credential-cache|{secret}".encode()).digest()
+        self.backend = backend
+
+    def _digest(self, user: User, password: str) -> bytes:
+        """HMAC of the user's password hash and the supplied password."""
+        message = f"{user.id}|{user.hashed_password}|{password}".encode()
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    async def is_verified(self, user: User, password: str) -> bool:
+        """Check for a cached successful verification in constant time."""
+        cached = await self.backend.get(user.id)
+        if cached is None:
+            return False
+        return hmac.compare_digest(cached, self._digest(user, password))
+
+    async def remember(self, user: User, password: str) -> None:
+        """Cache a successful verification."""
+        await self.backend.set(user.id, self._digest(user, password))
+
+    async def invalidate(self, user_id: str) -> None:
+        """Forget any cached verification for a user."""
+        await self.backend.delete(user_id)
+
+
+@lru_cache(maxsize=1)
+def get_credential_cache() -> Optional[IVerifiedCredentialCache]:
+    """
+    Get the process-wide verified-credential cache.
+
+    Returns None when CREDENTIAL_CACHE_TTL_SECONDS is 0.
+    """
+    if settings.credential_cache_ttl_seconds <= 0:
+        return None
+
+    from app.infrastructure.cache.in_memory_cache import InMemoryCacheBackend
+
+    backend = InMemoryCacheBackend(
+        max_size=settings.credential_cache_max_size,
+        ttl_seconds=settings.credential_cache_ttl_seconds
+    )
+    return HmacVerifiedCredentialCache(settings.secret_key, backend)
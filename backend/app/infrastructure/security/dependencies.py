@@ -6,6 +6,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.domain.user import User
+from app.core.ports.user_repository import IUserRepository
+from app.adapters.outbound.repositories.user_repository_factory import get_user_repository
 from app.infrastructure.security.auth_service import AuthService
 from app.infrastructure.config.logging_config import get_logger
 
@@ -18,12 +20,14 @@ auth_service = AuthService()
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
+    user_repository: Annotated[IUserRepository, Depends(get_user_repository)],
 ) -> User:
     """
     Dependency to get the current authenticated user.
 
     Args:
         token: JWT access token from OAuth2PasswordBearer
+        user_repository: Process-wide user repository (overridable in tests)
 
     Returns:
         Current user entity
@@ -31,10 +35,6 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    from app.adapters.outbound.repositories.mongo_user_repository import MongoUserRepository
-
-    user_repository = MongoUserRepository()
-
     user = await auth_service.get_current_user(token, user_repository)
 
     if user is None:
@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import WebSocket, WebSocketException, status
 from app.core.domain.user import User
 from app.infrastructure.security.auth_service import AuthService
-from app.adapters.outbound.repositories.mongo_user_repository import MongoUserRepository
+from app.adapters.outbound.repositories.user_repository_factory import get_user_repository
 from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -32,15 +32,14 @@ async def get_user_from_websocket(websocket: WebSocket) -> Optional[User]:
     Raises:
         WebSocketException: If authentication fails
     """
-    token = None
-
-    if "token" in websocket.query_params:
-        token = websocket.query_params["token"]
+    token = websocket.query_params.get("token")
+    if token:
         logger.debug("Token extracted from query parameters")
-    elif "authorization" in websocket.headers:
-        auth_header = websocket.headers["authorization"]
-        if auth_header.startswith("Bearer "):
-            token = auth_header.replace("Bearer ", "")
+    else:
+        auth_header = websocket.headers.get("authorization", "")
+        # Auth scheme names are case-insensitive; only the leading prefix is removed
+        if auth_header[:7].lower() == "bearer ":
+            token = auth_header[7:].strip()
             logger.debug("Token extracted from Authorization header")
 
     if not token:
@@ -50,7 +49,7 @@ async def get_user_from_websocket(websocket: WebSocket) -> Optional[User]:
             reason="Authentication token required"
         )
 
-    user_repository = MongoUserRepository()
+    user_repository = get_user_repository()
 
     try:
         user = await auth_service.get_current_user(token, user_repository)
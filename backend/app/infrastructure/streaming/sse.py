@@ -0,0 +1,9 @@
+# ABOUTME: Server-Sent Events framing shared by streaming HTTP endpoints
+# ABOUTME: Encodes JSON payloads as SSE data frames with orjson
+
+import orjson
+
+
+def sse_event(payload: dict) -> bytes:
+    """Encode a payload as a Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
@@ -0,0 +1,92 @@
+# ABOUTME: Coalesces token streams into time-windowed chunks to cut per-chunk overhead
+# ABOUTME: Used by the WebSocket and SSE chat endpoints so clients get fewer, larger writes
+
+import asyncio
+from typing import Any, AsyncGenerator, AsyncIterable
+
+# Marks the end of the source stream in the internal queue
+_END = object()
+
+
+async def coalesce_tokens(
+    tokens: AsyncIterable[Any],
+    flush_interval_ms: int = 50
+) -> AsyncGenerator[Any, None]:
+    """
+    Re-chunk a token stream into batches flushed at most every flush_interval_ms.
+
+    The first token is yielded immediately so time-to-first-token is
+    unchanged; later tokens are buffered and joined into one chunk per
+    window. A window is flushed when it expires even if the source stalls,
+    and whatever is buffered is drained when the source ends. Non-string
+    items (e.g. structured content blocks) flush the buffer and are passed
+    through as-is.
+
+    Args:
+        tokens: Source stream of tokens
+        flush_interval_ms: Flush window in milliseconds; 0 or less disables batching
+
+    Yields:
+        Coalesced chunks of text, in source order
+
+    Raises:
+        Exception: Any error raised by the source stream, after buffered text is flushed
+    """
+    if flush_interval_ms <= 0:
+        async for token in tokens:
+            yield token
+        return
+
+    interval = flush_interval_ms / 1000
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        # Pull from the source in its own task so a stalled source cannot hold back a due flush
+        try:
+            async for token in tokens:
+                queue.put_nowait(token)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_END)
+
+    producer = asyncio.create_task(pump())
+    buffer = []
+    deadline = None
+    first = True
+
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield "".join(buffer)
+                buffer.clear()
+                deadline = None
+                continue
+
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                if buffer:
+                    yield "".join(buffer)
+                raise item
+            if first or not isinstance(item, str):
+                first = False
+                if buffer:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    deadline = None
+                yield item
+                continue
+
+            buffer.append(item)
+            if deadline is None:
+                deadline = loop.time() + interval
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        producer.cancel()
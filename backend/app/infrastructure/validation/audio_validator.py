@@ -8,13 +8,17 @@ from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-SUPPORTED_MIME_TYPES = {
+SUPPORTED_MIME_TYPES = frozenset({
     "audio/webm",
     "audio/wav",
     "audio/mpeg",  # mp3
     "audio/mp4",   # m4a
     "audio/ogg",
-}
+})
+
+# libmagic only needs the container header to identify the format
+MAGIC_HEADER_BYTES = 4096
+READ_CHUNK_BYTES = 1024 * 1024
 
 
 async def validate_audio_file(audio_file: UploadFile) -> bytes:
@@ -34,19 +38,14 @@ async def validate_audio_file(audio_file: UploadFile) -> bytes:
             detail=f"Unsupported format: {audio_file.content_type}"
         )
 
-    # Read content
-    content = await audio_file.read()
-
-    # Validate file size
+    # Reject by declared size before reading anything
     max_size = settings.transcription_max_file_size_mb * 1024 * 1024
-    if len(content) > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File exceeds {settings.transcription_max_file_size_mb}MB"
-        )
+    if audio_file.size is not None and audio_file.size > max_size:
+        _raise_too_large()
 
-    # Validate magic number
-    file_type = magic.from_buffer(content, mime=True)
+    # Validate magic number from the header only
+    header = await audio_file.read(MAGIC_HEADER_BYTES)
+    file_type = magic.from_buffer(header, mime=True)
     logger.info(f"Detected MIME type from magic bytes: {file_type}")
 
     # WebM can be detected as video/webm even for audio-only files
@@ -58,8 +57,26 @@ async def validate_audio_file(audio_file: UploadFile) -> bytes:
     if file_type not in SUPPORTED_MIME_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type mismatch: expected one of {SUPPORTED_MIME_TYPES}, got {file_type}"
+            detail=f"File type mismatch: expected one of {set(SUPPORTED_MIME_TYPES)}, got {file_type}"
         )
 
+    # Read the rest in chunks, stopping as soon as the size limit is passed
+    chunks = [header]
+    total = len(header)
+    while chunk := await audio_file.read(READ_CHUNK_BYTES):
+        total += len(chunk)
+        if total > max_size:
+            _raise_too_large()
+        chunks.append(chunk)
+    content = b"".join(chunks)
+
     logger.info(f"Audio validation passed: {audio_file.filename}")
     return content
+
+
+def _raise_too_large() -> None:
+    """Reject an upload over transcription_max_file_size_mb."""
+    raise HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds {settings.transcription_max_file_size_mb}MB"
+    )
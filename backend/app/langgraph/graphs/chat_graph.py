@@ -9,9 +9,7 @@ from app.langgraph.state import ConversationState
 from app.langgraph.nodes.process_input import process_user_input
 from app.langgraph.nodes.call_llm import call_llm
 from app.infrastructure.config.logging_config import get_logger
-from app.langgraph.tools.multiply import multiply
-from app.langgraph.tools.add import add
-from app.langgraph.tools.rag_search import rag_search
+from app.langgraph.tools import default_tool_node
 
 
 logger = get_logger(__name__)
@@ -40,14 +38,13 @@ def create_chat_graph(checkpointer: AsyncMongoDBSaver, tools: Optional[List[Call
 
     graph_builder = StateGraph(ConversationState)
 
-    if tools is None:
-        # Default to local tools
-        tools = [multiply, add, rag_search]
+    # Default to local tools, sharing one prebuilt ToolNode
+    tool_node = default_tool_node() if tools is None else ToolNode(tools)
 
     # Add nodes (no format_response, no save_history - automatic now)
     graph_builder.add_node("process_input", process_user_input)
     graph_builder.add_node("call_llm", call_llm)
-    graph_builder.add_node("tools", ToolNode(tools))
+    graph_builder.add_node("tools", tool_node)
 
     # Define edges
     graph_builder.add_edge(START, "process_input")
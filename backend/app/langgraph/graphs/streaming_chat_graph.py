@@ -8,9 +8,7 @@ from langgraph.prebuilt import ToolNode, tools_condition
 from app.langgraph.state import ConversationState
 from app.langgraph.nodes.process_input import process_user_input
 from app.langgraph.nodes.call_llm import call_llm
-from app.langgraph.tools.multiply import multiply
-from app.langgraph.tools.add import add
-from app.langgraph.tools.rag_search import rag_search
+from app.langgraph.tools import default_tool_node
 from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -42,14 +40,13 @@ def create_streaming_chat_graph(checkpointer: AsyncMongoDBSaver, tools: Optional
 
     graph_builder = StateGraph(ConversationState)
 
-    if tools is None:
-        # Default to local tools
-        tools = [multiply, add, rag_search]
+    # Default to local tools, sharing one prebuilt ToolNode
+    tool_node = default_tool_node() if tools is None else ToolNode(tools)
 
     # Add nodes (streaming handled by astream_events at invocation level)
     graph_builder.add_node("process_input", process_user_input)
     graph_builder.add_node("call_llm", call_llm)
-    graph_builder.add_node("tools", ToolNode(tools))
+    graph_builder.add_node("tools", tool_node)
 
     # Define edges
     graph_builder.add_edge(START, "process_input")
@@ -1,29 +1,105 @@
 # ABOUTME: Node for invoking the LLM provider to generate responses
 # ABOUTME: Uses LangChain BaseMessage types for LLM communication
 
+import hashlib
+from typing import List
+
 from langgraph.types import RunnableConfig
-from langchain_core.messages import AIMessage
+from langchain_core.callbacks import adispatch_custom_event
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from app.core.domain.token_usage import TokenUsage
 from app.langgraph.state import ConversationState
-from app.langgraph.tools.multiply import multiply
-from app.langgraph.tools.add import add
-from app.langgraph.tools.rag_search import rag_search
+from app.langgraph.tools import DEFAULT_TOOLS
+from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Custom stream event carrying an answer served from the semantic cache
+SEMANTIC_CACHE_HIT_EVENT = "semantic_cache_hit"
+
+
+def history_window(messages: List[BaseMessage], window: int) -> List[BaseMessage]:
+    """
+    Select the messages sent to the LLM for one turn.
+
+    Leading system messages are always kept as a stable prefix (so provider
+    prefix caches keep hitting), followed by the most recent `window`
+    messages. The window always starts on a user message: it is moved
+    forward to the next HumanMessage, since providers reject histories
+    that open with an assistant reply or an orphaned tool result. If the
+    current turn alone is longer than the window, the whole turn is kept.
+
+    Args:
+        messages: Full conversation history from the graph state
+        window: Number of recent messages to keep; 0 or less keeps everything
+
+    Returns:
+        The bounded message list
+    """
+    if window <= 0 or len(messages) <= window:
+        return messages
+
+    prefix_end = 0
+    while prefix_end < len(messages) and isinstance(messages[prefix_end], SystemMessage):
+        prefix_end += 1
+
+    start = max(prefix_end, len(messages) - window)
+    human = next(
+        (i for i in range(start, len(messages)) if isinstance(messages[i], HumanMessage)), None
+    )
+    if human is None:
+        # No user message in the window: go back to where the current turn began
+        human = next(
+            (i for i in range(start - 1, prefix_end - 1, -1) if isinstance(messages[i], HumanMessage)),
+            prefix_end
+        )
+    start = human
+
+    return messages[:prefix_end] + messages[start:]
+
+
+def semantic_cache_scope(conversation_id: str, messages: List[BaseMessage]) -> str:
+    """
+    Build the semantic cache scope for the prompt at the end of messages.
+
+    The scope is the conversation plus the assistant reply that preceded
+    the prompt, so a short follow-up such as "yes" or "explain more" only
+    reuses an answer given in the same context.
+
+    Args:
+        conversation_id: Conversation the prompt belongs to
+        messages: Conversation history ending with the prompt
+
+    Returns:
+        Scope string for ISemanticCache lookup and store
+    """
+    previous = next(
+        (m.content for m in reversed(messages[:-1]) if isinstance(m, AIMessage) and m.content),
+        ""
+    )
+    digest = hashlib.blake2b(str(previous).encode(), digest_size=16).hexdigest()
+    return f"{conversation_id}:{digest}"
+
 
 async def call_llm(state: ConversationState, config: RunnableConfig) -> dict:
     """
     Call the LLM provider to generate a response.
 
     This node:
+    - Answers from the semantic cache when a near-duplicate prompt was
+      already answered in this conversation after the same assistant reply
+      (and emits the answer as a custom stream event, since no model
+      tokens are streamed)
     - Retrieves the LLM provider from RunnableConfig
-    - Invokes the LLM with the message history (List[BaseMessage])
+    - Invokes the LLM with the recent message history (List[BaseMessage]),
+      bounded by settings.llm_history_window
     - Returns an AIMessage with the generated response
 
     Args:
         state: Current conversation state with messages (List[BaseMessage])
-        config: RunnableConfig containing llm_provider in configurable dict
+        config: RunnableConfig containing llm_provider (and optionally
+                semantic_cache) in configurable dict
 
     Returns:
         Dictionary with messages list containing the AIMessage response
@@ -31,13 +107,33 @@ async def call_llm(state: ConversationState, config: RunnableConfig) -> dict:
     messages = state["messages"]
     conversation_id = state["conversation_id"]
 
-    logger.info(f"Calling LLM for conversation {conversation_id} with {len(messages)} messages")
+    # Only a fresh user prompt can be answered from (or stored in) the semantic cache;
+    # turns following tool results depend on more than the prompt text
+    semantic_cache = config["configurable"].get("semantic_cache")
+    prompt = None
+    cache_scope = None
+    if (
+        semantic_cache is not None
+        and messages
+        and isinstance(messages[-1], HumanMessage)
+        and isinstance(messages[-1].content, str)
+    ):
+        prompt = messages[-1].content
+        cache_scope = semantic_cache_scope(conversation_id, messages)
+        cached = await semantic_cache.lookup(
+            prompt, scope=cache_scope, threshold=settings.semantic_cache_threshold
+        )
+        if cached is not None:
+            logger.info(f"Semantic cache hit for conversation {conversation_id}")
+            await adispatch_custom_event(SEMANTIC_CACHE_HIT_EVENT, cached, config=config)
+            return {
+                "messages": [AIMessage(content=cached)]
+            }
 
-    # Get local Python tools
-    local_tools = [multiply, add, rag_search]
+    logger.info(f"Calling LLM for conversation {conversation_id} with {len(messages)} messages")
 
     # Get MCP tools from manager
-    mcp_tools = []
+    mcp_tools = ()
     try:
         from app.infrastructure.mcp import MCPClientManager
         mcp_manager = MCPClientManager()
@@ -48,16 +144,35 @@ async def call_llm(state: ConversationState, config: RunnableConfig) -> dict:
         logger.warning(f"Failed to load MCP tools: {e}")
 
     # Combine all tools
-    all_tools = local_tools + mcp_tools
+    all_tools = [*DEFAULT_TOOLS, *mcp_tools]
 
     # Get LLM provider from config
     llm_provider = config["configurable"]["llm_provider"]
     llm_provider_with_tools = llm_provider.bind_tools(all_tools, parallel_tool_calls=False)
 
     # Generate response (llm_provider_with_tools.generate should work with BaseMessage types)
-    ai_message = await llm_provider_with_tools.generate(messages)
+    ai_message = await llm_provider_with_tools.generate(
+        history_window(messages, settings.llm_history_window)
+    )
+
+    usage = TokenUsage.from_message(ai_message)
+    if usage is not None:
+        logger.info(
+            f"LLM response generated for conversation {conversation_id} "
+            f"(prompt={usage.prompt_tokens}, completion={usage.completion_tokens}, "
+            f"cached={usage.cached_tokens} tokens)"
+        )
+    else:
+        logger.info(f"LLM response generated for conversation {conversation_id}")
 
-    logger.info(f"LLM response generated for conversation {conversation_id}")
+    # Tool-calling turns are not final answers, so only plain text replies are cached
+    if (
+        prompt is not None
+        and not getattr(ai_message, "tool_calls", None)
+        and isinstance(ai_message.content, str)
+        and ai_message.content
+    ):
+        await semantic_cache.store(prompt, ai_message.content, scope=cache_scope)
 
     return {
         "messages": [ai_message]
@@ -28,11 +28,13 @@ async def get_conversation_messages(graph, conversation_id: str) -> List[BaseMes
             configurable={"thread_id": conversation_id}
         )
 
-        # Get state from checkpoint
-        state = await graph.aget_state(config)
-
-        # Extract messages from state
-        messages = state.values.get("messages", [])
+        # Read the latest checkpoint directly; graph.aget_state would also
+        # compute pending tasks and interrupts, which a history read never needs
+        checkpoint_tuple = await graph.checkpointer.aget_tuple(config)
+        if checkpoint_tuple is None:
+            messages = []
+        else:
+            messages = checkpoint_tuple.checkpoint["channel_values"].get("messages", [])
 
         logger.info(f"Retrieved {len(messages)} messages for conversation {conversation_id}")
         
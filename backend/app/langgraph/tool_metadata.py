@@ -3,7 +3,7 @@
 
 from enum import Enum
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ToolSource(str, Enum):
@@ -18,8 +18,7 @@ class ToolMetadata(BaseModel):
     description: Optional[str] = Field(None, description="Tool description")
     source: ToolSource = Field(..., description="Tool source (local or mcp)")
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ToolRegistry:
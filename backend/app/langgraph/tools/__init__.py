@@ -1,6 +1,20 @@
 # Expose tools for import
+from functools import lru_cache
+
 from .multiply import multiply
 from .add import add
 from .rag_search import rag_search
 
-__all__ = ["multiply", "add", "rag_search"]
+# Local tools graphs use when none are passed in
+DEFAULT_TOOLS = (multiply, add, rag_search)
+
+
+@lru_cache(maxsize=1)
+def default_tool_node():
+    """ToolNode for DEFAULT_TOOLS, built once and shared by every graph that uses the defaults."""
+    from langgraph.prebuilt import ToolNode
+
+    return ToolNode(list(DEFAULT_TOOLS))
+
+
+__all__ = ["multiply", "add", "rag_search", "DEFAULT_TOOLS", "default_tool_node"]
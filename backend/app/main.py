@@ -3,13 +3,14 @@
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.infrastructure.config.settings import settings
 from app.infrastructure.config.logging_config import setup_logging, get_logger
 from app.infrastructure.database.mongodb import MongoDB, AppDatabase
 from app.infrastructure.database.chromadb_client import ChromaDBClient
-from app.infrastructure.database.langgraph_checkpointer import get_checkpointer
+from app.infrastructure.database.langgraph_checkpointer import get_checkpointer, shutdown_checkpointer
 from app.adapters.inbound.auth_router import router as auth_router
 from app.adapters.inbound.user_router import router as user_router
 from app.adapters.inbound.conversation_router import router as conversation_router
@@ -45,10 +46,13 @@ async def lifespan(app: FastAPI):
     app.state.chroma_client = ChromaDBClient.client
 
     # Create vector store instance
-    from app.adapters.outbound.vector_stores.vector_store_factory import get_vector_store
+    from app.adapters.outbound.vector_stores.vector_store_factory import get_vector_store, get_semantic_cache
     app.state.vector_store = get_vector_store(ChromaDBClient.client)
     logger.info("Vector store initialized")
 
+    # Semantic cache is None unless enabled in settings
+    app.state.semantic_cache = get_semantic_cache(ChromaDBClient.client)
+
     # Initialize MCP client manager
     from app.infrastructure.mcp import MCPClientManager
     try:
@@ -74,8 +78,8 @@ async def lifespan(app: FastAPI):
 
     # Combine local and MCP tools
     local_tools = [multiply, add, rag_search]
-    mcp_tools = MCPClientManager.get_tools() if app.state.mcp_manager else []
-    all_tools = local_tools + mcp_tools
+    mcp_tools = MCPClientManager.get_tools() if app.state.mcp_manager else ()
+    all_tools = [*local_tools, *mcp_tools]
 
     # Register tools in metadata registry
     from app.langgraph.tool_metadata import get_tool_registry, ToolMetadata, ToolSource
@@ -133,7 +137,7 @@ async def lifespan(app: FastAPI):
     ChromaDBClient.close()
     await AppDatabase.close()
     # Properly exit AsyncMongoDBSaver context manager
-    await checkpointer_context.__aexit__(None, None, None)
+    await shutdown_checkpointer()
     logger.info("Application shutdown complete")
 
 
@@ -148,7 +152,8 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         version=settings.app_version,
         debug=settings.debug,
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
 
     # Configure CORS
@@ -0,0 +1,112 @@
+# ABOUTME: Unit tests for the caching user repository decorator
+# ABOUTME: Verifies cache hits across lookup keys and invalidation on writes
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.adapters.outbound.repositories.caching_user_repository import CachingUserRepository
+from app.core.domain.user import UserUpdate
+from app.infrastructure.cache.in_memory_cache import InMemoryCacheBackend
+
+
+@pytest.fixture
+def caching_repository(mock_user_repository):
+    """Caching decorator around a mocked repository."""
+    return CachingUserRepository(
+        mock_user_repository,
+        InMemoryCacheBackend(max_size=100, ttl_seconds=60)
+    )
+
+
+@pytest.mark.unit
+class TestCachingUserRepository:
+    """Tests for CachingUserRepository."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_is_cached_under_every_key(
+        self, caching_repository, mock_user_repository, sample_user
+    ):
+        """A user loaded by id is then served by id, email and username."""
+        mock_user_repository.get_by_id = AsyncMock(return_value=sample_user)
+
+        await caching_repository.get_by_id(sample_user.id)
+        by_id = await caching_repository.get_by_id(sample_user.id)
+        by_email = await caching_repository.get_by_email(sample_user.email)
+        by_username = await caching_repository.get_by_username(sample_user.username)
+
+        assert by_id is by_email is by_username is sample_user
+        mock_user_repository.get_by_id.assert_awaited_once()
+        mock_user_repository.get_by_email.assert_not_awaited()
+        mock_user_repository.get_by_username.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_misses_are_not_cached(self, caching_repository, mock_user_repository):
+        """Unknown users hit the repository every time."""
+        mock_user_repository.get_by_email = AsyncMock(return_value=None)
+
+        assert await caching_repository.get_by_email("nobody@example.com") is None
+        assert await caching_repository.get_by_email("nobody@example.com") is None
+        assert mock_user_repository.get_by_email.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_login_lookup_is_cached_under_every_key(
+        self, caching_repository, mock_user_repository, sample_user
+    ):
+        """A user found by email-or-username is then served by either identifier."""
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=sample_user)
+
+        await caching_repository.get_by_email_or_username(sample_user.username)
+        by_username = await caching_repository.get_by_email_or_username(sample_user.username)
+        by_email = await caching_repository.get_by_email_or_username(sample_user.email)
+
+        assert by_username is by_email is sample_user
+        mock_user_repository.get_by_email_or_username.assert_awaited_once_with(sample_user.username)
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_old_keys(
+        self, caching_repository, mock_user_repository, sample_user
+    ):
+        """After an update, the old email no longer resolves from the cache."""
+        updated = sample_user.model_copy(update={"email": "new@example.com"})
+        mock_user_repository.get_by_id = AsyncMock(return_value=sample_user)
+        mock_user_repository.update = AsyncMock(return_value=updated)
+        mock_user_repository.get_by_email = AsyncMock(return_value=None)
+
+        await caching_repository.get_by_id(sample_user.id)
+        await caching_repository.update(sample_user.id, UserUpdate(email="new@example.com"))
+
+        assert await caching_repository.get_by_email(sample_user.email) is None
+        mock_user_repository.get_by_email.assert_awaited_once_with(sample_user.email)
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_old_keys_after_id_eviction(
+        self, caching_repository, mock_user_repository, sample_user
+    ):
+        """Old email and username entries are dropped even if the id entry was evicted."""
+        updated = sample_user.model_copy(update={"email": "new@example.com", "username": "newname"})
+        mock_user_repository.get_by_email = AsyncMock(side_effect=[sample_user, None])
+        mock_user_repository.get_by_username = AsyncMock(return_value=None)
+        mock_user_repository.get_by_id = AsyncMock(return_value=sample_user)
+        mock_user_repository.update = AsyncMock(return_value=updated)
+
+        await caching_repository.get_by_email(sample_user.email)
+        await caching_repository.backend.delete(f"id:{sample_user.id}")
+        await caching_repository.update(
+            sample_user.id, UserUpdate(email="new@example.com", username="newname")
+        )
+
+        assert await caching_repository.get_by_email(sample_user.email) is None
+        assert await caching_repository.get_by_username(sample_user.username) is None
+        assert mock_user_repository.get_by_email.await_count == 2
+        mock_user_repository.get_by_username.assert_awaited_once_with(sample_user.username)
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_user(
+        self, caching_repository, mock_user_repository, sample_user
+    ):
+        """A deleted user is reloaded from the repository."""
+        mock_user_repository.get_by_id = AsyncMock(side_effect=[sample_user, None])
+        mock_user_repository.delete = AsyncMock(return_value=True)
+
+        assert await caching_repository.delete(sample_user.id) is True
+        assert await caching_repository.get_by_id(sample_user.id) is None
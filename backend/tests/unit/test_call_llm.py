@@ -0,0 +1,76 @@
+"""Unit tests for the call_llm node helpers."""
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from app.langgraph.nodes.call_llm import history_window, semantic_cache_scope
+
+
+class TestHistoryWindow:
+    """Tests for bounding the history sent to the LLM."""
+
+    def test_short_history_is_unchanged(self):
+        """Histories within the window are sent as-is."""
+        messages = [HumanMessage(content="hi"), AIMessage(content="hello")]
+        assert history_window(messages, 20) == messages
+
+    def test_keeps_system_prefix_and_recent_messages(self):
+        """The system prefix survives while old turns are dropped."""
+        system = SystemMessage(content="be brief")
+        turns = [HumanMessage(content=f"q{i}") for i in range(10)]
+
+        result = history_window([system] + turns, 3)
+
+        assert result == [system] + turns[-3:]
+
+    def test_window_starts_on_a_user_message(self):
+        """A window cut inside a turn moves forward to the next user message."""
+        messages = [
+            HumanMessage(content="what is 2*3"),
+            AIMessage(content="", tool_calls=[{"name": "multiply", "args": {"a": 2, "b": 3}, "id": "c1"}]),
+            ToolMessage(content="6", tool_call_id="c1"),
+            AIMessage(content="6"),
+            HumanMessage(content="and 2*4?"),
+        ]
+
+        for window in (2, 3, 4):
+            assert history_window(messages, window) == messages[4:]
+
+    def test_keeps_current_turn_whole_when_longer_than_window(self):
+        """Without a user message in the window, it reaches back to where the turn began."""
+        system = SystemMessage(content="be brief")
+        messages = [
+            system,
+            HumanMessage(content="hi"),
+            AIMessage(content="hello"),
+            HumanMessage(content="what is 2*3"),
+            AIMessage(content="", tool_calls=[{"name": "multiply", "args": {"a": 2, "b": 3}, "id": "c1"}]),
+            ToolMessage(content="6", tool_call_id="c1"),
+        ]
+
+        result = history_window(messages, 2)
+
+        assert result == [system] + messages[3:]
+
+    def test_zero_window_keeps_everything(self):
+        """A window of 0 disables trimming."""
+        messages = [HumanMessage(content=f"q{i}") for i in range(5)]
+        assert history_window(messages, 0) == messages
+
+
+class TestSemanticCacheScope:
+    """Tests for scoping semantic cache entries to the preceding reply."""
+
+    def test_same_prompt_after_different_replies_gets_different_scopes(self):
+        """A repeated follow-up does not share a scope across contexts."""
+        first = [HumanMessage(content="tell me about cats"), AIMessage(content="Cats purr."), HumanMessage(content="yes")]
+        second = [HumanMessage(content="tell me about dogs"), AIMessage(content="Dogs bark."), HumanMessage(content="yes")]
+
+        assert semantic_cache_scope("conv1", first) != semantic_cache_scope("conv1", second)
+
+    def test_same_preceding_reply_gets_same_scope(self):
+        """The scope only depends on the conversation and the preceding reply."""
+        reply = AIMessage(content="Cats purr.")
+        first = [HumanMessage(content="cats?"), reply, HumanMessage(content="more")]
+        second = [HumanMessage(content="about cats?"), reply, HumanMessage(content="more please")]
+
+        assert semantic_cache_scope("conv1", first) == semantic_cache_scope("conv1", second)
+        assert semantic_cache_scope("conv1", first).startswith("conv1:")
@@ -1,7 +1,11 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from app.adapters.outbound.vector_stores.chroma_vector_store import ChromaDBVectorStore
+from app.adapters.outbound.vector_stores import chroma_semantic_cache as semantic_cache_module
+from app.adapters.outbound.vector_stores.chroma_semantic_cache import ChromaSemanticCache
+from app.core.domain.clock import utcnow
 from app.core.domain.document import Document, DocumentMetadata
+from app.infrastructure.config.settings import Settings
 from datetime import datetime
 
 
@@ -44,6 +48,75 @@ class TestChromaDBVectorStore:
         assert ids == ["doc1", "doc2"]
         store.collection.add.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_store_documents_with_embeddings(self, mock_chroma_client, sample_documents):
+        """Test precomputed embeddings are passed through to ChromaDB."""
+        store = ChromaDBVectorStore(mock_chroma_client)
+        embeddings = [[0.1, 0.2], [0.3, 0.4]]
+
+        await store.store_documents(sample_documents, embeddings=embeddings)
+
+        kwargs = store.collection.add.call_args.kwargs
+        assert kwargs["ids"] == ["doc1", "doc2"]
+        assert kwargs["documents"] == ["Content 1", "Content 2"]
+        assert kwargs["embeddings"] == embeddings
+
+    @pytest.mark.asyncio
+    async def test_store_documents_in_batches(self, mock_chroma_client, sample_documents, monkeypatch):
+        """Test large uploads are split into batches of chroma_batch_size."""
+        from app.infrastructure.config.settings import Settings, settings
+        monkeypatch.setattr(
+            "app.adapters.outbound.vector_stores.chroma_vector_store.settings",
+            Settings.with_overrides(settings, chroma_batch_size=1)
+        )
+        store = ChromaDBVectorStore(mock_chroma_client)
+
+        ids = await store.store_documents(sample_documents)
+
+        assert ids == ["doc1", "doc2"]
+        assert store.collection.add.call_count == 2
+        batches = [call.kwargs["ids"] for call in store.collection.add.call_args_list]
+        assert sorted(batches) == [["doc1"], ["doc2"]]
+
+    @pytest.mark.asyncio
+    async def test_batches_capped_at_server_limit(self, mock_chroma_client, sample_documents):
+        """Test uploads never exceed the Chroma server's max batch size."""
+        mock_chroma_client.max_batch_size = 1
+        store = ChromaDBVectorStore(mock_chroma_client)
+
+        await store.store_documents(sample_documents)
+
+        assert store.collection.add.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mismatched_embeddings_rejected(self, mock_chroma_client, sample_documents):
+        """Test precomputed embeddings must line up with the documents."""
+        store = ChromaDBVectorStore(mock_chroma_client)
+
+        with pytest.raises(ValueError):
+            await store.store_documents(sample_documents, embeddings=[[0.1, 0.2]])
+
+        store.collection.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embedder_supplies_vectors(self, mock_chroma_client, sample_documents):
+        """Test a client-side embedder feeds both storage and queries."""
+        embedder = MagicMock()
+        embedder.embed_batch = AsyncMock(side_effect=[[[0.1], [0.2]], [[0.3]]])
+        store = ChromaDBVectorStore(mock_chroma_client, embedder=embedder)
+        store.collection.query.return_value = {
+            "ids": [[]], "documents": [[]], "distances": [[]], "metadatas": [[]]
+        }
+
+        await store.store_documents(sample_documents)
+        await store.retrieve("test query", top_k=3)
+
+        assert store.collection.add.call_args.kwargs["embeddings"] == [[0.1], [0.2]]
+        store.collection.query.assert_called_once_with(
+            query_embeddings=[[0.3]],
+            n_results=3
+        )
+
     @pytest.mark.asyncio
     async def test_retrieve_documents(self, mock_chroma_client):
         """Test retrieving documents from ChromaDB."""
@@ -53,7 +126,7 @@ class TestChromaDBVectorStore:
             "distances": [[0.1]],
             "metadatas": [[{
                 "source": "test.txt",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": utcnow().isoformat(),
                 "content_length": 50,
                 "document_type": "txt"
             }]]
@@ -66,6 +139,75 @@ class TestChromaDBVectorStore:
         assert results[0].document.id == "doc1"
         assert results[0].similarity_score > 0
 
+    @pytest.mark.asyncio
+    async def test_created_at_round_trips_as_epoch(self, mock_chroma_client, sample_documents):
+        """Test created_at is stored as epoch seconds and read back as UTC datetime."""
+        store = ChromaDBVectorStore(mock_chroma_client)
+        await store.store_documents(sample_documents)
+
+        stored = store.collection.add.call_args.kwargs["metadatas"][0]
+        assert isinstance(stored["created_at"], int)
+
+        store.collection.query.return_value = {
+            "ids": [["doc1"]],
+            "documents": [["Content 1"]],
+            "distances": [[0.1]],
+            "metadatas": [[stored]]
+        }
+        results = await store.retrieve("test query")
+
+        expected = sample_documents[0].metadata.created_at.replace(microsecond=0)
+        assert results[0].document.metadata.created_at == expected
+
+    @pytest.mark.asyncio
+    async def test_retrieve_batch(self, mock_chroma_client):
+        """Test retrieving documents for several queries in one query call."""
+        metadata = {
+            "source": "test.txt",
+            "created_at": utcnow().isoformat(),
+            "content_length": 50,
+            "document_type": "txt"
+        }
+        mock_chroma_client.get_or_create_collection().query.return_value = {
+            "ids": [["doc1"], ["doc2", "doc1"]],
+            "documents": [["Content 1"], ["Content 2", "Content 1"]],
+            "distances": [[0.1], [0.2, 0.4]],
+            "metadatas": [[metadata], [metadata, metadata]]
+        }
+
+        store = ChromaDBVectorStore(mock_chroma_client)
+        results = await store.retrieve_batch(["first", "second"], top_k=2)
+
+        store.collection.query.assert_called_once_with(
+            query_texts=["first", "second"],
+            n_results=2
+        )
+        assert [r.document.id for r in results[0]] == ["doc1"]
+        assert [r.document.id for r in results[1]] == ["doc2", "doc1"]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_many_merges_duplicates(self, mock_chroma_client):
+        """Test hits across queries are deduplicated, keeping each document's best score."""
+        metadata = {
+            "source": "test.txt",
+            "created_at": utcnow().isoformat(),
+            "content_length": 50,
+            "document_type": "txt"
+        }
+        mock_chroma_client.get_or_create_collection().query.return_value = {
+            "ids": [["doc1", "doc3"], ["doc2", "doc1"]],
+            "documents": [["Content 1", "Content 3"], ["Content 2", "Content 1"]],
+            "distances": [[0.6, 1.0], [0.2, 0.1]],
+            "metadatas": [[metadata, metadata], [metadata, metadata]]
+        }
+
+        store = ChromaDBVectorStore(mock_chroma_client)
+        results = await store.retrieve_many(["first", "second"], top_k=2)
+
+        store.collection.query.assert_called_once()
+        assert [r.document.id for r in results] == ["doc1", "doc2"]
+        assert results[0].similarity_score == pytest.approx(0.95)
+
     @pytest.mark.asyncio
     async def test_delete_document(self, mock_chroma_client):
         """Test deleting document from ChromaDB."""
@@ -85,3 +227,85 @@ class TestChromaDBVectorStore:
 
         assert success is True
         mock_chroma_client.delete_collection.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_clear_with_filter_keeps_collection(self, mock_chroma_client):
+        """Test filtered clear deletes matching documents without dropping the collection."""
+        store = ChromaDBVectorStore(mock_chroma_client)
+
+        success = await store.clear(where={"source": "test.txt"})
+
+        assert success is True
+        store.collection.delete.assert_called_once_with(where={"source": "test.txt"})
+        mock_chroma_client.delete_collection.assert_not_called()
+
+
+class TestChromaSemanticCache:
+    """Tests for ChromaDB semantic cache adapter."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_returns_answer_above_threshold(self, mock_chroma_client):
+        """A near-duplicate prompt in the same scope returns the cached answer."""
+        cache = ChromaSemanticCache(mock_chroma_client)
+        cache.collection.query.return_value = {
+            "ids": [["entry1"]],
+            "distances": [[0.02]],
+            "metadatas": [[{"scope": "conv1", "response": "Paris", "created_at": 0}]]
+        }
+
+        result = await cache.lookup("capital of France?", scope="conv1", threshold=0.95)
+
+        assert result == "Paris"
+        where = cache.collection.query.call_args.kwargs["where"]
+        assert {"scope": "conv1"} in where["$and"]
+
+    @pytest.mark.asyncio
+    async def test_lookup_misses_below_threshold(self, mock_chroma_client):
+        """A prompt that is not similar enough is a miss."""
+        cache = ChromaSemanticCache(mock_chroma_client)
+        cache.collection.query.return_value = {
+            "ids": [["entry1"]],
+            "distances": [[0.2]],
+            "metadatas": [[{"scope": "conv1", "response": "Paris", "created_at": 0}]]
+        }
+
+        assert await cache.lookup("capital of Spain?", scope="conv1", threshold=0.95) is None
+
+    @pytest.mark.asyncio
+    async def test_store_adds_scoped_entry(self, mock_chroma_client):
+        """Stored entries carry the prompt, scope and answer."""
+        cache = ChromaSemanticCache(mock_chroma_client)
+        cache.collection.count.return_value = 0
+
+        await cache.store("capital of France?", "Paris", scope="conv1")
+
+        call_kwargs = cache.collection.add.call_args.kwargs
+        assert call_kwargs["documents"] == ["capital of France?"]
+        assert call_kwargs["metadatas"][0]["scope"] == "conv1"
+        assert call_kwargs["metadatas"][0]["response"] == "Paris"
+
+    @pytest.mark.asyncio
+    async def test_store_deletes_expired_entries(self, mock_chroma_client):
+        """Entries older than the TTL are deleted when a new answer is stored."""
+        cache = ChromaSemanticCache(mock_chroma_client)
+        cache.collection.count.return_value = 0
+
+        await cache.store("capital of France?", "Paris", scope="conv1")
+
+        where = cache.collection.delete.call_args.kwargs["where"]
+        assert "$lt" in where["created_at"]
+
+    @pytest.mark.asyncio
+    async def test_store_skips_when_full(self, mock_chroma_client, monkeypatch):
+        """No entry is added once the cache holds semantic_cache_max_entries."""
+        monkeypatch.setattr(
+            semantic_cache_module,
+            "settings",
+            Settings.with_overrides(semantic_cache_module.settings, semantic_cache_max_entries=2)
+        )
+        cache = ChromaSemanticCache(mock_chroma_client)
+        cache.collection.count.return_value = 2
+
+        await cache.store("capital of France?", "Paris", scope="conv1")
+
+        cache.collection.add.assert_not_called()
@@ -90,6 +90,14 @@ class TestConversationModel:
         assert conversation.title == "New Conversation"
         assert conversation.message_count is None
 
+    def test_conversation_is_immutable(self):
+        """Test conversation rejects mutation and unknown fields."""
+        conversation = Conversation(user_id="user123")
+        with pytest.raises(ValidationError):
+            conversation.title = "Changed"
+        with pytest.raises(ValidationError):
+            Conversation(user_id="user123", unknown="value")
+
     def test_conversation_create_valid(self):
         """Test ConversationCreate schema."""
         conv_data = ConversationCreate(title="Custom Title")
@@ -3,10 +3,10 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 
 from app.infrastructure.database.mongodb import AppDatabase, LangGraphDatabase, MongoDB
-from app.infrastructure.database.langgraph_checkpointer import get_checkpointer
+from app.infrastructure.database.langgraph_checkpointer import get_checkpointer, shutdown_checkpointer
 from app.adapters.outbound.repositories.mongo_models import UserDocument, ConversationDocument
 
 
@@ -16,13 +16,14 @@ class TestAppDatabase:
     @pytest.mark.asyncio
     async def test_app_database_connect_success(self):
         """Test successful connection to App Database."""
-        with patch('app.infrastructure.database.mongodb.AsyncIOMotorClient') as mock_client, \
+        with patch('app.infrastructure.database.mongodb.AsyncMongoClient') as mock_client, \
              patch('app.infrastructure.database.mongodb.init_beanie') as mock_init_beanie:
 
             # Setup mock
             mock_instance = MagicMock()
             mock_client.return_value = mock_instance
             mock_instance.__getitem__.return_value = MagicMock()
+            mock_instance.admin.command = AsyncMock()
 
             # Test connection
             await AppDatabase.connect(document_models=[UserDocument, ConversationDocument])
@@ -36,7 +37,7 @@ class TestAppDatabase:
     @pytest.mark.asyncio
     async def test_app_database_connect_failure(self):
         """Test App Database connection failure handling."""
-        with patch('app.infrastructure.database.mongodb.AsyncIOMotorClient') as mock_client:
+        with patch('app.infrastructure.database.mongodb.AsyncMongoClient') as mock_client:
             mock_client.side_effect = Exception("Connection failed")
 
             # Test connection failure
@@ -48,13 +49,13 @@ class TestAppDatabase:
         """Test App Database connection closure."""
         # Setup
         AppDatabase.client = MagicMock()
-        AppDatabase.client.close = MagicMock()
+        AppDatabase.client.close = AsyncMock()
 
         # Test closure
         await AppDatabase.close()
 
         # Verify
-        AppDatabase.client.close.assert_called_once()
+        AppDatabase.client.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_app_database_close_when_no_client(self):
@@ -72,11 +73,12 @@ class TestLangGraphDatabase:
     @pytest.mark.asyncio
     async def test_langgraph_database_connect_success(self):
         """Test successful connection to LangGraph Database."""
-        with patch('app.infrastructure.database.mongodb.AsyncIOMotorClient') as mock_client:
+        with patch('app.infrastructure.database.mongodb.AsyncMongoClient') as mock_client:
             # Setup mock
             mock_instance = MagicMock()
             mock_client.return_value = mock_instance
             mock_instance.__getitem__.return_value = MagicMock()
+            mock_instance.admin.command = AsyncMock()
 
             # Test connection
             await LangGraphDatabase.connect()
@@ -85,11 +87,12 @@ class TestLangGraphDatabase:
             assert LangGraphDatabase.client is not None
             assert LangGraphDatabase.database is not None
             mock_client.assert_called_once()
+            mock_instance.admin.command.assert_awaited_once_with("ping")
 
     @pytest.mark.asyncio
     async def test_langgraph_database_connect_failure(self):
         """Test LangGraph Database connection failure handling."""
-        with patch('app.infrastructure.database.mongodb.AsyncIOMotorClient') as mock_client:
+        with patch('app.infrastructure.database.mongodb.AsyncMongoClient') as mock_client:
             mock_client.side_effect = Exception("Connection failed")
 
             # Test connection failure
@@ -101,13 +104,13 @@ class TestLangGraphDatabase:
         """Test LangGraph Database connection closure."""
         # Setup
         LangGraphDatabase.client = MagicMock()
-        LangGraphDatabase.client.close = MagicMock()
+        LangGraphDatabase.client.close = AsyncMock()
 
         # Test closure
         await LangGraphDatabase.close()
 
         # Verify
-        LangGraphDatabase.client.close.assert_called_once()
+        LangGraphDatabase.client.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_langgraph_database_close_when_no_client(self):
@@ -134,7 +137,7 @@ class TestLangGraphCheckpointer:
     async def test_get_checkpointer_success(self):
         """Test successful checkpointer creation."""
         # Setup
-        LangGraphDatabase.client = MagicMock(spec=AsyncIOMotorClient)
+        LangGraphDatabase.client = MagicMock(spec=AsyncMongoClient)
 
         with patch('app.infrastructure.database.langgraph_checkpointer.AsyncMongoDBSaver') as mock_saver_class:
             # Setup the async context manager mock
@@ -150,6 +153,26 @@ class TestLangGraphCheckpointer:
             mock_saver_class.from_conn_string.assert_called_once()
             assert checkpointer == mock_saver_instance
 
+    @pytest.mark.asyncio
+    async def test_get_checkpointer_enters_context_once(self):
+        """Test repeated calls reuse the checkpointer until shutdown."""
+        await shutdown_checkpointer()
+
+        with patch('app.infrastructure.database.langgraph_checkpointer.AsyncMongoDBSaver') as mock_saver_class:
+            mock_saver_instance = MagicMock()
+            mock_context_manager = MagicMock()
+            mock_context_manager.__aenter__ = AsyncMock(return_value=mock_saver_instance)
+            mock_context_manager.__aexit__ = AsyncMock()
+            mock_saver_class.from_conn_string = MagicMock(return_value=mock_context_manager)
+
+            first = await get_checkpointer()
+            second = await get_checkpointer()
+            await shutdown_checkpointer()
+
+            assert first == second == (mock_context_manager, mock_saver_instance)
+            mock_context_manager.__aenter__.assert_awaited_once()
+            mock_context_manager.__aexit__.assert_awaited_once_with(None, None, None)
+
     @pytest.mark.asyncio
     async def test_get_checkpointer_raises_when_not_connected(self):
         """Test checkpointer creation fails when database not connected."""
@@ -167,7 +190,7 @@ class TestDualDatabaseIndependence:
     @pytest.mark.asyncio
     async def test_app_and_langgraph_databases_are_independent(self):
         """Test that AppDatabase and LangGraphDatabase maintain separate connections."""
-        with patch('app.infrastructure.database.mongodb.AsyncIOMotorClient') as mock_client:
+        with patch('app.infrastructure.database.mongodb.AsyncMongoClient') as mock_client:
             # Setup separate mock clients
             app_client = MagicMock()
             langgraph_client = MagicMock()
@@ -175,6 +198,8 @@ class TestDualDatabaseIndependence:
 
             app_client.__getitem__.return_value = MagicMock()
             langgraph_client.__getitem__.return_value = MagicMock()
+            app_client.admin.command = AsyncMock()
+            langgraph_client.admin.command = AsyncMock()
 
             # Connect both databases
             with patch('app.infrastructure.database.mongodb.init_beanie'):
@@ -190,6 +215,7 @@ class TestDualDatabaseIndependence:
         """Test that closing AppDatabase doesn't affect LangGraphDatabase."""
         # Setup
         AppDatabase.client = MagicMock()
+        AppDatabase.client.close = AsyncMock()
         LangGraphDatabase.client = MagicMock()
 
         # Close AppDatabase
@@ -197,4 +223,4 @@ class TestDualDatabaseIndependence:
 
         # Verify LangGraphDatabase client still exists
         assert LangGraphDatabase.client is not None
-        AppDatabase.client.close.assert_called_once()
+        AppDatabase.client.close.assert_awaited_once()
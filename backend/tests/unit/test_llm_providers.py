@@ -1,10 +1,19 @@
 # ABOUTME: Unit tests for LLM provider implementations
-# ABOUTME: Tests provider factory
+# ABOUTME: Tests provider factory, the caching provider decorator and stream usage reporting
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 
 from app.adapters.outbound.llm_providers.provider_factory import LLMProviderFactory
+from app.adapters.outbound.llm_providers import caching_provider as caching_module
+from app.adapters.outbound.llm_providers.caching_provider import CachingLLMProvider, LLM_CACHE_HIT_EVENT
+from app.adapters.outbound.llm_providers.streaming import stream_content
+from app.adapters.outbound.llm_providers.tool_binding import ToolBindingCache
+from app.adapters.outbound.llm_providers.wire import messages_to_wire
+from app.core.domain.token_usage import TokenUsage
+from app.infrastructure.cache.in_memory_cache import InMemoryCacheBackend
 
 
 @pytest.mark.unit
@@ -66,3 +75,164 @@ class TestLLMProviderFactory:
 
         with pytest.raises(ValueError, match="Unsupported LLM provider"):
             LLMProviderFactory.create_provider()
+
+
+def _fake_provider(temperature: Optional[float]) -> MagicMock:
+    """Build a provider double whose model reports the given temperature."""
+    provider = MagicMock()
+    provider.get_model.return_value = MagicMock(temperature=temperature)
+    provider.get_model_name = AsyncMock(return_value="test-model")
+    provider.generate = AsyncMock(return_value=AIMessage(content="cached answer"))
+    return provider
+
+
+@pytest.mark.unit
+class TestCachingLLMProvider:
+    """Tests for the caching LLM provider decorator."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_served_from_cache(self):
+        """Test an identical prompt only reaches the provider once."""
+        provider = _fake_provider(temperature=0)
+        caching = CachingLLMProvider(provider, InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+        messages = [HumanMessage(content="hello")]
+
+        first = await caching.generate(messages)
+        second = await caching.generate(messages)
+
+        assert first.content == second.content == "cached answer"
+        provider.generate.assert_awaited_once()
+        assert caching.stats == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_model_bypasses_cache(self):
+        """Test responses are not cached when temperature is above zero."""
+        provider = _fake_provider(temperature=0.7)
+        caching = CachingLLMProvider(provider, InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+        messages = [HumanMessage(content="hello")]
+
+        await caching.generate(messages)
+        await caching.generate(messages)
+
+        assert provider.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unset_temperature_bypasses_cache(self):
+        """Test a model without an explicit temperature is not treated as deterministic."""
+        provider = _fake_provider(temperature=None)
+        caching = CachingLLMProvider(provider, InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+        messages = [HumanMessage(content="hello")]
+
+        await caching.generate(messages)
+        await caching.generate(messages)
+
+        assert not caching.cacheable
+        assert provider.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_dispatches_event(self):
+        """Test a cache hit is announced so streaming handlers can forward it."""
+        provider = _fake_provider(temperature=0)
+        caching = CachingLLMProvider(provider, InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+        messages = [HumanMessage(content="hello")]
+
+        with patch.object(caching_module, "adispatch_custom_event", new=AsyncMock()) as dispatch:
+            await caching.generate(messages)
+            dispatch.assert_not_awaited()
+            cached = await caching.generate(messages)
+
+        dispatch.assert_awaited_once_with(LLM_CACHE_HIT_EVENT, cached)
+
+    @pytest.mark.asyncio
+    async def test_bound_tools_change_cache_key(self):
+        """Test tool-bound copies share the backend but key on their tools."""
+        provider = _fake_provider(temperature=0)
+        provider.bind_tools.return_value = provider
+        caching = CachingLLMProvider(provider, InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+        messages = [HumanMessage(content="hello")]
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        await caching.generate(messages)
+        await caching.bind_tools([add]).generate(messages)
+
+        assert provider.generate.await_count == 2
+        assert caching.stats["misses"] == 2
+
+    def test_messages_to_wire_is_canonical(self):
+        """Test equal histories serialize to identical bytes regardless of key order."""
+        first = [HumanMessage(content="hi", additional_kwargs={"b": 1, "a": 2})]
+        second = [HumanMessage(content="hi", additional_kwargs={"a": 2, "b": 1})]
+
+        assert messages_to_wire(first) == messages_to_wire(second)
+        assert messages_to_wire(first) != messages_to_wire([HumanMessage(content="bye")])
+
+
+@pytest.mark.unit
+class TestStreamContent:
+    """Tests for the shared provider streaming helper."""
+
+    @pytest.mark.asyncio
+    async def test_yields_text_and_reports_summed_usage(self):
+        """Text is streamed as-is and usage is reported once at the end."""
+        async def chunks():
+            yield AIMessageChunk(content="Hel")
+            yield AIMessageChunk(content="lo")
+            yield AIMessageChunk(
+                content="",
+                usage_metadata={"input_tokens": 12, "output_tokens": 2, "total_tokens": 14}
+            )
+
+        reported = []
+        text = [token async for token in stream_content(chunks(), reported.append)]
+
+        assert text == ["Hel", "lo"]
+        assert reported == [TokenUsage(prompt_tokens=12, completion_tokens=2, total_tokens=14)]
+
+    def test_usage_read_from_generated_message(self):
+        """Usage, including cached prompt tokens, comes from usage_metadata."""
+        message = AIMessage(
+            content="hi",
+            usage_metadata={
+                "input_tokens": 100,
+                "output_tokens": 5,
+                "total_tokens": 105,
+                "input_token_details": {"cache_read": 80}
+            }
+        )
+
+        assert TokenUsage.from_message(message) == TokenUsage(100, 5, 105, cached_tokens=80)
+        assert TokenUsage.from_message(AIMessage(content="hi")) is None
+
+
+@pytest.mark.unit
+class TestToolBindingCache:
+    """Tests for memoized tool binding."""
+
+    def test_same_tools_and_options_bind_once(self):
+        """Binding the same tools again reuses the bound model."""
+        model = MagicMock()
+        cache = ToolBindingCache()
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        first = cache.bind(model, [add], {"parallel_tool_calls": False})
+        second = cache.bind(model, [add], {"parallel_tool_calls": False})
+        other = cache.bind(model, [add], {"parallel_tool_calls": True})
+
+        assert first is second
+        assert model.bind_tools.call_count == 2
+        assert other is model.bind_tools.return_value
+
+    def test_unhashable_options_are_not_cached(self):
+        """Options that cannot be hashed fall back to a fresh binding."""
+        model = MagicMock()
+        cache = ToolBindingCache()
+        options = {"tool_choice": {"type": "function", "name": "add"}}
+
+        cache.bind(model, [], options)
+        cache.bind(model, [], options)
+
+        assert model.bind_tools.call_count == 2
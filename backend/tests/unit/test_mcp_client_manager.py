@@ -12,15 +12,15 @@ def reset_mcp_manager():
     MCPClientManager._instance = None
     MCPClientManager._clients = {}
     MCPClientManager._tools = []
-    MCPClientManager._client_contexts = []
-    MCPClientManager._session_contexts = []
+    MCPClientManager._tools_snapshot = ()
+    MCPClientManager._exit_stacks = []
     yield
     # Cleanup after test
     MCPClientManager._instance = None
     MCPClientManager._clients = {}
     MCPClientManager._tools = []
-    MCPClientManager._client_contexts = []
-    MCPClientManager._session_contexts = []
+    MCPClientManager._tools_snapshot = ()
+    MCPClientManager._exit_stacks = []
 
 
 @pytest.mark.asyncio
@@ -68,17 +68,27 @@ async def test_initialize_with_timeout(reset_mcp_manager):
 
 
 @pytest.mark.asyncio
-async def test_get_tools_returns_copy(reset_mcp_manager):
-    """Test that get_tools returns a copy, not reference."""
+async def test_get_tools_returns_immutable_snapshot(reset_mcp_manager):
+    """Test that get_tools returns the same read-only tuple until tools change."""
     test_tool = lambda: "test"
-    MCPClientManager._tools = [test_tool]
+
+    async def fake_connect(server_config):
+        MCPClientManager._tools.append(test_tool)
+
+    with patch("app.infrastructure.mcp.mcp_client_manager.settings") as mock_settings, \
+            patch.object(MCPClientManager, "_connect_server", side_effect=fake_connect):
+        mock_settings.mcp_enabled = True
+        mock_settings.get_mcp_servers = [{"name": "a"}]
+
+        await MCPClientManager.initialize()
 
     tools = MCPClientManager.get_tools()
-    tools.append(lambda: "modified")
 
-    # Original should be unchanged
-    assert len(MCPClientManager._tools) == 1
-    assert len(tools) == 2
+    assert tools == (test_tool,)
+    assert MCPClientManager.get_tools() is tools
+
+    await MCPClientManager.shutdown()
+    assert MCPClientManager.get_tools() == ()
 
 
 @pytest.mark.asyncio
@@ -87,13 +97,19 @@ async def test_shutdown_clears_state(reset_mcp_manager):
     # Setup some mock state
     MCPClientManager._clients = {"test": MagicMock()}
     MCPClientManager._tools = [lambda: "test"]
-    MCPClientManager._client_contexts = [MagicMock()]
+    stack = MagicMock()
+    stack.aclose = AsyncMock()
+    failing_stack = MagicMock()
+    failing_stack.aclose = AsyncMock(side_effect=RuntimeError("close failed"))
+    MCPClientManager._exit_stacks = [stack, failing_stack]
 
     await MCPClientManager.shutdown()
 
     assert len(MCPClientManager._clients) == 0
     assert len(MCPClientManager._tools) == 0
-    assert len(MCPClientManager._client_contexts) == 0
+    assert len(MCPClientManager._exit_stacks) == 0
+    stack.aclose.assert_awaited_once()
+    failing_stack.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -133,6 +149,36 @@ async def test_connection_error_graceful_degradation(reset_mcp_manager):
         assert len(MCPClientManager._clients) == 0
 
 
+@pytest.mark.asyncio
+async def test_servers_connect_concurrently(reset_mcp_manager):
+    """Test that servers are connected in parallel and one failure does not block the rest."""
+    import asyncio
+
+    in_flight = 0
+    max_in_flight = 0
+    connected = []
+
+    async def fake_connect(server_config):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if server_config["name"] == "bad":
+            raise RuntimeError("boom")
+        connected.append(server_config["name"])
+
+    with patch("app.infrastructure.mcp.mcp_client_manager.settings") as mock_settings, \
+            patch.object(MCPClientManager, "_connect_server", side_effect=fake_connect):
+        mock_settings.mcp_enabled = True
+        mock_settings.get_mcp_servers = [{"name": "a"}, {"name": "bad"}, {"name": "b"}]
+
+        await MCPClientManager.initialize()
+
+    assert max_in_flight == 3
+    assert sorted(connected) == ["a", "b"]
+
+
 @pytest.mark.asyncio
 async def test_structured_tools_have_correct_attributes(reset_mcp_manager):
     """Test that StructuredTool instances created by MCP have .name and .description attributes."""
@@ -0,0 +1,108 @@
+# ABOUTME: Unit tests for the SSE message streaming endpoint
+# ABOUTME: Drives stream_message_endpoint with a scripted graph event stream and parses the frames
+
+import orjson
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+from app.adapters.inbound import message_router
+from app.adapters.inbound.message_schemas import SendMessageRequest
+from app.langgraph.nodes.call_llm import SEMANTIC_CACHE_HIT_EVENT
+
+
+def _graph(events, error=None):
+    """Build a graph double whose astream_events yields the given events, then raises error."""
+    async def astream_events(*args, **kwargs):
+        for event in events:
+            yield event
+        if error is not None:
+            raise error
+
+    graph = MagicMock()
+    graph.astream_events = astream_events
+    return graph
+
+
+def _final_state(reply: AIMessage) -> dict:
+    """Root on_chain_end event carrying the final graph state."""
+    return {
+        "event": "on_chain_end",
+        "name": "LangGraph",
+        "parent_ids": [],
+        "data": {"output": {"messages": [HumanMessage(content="hi", id="m1"), reply]}},
+    }
+
+
+async def _stream(graph, sample_user, sample_conversation, monkeypatch):
+    """Call the endpoint and return the decoded SSE frames."""
+    monkeypatch.setattr(
+        message_router.conversation_repository, "get_by_id", AsyncMock(return_value=sample_conversation)
+    )
+    monkeypatch.setattr(message_router, "get_llm_provider", MagicMock())
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(streaming_chat_graph=graph)))
+
+    response = await message_router.stream_message_endpoint(
+        sample_conversation.id, SendMessageRequest(content="hi"), request, sample_user
+    )
+
+    frames = []
+    async for chunk in response.body_iterator:
+        assert chunk.startswith(b"data: ") and chunk.endswith(b"\n\n")
+        frames.append(orjson.loads(chunk[len(b"data: "):]))
+    return frames
+
+
+def _text(frames) -> str:
+    """Join the content of every token frame."""
+    return "".join(frame["content"] for frame in frames if frame["type"] == "token")
+
+
+@pytest.mark.unit
+class TestStreamMessageEndpoint:
+    """Tests for POST /api/conversations/{id}/messages/stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_tokens_then_complete(self, sample_user, sample_conversation, monkeypatch):
+        """Model tokens are streamed, followed by a completion frame with the reply id."""
+        events = [
+            {"event": "on_chat_model_stream", "name": "model", "parent_ids": ["r"],
+             "data": {"chunk": AIMessageChunk(content="Hel")}},
+            {"event": "on_chat_model_stream", "name": "model", "parent_ids": ["r"],
+             "data": {"chunk": AIMessageChunk(content="lo")}},
+            _final_state(AIMessage(content="Hello", id="reply-1")),
+        ]
+
+        frames = await _stream(_graph(events), sample_user, sample_conversation, monkeypatch)
+
+        assert _text(frames) == "Hello"
+        assert frames[-1] == {
+            "type": "complete",
+            "message_id": "reply-1",
+            "conversation_id": sample_conversation.id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_hit_is_streamed(self, sample_user, sample_conversation, monkeypatch):
+        """A semantic cache answer is sent although the model never runs."""
+        events = [
+            {"event": "on_custom_event", "name": SEMANTIC_CACHE_HIT_EVENT, "parent_ids": ["r"],
+             "data": "cached answer"},
+            _final_state(AIMessage(content="cached answer", id="reply-2")),
+        ]
+
+        frames = await _stream(_graph(events), sample_user, sample_conversation, monkeypatch)
+
+        assert _text(frames) == "cached answer"
+        assert frames[-1]["message_id"] == "reply-2"
+
+    @pytest.mark.asyncio
+    async def test_failure_sends_generic_error(self, sample_user, sample_conversation, monkeypatch):
+        """Graph failures end the stream with an error frame that hides internals."""
+        graph = _graph([], error=RuntimeError("connection refused: mongodb://internal:27017"))
+
+        frames = await _stream(graph, sample_user, sample_conversation, monkeypatch)
+
+        assert frames == [{"type": "error", "message": "Failed to generate response", "code": "LLM_ERROR"}]
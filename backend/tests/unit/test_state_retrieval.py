@@ -0,0 +1,40 @@
+"""Unit tests for LangGraph state retrieval helpers."""
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from app.langgraph.state_retrieval import get_conversation_messages
+
+
+async def _reply(state):
+    return {"messages": [AIMessage(content="hello")]}
+
+
+@pytest.fixture
+def graph():
+    """Minimal checkpointed graph that answers every message."""
+    builder = StateGraph(MessagesState)
+    builder.add_node("reply", _reply)
+    builder.add_edge(START, "reply")
+    builder.add_edge("reply", END)
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+class TestGetConversationMessages:
+    """Tests for get_conversation_messages."""
+
+    @pytest.mark.asyncio
+    async def test_returns_checkpointed_messages(self, graph):
+        """Messages are read back from the latest checkpoint in order."""
+        config = {"configurable": {"thread_id": "conv1"}}
+        await graph.ainvoke({"messages": [HumanMessage(content="hi")]}, config)
+
+        messages = await get_conversation_messages(graph, "conv1")
+
+        assert [m.content for m in messages] == ["hi", "hello"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_conversation_has_no_messages(self, graph):
+        """A conversation without checkpoints returns an empty history."""
+        assert await get_conversation_messages(graph, "missing") == []
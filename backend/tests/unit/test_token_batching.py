@@ -0,0 +1,77 @@
+"""Unit tests for token stream coalescing."""
+import asyncio
+
+import pytest
+
+from app.infrastructure.streaming.token_batching import coalesce_tokens
+
+
+async def _tokens(items):
+    for item in items:
+        yield item
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestCoalesceTokens:
+    """Tests for coalesce_tokens."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_after_first_token(self):
+        """Tokens arriving within one window are joined; the first is sent at once."""
+        # The window is far longer than the test, so only the end of the source flushes
+        chunks = await _collect(coalesce_tokens(_tokens(["a", "b", "c", "d"]), flush_interval_ms=60_000))
+
+        assert chunks == ["a", "bcd"]
+
+    @pytest.mark.asyncio
+    async def test_window_is_flushed_while_source_stalls(self):
+        """Buffered text is sent when its window expires, without waiting for more tokens."""
+        resume = asyncio.Event()
+
+        async def stalling():
+            yield "a"
+            yield "b"
+            # Blocks until the test has received "b", so only the window can flush it
+            await resume.wait()
+            yield "c"
+
+        chunks = []
+        async for chunk in coalesce_tokens(stalling(), flush_interval_ms=1):
+            chunks.append(chunk)
+            if chunk == "b":
+                resume.set()
+
+        assert chunks == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_non_text_items_flush_and_pass_through(self):
+        """Structured items keep their position and are never joined with text."""
+        event = {"event": "on_tool_start"}
+        chunks = await _collect(coalesce_tokens(_tokens(["a", "b", "c", event, "d"]), flush_interval_ms=60_000))
+
+        assert chunks == ["a", "bc", event, "d"]
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_passes_tokens_through(self):
+        """Batching can be disabled."""
+        chunks = await _collect(coalesce_tokens(_tokens(["a", "b"]), flush_interval_ms=0))
+
+        assert chunks == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_source_error_is_raised_after_flushing(self):
+        """Buffered text is delivered before the source error propagates."""
+        async def failing():
+            yield "a"
+            yield "b"
+            raise RuntimeError("boom")
+
+        received = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for chunk in coalesce_tokens(failing(), flush_interval_ms=60_000):
+                received.append(chunk)
+
+        assert "".join(received) == "ab"
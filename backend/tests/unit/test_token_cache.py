@@ -0,0 +1,39 @@
+# ABOUTME: Unit tests for the verified-token cache in AuthService.verify_token
+# ABOUTME: Verifies cache hits skip JWT decoding and failures are never cached
+
+import pytest
+from unittest.mock import patch
+
+from app.infrastructure.security import auth_service as auth_module
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start and end every test with an empty token cache."""
+    auth_module._verified_tokens.clear()
+    yield
+    auth_module._verified_tokens.clear()
+
+
+@pytest.mark.unit
+class TestTokenCache:
+    """Tests for verified-token caching."""
+
+    def test_valid_token_is_decoded_once(self, auth_service):
+        """Repeat verification of a valid token is served from the cache."""
+        token = auth_service.create_access_token("user-1")
+
+        with patch.object(auth_module.jwt, "decode", wraps=auth_module.jwt.decode) as decode:
+            assert auth_service.verify_token(token) == "user-1"
+            assert auth_service.verify_token(token) == "user-1"
+
+        decode.assert_called_once()
+
+    def test_invalid_token_is_not_cached(self, auth_service):
+        """Failed verifications are retried, not remembered."""
+        with patch.object(auth_module.jwt, "decode", wraps=auth_module.jwt.decode) as decode:
+            assert auth_service.verify_token("not-a-jwt") is None
+            assert auth_service.verify_token("not-a-jwt") is None
+
+        assert decode.call_count == 2
+        assert len(auth_module._verified_tokens) == 0
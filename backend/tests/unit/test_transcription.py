@@ -0,0 +1,127 @@
+# ABOUTME: Unit tests for streaming transcription in the Whisper service and router
+# ABOUTME: Covers the streaming and whisper-1 branches, typed errors and the SSE endpoint
+
+import orjson
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.adapters.inbound import transcription_router
+from app.adapters.outbound.transcription import openai_whisper_service as whisper_module
+from app.adapters.outbound.transcription.openai_whisper_service import OpenAIWhisperService
+from app.core.ports.transcription_service import TranscriptionError
+from app.infrastructure.config.settings import Settings
+
+
+def _service(monkeypatch, model: str) -> OpenAIWhisperService:
+    """Build a service for the given model with a mocked OpenAI client."""
+    monkeypatch.setattr(
+        whisper_module,
+        "settings",
+        Settings.with_overrides(whisper_module.settings, openai_api_key="test-key", whisper_model=model)
+    )
+    service = OpenAIWhisperService()
+    service.client = MagicMock()
+    return service
+
+
+async def _events(*events):
+    """Async iterable standing in for the OpenAI transcription event stream."""
+    for event in events:
+        yield event
+
+
+async def _collect(stream) -> list:
+    return [item async for item in stream]
+
+
+@pytest.mark.unit
+class TestWhisperTranscribeStream:
+    """Tests for OpenAIWhisperService.transcribe_stream."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_model_yields_deltas_then_done(self, monkeypatch):
+        """gpt-4o-*-transcribe models stream partial transcripts before the final one."""
+        service = _service(monkeypatch, "gpt-4o-mini-transcribe")
+        service.client.audio.transcriptions.create = AsyncMock(return_value=_events(
+            SimpleNamespace(type="transcript.text.delta", delta="Hel"),
+            SimpleNamespace(type="transcript.text.delta", delta="lo"),
+            SimpleNamespace(type="transcript.text.done", text="Hello"),
+        ))
+
+        events = await _collect(service.transcribe_stream(b"audio", "clip.webm", language="en"))
+
+        assert events == [
+            {"type": "delta", "text": "Hel"},
+            {"type": "delta", "text": "lo"},
+            {"type": "done", "text": "Hello", "language": "en", "duration": None},
+        ]
+        assert service.client.audio.transcriptions.create.await_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_whisper_1_yields_single_final_event(self, monkeypatch):
+        """whisper-1 cannot stream, so only the full transcript is sent."""
+        service = _service(monkeypatch, "whisper-1")
+        service.client.audio.transcriptions.create = AsyncMock(
+            return_value=SimpleNamespace(text="Hello", language="english", duration=1.5)
+        )
+
+        events = await _collect(service.transcribe_stream(b"audio", "clip.webm"))
+
+        assert events == [{"type": "done", "text": "Hello", "language": "english", "duration": 1.5}]
+        assert "stream" not in service.client.audio.transcriptions.create.await_args.kwargs
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("model", ["gpt-4o-mini-transcribe", "whisper-1"])
+    async def test_api_failure_raises_transcription_error(self, monkeypatch, model):
+        """API failures surface as TranscriptionError with the cause attached."""
+        service = _service(monkeypatch, model)
+        failure = RuntimeError("upstream timeout")
+        service.client.audio.transcriptions.create = AsyncMock(side_effect=failure)
+
+        with pytest.raises(TranscriptionError) as exc_info:
+            await _collect(service.transcribe_stream(b"audio", "clip.webm"))
+
+        assert exc_info.value.__cause__ is failure
+
+
+@pytest.mark.unit
+class TestTranscribeStreamEndpoint:
+    """Tests for POST /api/transcribe/stream."""
+
+    async def _frames(self, monkeypatch, sample_user, service) -> list:
+        monkeypatch.setattr(transcription_router, "validate_audio_file", AsyncMock(return_value=b"audio"))
+        monkeypatch.setattr(transcription_router, "OpenAIWhisperService", MagicMock(return_value=service))
+        audio_file = SimpleNamespace(filename="clip.webm", content_type="audio/webm")
+
+        response = await transcription_router.transcribe_audio_stream(sample_user, audio_file, None, None)
+
+        return [orjson.loads(chunk[len(b"data: "):]) async for chunk in response.body_iterator]
+
+    @pytest.mark.asyncio
+    async def test_streams_service_events(self, monkeypatch, sample_user):
+        """Each service event becomes one SSE frame."""
+        service = MagicMock()
+        service.transcribe_stream = MagicMock(return_value=_events(
+            {"type": "delta", "text": "Hi"},
+            {"type": "done", "text": "Hi", "language": "en", "duration": None},
+        ))
+
+        frames = await self._frames(monkeypatch, sample_user, service)
+
+        assert [frame["type"] for frame in frames] == ["delta", "done"]
+        assert frames[-1]["text"] == "Hi"
+
+    @pytest.mark.asyncio
+    async def test_failure_sends_generic_error(self, monkeypatch, sample_user):
+        """A failed transcription ends the stream with an error frame."""
+        async def failing(**kwargs):
+            raise TranscriptionError("Transcription failed")
+            yield
+
+        service = MagicMock()
+        service.transcribe_stream = failing
+
+        frames = await self._frames(monkeypatch, sample_user, service)
+
+        assert frames == [{"type": "error", "message": "Transcription service unavailable"}]
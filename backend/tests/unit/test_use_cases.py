@@ -2,11 +2,13 @@
 # ABOUTME: Tests business logic in isolation from infrastructure
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from app.core.use_cases.register_user import RegisterUser
 from app.core.use_cases.authenticate_user import AuthenticateUser
 from app.core.domain.user import User, UserCreate
+from app.infrastructure.cache.in_memory_cache import InMemoryCacheBackend
+from app.infrastructure.security.credential_cache import HmacVerifiedCredentialCache
 
 
 @pytest.mark.unit
@@ -18,8 +20,6 @@ class TestRegisterUser:
         self, mock_user_repository, auth_service, sample_user_create
     ):
         """Test successful user registration."""
-        mock_user_repository.get_by_email = AsyncMock(return_value=None)
-        mock_user_repository.get_by_username = AsyncMock(return_value=None)
         mock_user_repository.create = AsyncMock(
             return_value=User(
                 id="new-user-id",
@@ -43,7 +43,9 @@ class TestRegisterUser:
         self, mock_user_repository, auth_service, sample_user_create, sample_user
     ):
         """Test registration with duplicate email."""
-        mock_user_repository.get_by_email = AsyncMock(return_value=sample_user)
+        mock_user_repository.create = AsyncMock(
+            side_effect=ValueError(f"User with email {sample_user_create.email} already exists")
+        )
 
         use_case = RegisterUser(mock_user_repository, auth_service)
 
@@ -55,8 +57,9 @@ class TestRegisterUser:
         self, mock_user_repository, auth_service, sample_user_create, sample_user
     ):
         """Test registration with duplicate username."""
-        mock_user_repository.get_by_email = AsyncMock(return_value=None)
-        mock_user_repository.get_by_username = AsyncMock(return_value=sample_user)
+        mock_user_repository.create = AsyncMock(
+            side_effect=ValueError(f"User with username {sample_user_create.username} already exists")
+        )
 
         use_case = RegisterUser(mock_user_repository, auth_service)
 
@@ -73,7 +76,7 @@ class TestAuthenticateUser:
         self, mock_user_repository, auth_service, sample_user
     ):
         """Test successful authentication."""
-        mock_user_repository.get_by_username = AsyncMock(return_value=sample_user)
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=sample_user)
 
         hashed = auth_service.hash_password("testpass123")
         sample_user.hashed_password = hashed
@@ -86,12 +89,26 @@ class TestAuthenticateUser:
         assert token is not None
         assert isinstance(token, str)
 
+    @pytest.mark.asyncio
+    async def test_authenticate_user_by_email(
+        self, mock_user_repository, auth_service, sample_user
+    ):
+        """Test authentication with an email address."""
+        sample_user.hashed_password = auth_service.hash_password("testpass123")
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=sample_user)
+
+        use_case = AuthenticateUser(mock_user_repository, auth_service)
+        user, _ = await use_case.execute(sample_user.email, "testpass123")
+
+        assert user.id == sample_user.id
+        mock_user_repository.get_by_email_or_username.assert_awaited_once_with(sample_user.email)
+
     @pytest.mark.asyncio
     async def test_authenticate_user_invalid_username(
         self, mock_user_repository, auth_service
     ):
         """Test authentication with invalid username."""
-        mock_user_repository.get_by_username = AsyncMock(return_value=None)
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=None)
 
         use_case = AuthenticateUser(mock_user_repository, auth_service)
 
@@ -103,7 +120,7 @@ class TestAuthenticateUser:
         self, mock_user_repository, auth_service, sample_user
     ):
         """Test authentication with invalid password."""
-        mock_user_repository.get_by_username = AsyncMock(return_value=sample_user)
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=sample_user)
         sample_user.hashed_password = auth_service.hash_password("correctpass")
 
         use_case = AuthenticateUser(mock_user_repository, auth_service)
@@ -118,9 +135,42 @@ class TestAuthenticateUser:
         """Test authentication with inactive user."""
         sample_user.is_active = False
         sample_user.hashed_password = auth_service.hash_password("testpass123")
-        mock_user_repository.get_by_username = AsyncMock(return_value=sample_user)
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=sample_user)
 
         use_case = AuthenticateUser(mock_user_repository, auth_service)
 
         with pytest.raises(ValueError, match="inactive"):
             await use_case.execute("testuser", "testpass123")
+
+    @pytest.mark.asyncio
+    async def test_repeat_login_skips_password_hashing(
+        self, mock_user_repository, auth_service, sample_user
+    ):
+        """A recently verified password is accepted from the credential cache."""
+        sample_user.hashed_password = auth_service.hash_password("testpass123")
+        mock_user_repository.get_by_email_or_username = AsyncMock(return_value=sample_user)
+        cache = HmacVerifiedCredentialCache("secret", InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+
+        use_case = AuthenticateUser(mock_user_repository, auth_service, cache)
+        await use_case.execute("testuser", "testpass123")
+
+        with patch.object(auth_service, "verify_password") as verify_password:
+            await use_case.execute("testuser", "testpass123")
+            verify_password.assert_not_called()
+
+            # A wrong password is never served from the cache
+            verify_password.return_value = False
+            with pytest.raises(ValueError, match="Invalid credentials"):
+                await use_case.execute("testuser", "wrongpass")
+            verify_password.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_password_change_invalidates_cached_credential(self, sample_user):
+        """Cached verifications are bound to the stored password hash."""
+        cache = HmacVerifiedCredentialCache("secret", InMemoryCacheBackend(max_size=10, ttl_seconds=60))
+        await cache.remember(sample_user, "testpass123")
+
+        changed = sample_user.model_copy(update={"hashed_password": "$2b$12$otherhash"})
+
+        assert await cache.is_verified(sample_user, "testpass123") is True
+        assert await cache.is_verified(changed, "testpass123") is False
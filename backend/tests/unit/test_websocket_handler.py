@@ -0,0 +1,138 @@
+# ABOUTME: Unit tests for the WebSocket chat handler's event forwarding
+# ABOUTME: Drives handle_websocket_chat with a fake socket and a scripted graph event stream
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import WebSocketDisconnect
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from app.adapters.inbound import websocket_handler
+from app.adapters.inbound.websocket_handler import handle_websocket_chat
+from app.adapters.outbound.llm_providers.caching_provider import LLM_CACHE_HIT_EVENT
+from app.infrastructure.config.settings import Settings
+from app.langgraph.nodes.call_llm import SEMANTIC_CACHE_HIT_EVENT
+
+
+class _FakeWebSocket:
+    """WebSocket double that replays client frames and records server frames."""
+
+    def __init__(self, frames):
+        self._frames = list(frames)
+        self.sent = []
+        self.app = SimpleNamespace(state=SimpleNamespace())
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        if not self._frames:
+            raise WebSocketDisconnect()
+        return self._frames.pop(0)
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+
+def _graph(events):
+    """Build a graph double whose astream_events yields the given events."""
+    async def astream_events(*args, **kwargs):
+        for event in events:
+            yield event
+
+    graph = MagicMock()
+    graph.astream_events = astream_events
+    return graph
+
+
+async def _run_turn(events, sample_user, sample_conversation):
+    """Send one chat message through the handler and return the server frames."""
+    websocket = _FakeWebSocket([
+        json.dumps({"type": "message", "conversation_id": sample_conversation.id, "content": "hi"})
+    ])
+    repository = AsyncMock()
+    repository.get_by_id.return_value = sample_conversation
+
+    await handle_websocket_chat(websocket, sample_user, _graph(events), MagicMock(), repository)
+    return websocket.sent
+
+
+@pytest.mark.unit
+class TestWebSocketEventForwarding:
+    """Tests for turning graph events into WebSocket frames."""
+
+    @pytest.mark.asyncio
+    async def test_model_tokens_are_forwarded(self, sample_user, sample_conversation):
+        """Streamed model chunks reach the client as token frames."""
+        events = [
+            {"event": "on_chat_model_stream", "name": "model", "data": {"chunk": AIMessageChunk(content="Hel")}},
+            {"event": "on_chat_model_stream", "name": "model", "data": {"chunk": AIMessageChunk(content="lo")}},
+        ]
+
+        sent = await _run_turn(events, sample_user, sample_conversation)
+
+        assert [frame["content"] for frame in sent if frame["type"] == "token"] == ["Hel", "lo"]
+        assert sent[-1]["type"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_hit_is_forwarded(self, sample_user, sample_conversation):
+        """A semantic cache answer is sent as a token frame."""
+        events = [{"event": "on_custom_event", "name": SEMANTIC_CACHE_HIT_EVENT, "data": "cached"}]
+
+        sent = await _run_turn(events, sample_user, sample_conversation)
+
+        assert [frame["content"] for frame in sent if frame["type"] == "token"] == ["cached"]
+
+    @pytest.mark.asyncio
+    async def test_llm_cache_hit_is_forwarded(self, sample_user, sample_conversation):
+        """A reply served from the LLM cache is sent although no model events fire."""
+        events = [{"event": "on_custom_event", "name": LLM_CACHE_HIT_EVENT, "data": AIMessage(content="cached")}]
+
+        sent = await _run_turn(events, sample_user, sample_conversation)
+
+        assert [frame["content"] for frame in sent if frame["type"] == "token"] == ["cached"]
+        assert sent[-1]["type"] == "complete"
+
+    @pytest.mark.asyncio
+    async def test_llm_cache_hit_tool_call_is_surfaced(self, sample_user, sample_conversation):
+        """Tool calls in a cached reply drive the tool start/complete frames."""
+        cached = AIMessage(
+            content="",
+            tool_calls=[{"name": "multiply", "args": {"a": 2, "b": 3}, "id": "c1"}]
+        )
+        events = [
+            {"event": "on_custom_event", "name": LLM_CACHE_HIT_EVENT, "data": cached},
+            {"event": "on_tool_start", "name": "multiply", "data": {}},
+            {"event": "on_tool_end", "name": "multiply", "data": {"output": "6"}},
+        ]
+
+        sent = await _run_turn(events, sample_user, sample_conversation)
+
+        tool_frames = [frame for frame in sent if frame["type"] in ("tool_start", "tool_complete")]
+        assert [frame["tool_name"] for frame in tool_frames] == ["multiply", "multiply"]
+        assert tool_frames[1]["tool_result"] == "6"
+        assert not [frame for frame in sent if frame["type"] == "token"]
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_coalesced_per_flush_window(self, sample_user, sample_conversation, monkeypatch):
+        """Tokens after the first are joined per STREAM_FLUSH_INTERVAL_MS and flushed before tool events."""
+        # A window far longer than the test, so only the tool event and the end flush
+        monkeypatch.setattr(
+            websocket_handler,
+            "settings",
+            Settings.with_overrides(websocket_handler.settings, stream_flush_interval_ms=60_000)
+        )
+        events = [
+            {"event": "on_chat_model_stream", "name": "model", "data": {"chunk": AIMessageChunk(content=token)}}
+            for token in ["a", "b", "c"]
+        ] + [
+            {"event": "on_tool_start", "name": "multiply", "data": {}},
+            {"event": "on_chat_model_stream", "name": "model", "data": {"chunk": AIMessageChunk(content="d")}},
+            {"event": "on_chat_model_stream", "name": "model", "data": {"chunk": AIMessageChunk(content="e")}},
+        ]
+
+        sent = await _run_turn(events, sample_user, sample_conversation)
+
+        assert [frame["content"] for frame in sent if frame["type"] == "token"] == ["a", "bc", "de"]